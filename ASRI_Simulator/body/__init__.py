@@ -1,18 +1,25 @@
 from .aerodynamics import *
 from .calculator import *
+from .campaign import *
 from .constants import *
 from .fins import *
 from .fixed_step_solver import *
 from .graphics_library import *
 from .gravitation_spherical import *
 from .gravitation_WGS84 import *
+from .kernel import *
 from .missile_datcom import *
 from .monte_carlo import *
 from .monte_carlo_density import *
 from .monte_carlo_plot import *
+from .output_writer import *
+from .output_tables import *
+from .profiler import *
 from .sidedamping import *
+from .solver_statistics import *
 from .thrust_curve_fit import *
 from .thrust_curve_fit_UI import *
+from .trajectory_store import *
 from .transformations import *
 from .wind import *
 from .main import *
\ No newline at end of file
@@ -0,0 +1,206 @@
+import os
+import csv
+import json
+import glob
+import time
+import random as random
+import hashlib
+import traceback
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from body.output_tables import Extensions,WriteTable,ReadTable,TableExists,RemoveTable
+from body.output_writer import Writer
+from body.trajectory_store import trajectory_store
+
+r"""Resumable Monte Carlo campaigns. A campaign is fixed by its manifest (settings, dispersions, seed, number of runs, sampler, solver), kept in Outputs\Campaign together with one completion record per run. Re-running Simulate with the same inputs only computes the runs without a completed record, and each run reseeds the sampler from (seed,run), so a resumed run draws the same dispersions as it would have in one uninterrupted campaign."""
+
+Sampler="monte_carlo.random: truncnorm(0,1/1.1,loc=0,scale=1.1), 20 variates per run, numpy global generator"
+RecordColumns=["Run","State","Status","Seed","Wall","Finished"]
+
+def CampaignWorkbook(Frame,Path,Columns):
+    """Writes a Monte Carlo table atomically (in the PYROPS_OUTPUT format, see output_tables): a crash while writing leaves the previous table intact."""
+    if Path.endswith(".csv"):
+        partial=os.path.splitext(Path)[0]+".partial.csv"
+        Frame.to_csv(partial,columns=Columns,index=False)
+        os.replace(partial,Path)
+    else:
+        WriteTable(Frame,Path,Columns)
+
+def MonteCarloTables(Directory):
+    """Monte Carlo tables in Outputs, named by their .xlsx path whatever format they are stored in; leftover partial files are removed."""
+    tables=set()
+    for Extension in Extensions.values():
+        for path in glob.glob(r'{}\Outputs\Monte Carlo*{}'.format(Directory,Extension)):
+            if path.endswith(".partial"+Extension):
+                os.remove(path)
+            else:
+                tables.add(os.path.splitext(path)[0]+".xlsx")
+    return sorted(tables)
+
+def InputDigests(Directory):
+    """sha256 of every file in Inputs; the campaign is refused if any of them changed."""
+    digests={}
+    for path in sorted(glob.glob(r'{}\Inputs\*'.format(Directory))):
+        if os.path.isfile(path):
+            with open(path,"rb") as file1:
+                digests[os.path.basename(path)]=hashlib.sha256(file1.read()).hexdigest()
+    return digests
+
+class campaign:
+    def __init__(self,Directory,Inputs,MonteCarloInputs,NumberRuns,State,CycleStates,Solver):
+        self.directory=Directory
+        self.folder=r'{}\Outputs\Campaign'.format(Directory)
+        self.manifest_file=r'{}\manifest.json'.format(self.folder)
+        self.records_file=r'{}\runs.csv'.format(self.folder)
+        self.runs=int(NumberRuns)
+        self.initial_state=State
+        self.cycle_states=CycleStates
+        self.seed=None
+        self.records={}
+        self.opened=False
+        """The number of runs is not part of the fingerprint, so a finished campaign can be extended:"""
+        settings={key:value for key,value in Inputs.items() if key not in ("NumberRuns","MonteCarloRun","Directory")}
+        self.definition={"settings":settings,"monte_carlo":dict(MonteCarloInputs),"sampler":Sampler,"solver":Solver,"state":State,"cycle_states":CycleStates,"inputs":InputDigests(Directory)}
+        self.fingerprint=hashlib.sha256(json.dumps(self.definition,sort_keys=True,default=str).encode()).hexdigest()
+
+    def open(self):
+        r"""Resumes the campaign in Outputs\Campaign, or starts a new one. Returns False (and runs nothing) when an unfinished campaign was started with different inputs."""
+        if os.path.isfile(self.manifest_file)==True:
+            with open(self.manifest_file) as file1:
+                manifest=json.load(file1)
+            self.records=self.read_records()
+            completed=len(self.completed())
+            if manifest["fingerprint"]!=self.fingerprint and completed<manifest["runs"]:
+                print("Campaign in {} is unfinished ({} of {} runs completed) and was started with different inputs:".format(self.folder,completed,manifest["runs"]))
+                for key in Changes(manifest["definition"],self.definition):
+                    print("    changed:",key)
+                print("Restore those inputs to resume it, or delete {} to start a new campaign.".format(self.folder))
+                return False
+            if manifest["fingerprint"]==self.fingerprint and completed<self.runs:
+                self.seed=manifest["seed"]
+                self.opened=True
+                self.write_manifest()
+                self.prune()
+                print("Resuming campaign: {} of {} runs completed, seed {}.".format(completed,self.runs,self.seed))
+                return True
+        self.start()
+        return True
+
+    def start(self):
+        """New campaign: clears the previous Monte Carlo outputs and draws a new seed."""
+        for path in MonteCarloTables(self.directory):
+            RemoveTable(path)
+        trajectory_store(self.directory).remove()
+        for path in [r'{}\Outputs\Monte Carlo Map.csv'.format(self.directory),r'{}\Outputs\Solver Statistics.csv'.format(self.directory),self.records_file]:
+            if os.path.isfile(path)==True:
+                os.remove(path)
+        os.makedirs(self.folder,exist_ok=True)
+        self.seed=int(np.random.SeedSequence().entropy)
+        self.records={}
+        self.opened=True
+        self.write_manifest()
+        print("New campaign: {} runs, seed {}.".format(self.runs,self.seed))
+
+    def write_manifest(self):
+        manifest={"fingerprint":self.fingerprint,"seed":self.seed,"runs":self.runs,"created":datetime.now().isoformat(timespec="seconds"),"definition":self.definition}
+        with open(self.manifest_file+".partial","w") as file1:
+            json.dump(manifest,file1,indent=2,default=str)
+        os.replace(self.manifest_file+".partial",self.manifest_file)
+
+    def read_records(self):
+        """Last record of each run; a half-written final line (crash mid-append) is ignored."""
+        records={}
+        if os.path.isfile(self.records_file)==True:
+            with open(self.records_file,newline="") as file1:
+                for row in csv.DictReader(file1):
+                    if row["Finished"] not in (None,""):
+                        records[int(row["Run"])]=row
+        return records
+
+    def completed(self):
+        return [Run for Run,row in self.records.items() if row["Status"]=="completed" and Run<=self.runs]
+
+    def pending(self):
+        """Runs still to compute, in order: never started, interrupted or failed."""
+        completed=set(self.completed())
+        return [Run for Run in range(1,self.runs+1) if Run not in completed]
+
+    def state(self,Run):
+        """Body state of a run; the fixed step four-in-one campaign cycles through states 1 to 4."""
+        if self.cycle_states==True:
+            return (int(self.initial_state)-1+Run-1)%4+1
+        return self.initial_state
+
+    def seed_run(self,Run):
+        """Seeds the global generators used by monte_carlo.random from (campaign seed, run)."""
+        if self.opened==False:
+            return None
+        return SeedRun(self.seed,Run)
+
+    def record(self,Run,State,Status,Seed,Wall):
+        """Appends the run's completion record and forces it to disk."""
+        if self.opened==False:
+            return
+        exist=os.path.isfile(self.records_file)
+        row={"Run":Run,"State":State,"Status":Status,"Seed":Seed,"Wall":Wall,"Finished":datetime.now().isoformat(timespec="seconds")}
+        with open(self.records_file,"a",newline="") as file1:
+            writer=csv.DictWriter(file1,fieldnames=RecordColumns)
+            if exist==False:
+                writer.writeheader()
+            writer.writerow(row)
+            file1.flush()
+            os.fsync(file1.fileno())
+        self.records[Run]={key:str(value) for key,value in row.items()}
+
+    def prune(self):
+        """Drops workbook and solver statistics rows of runs without a completed record (written before a crash), so they are not counted twice."""
+        completed=set(self.completed())
+        for path in MonteCarloTables(self.directory):
+            MonteCarlo=ReadTable(path)
+            if "Run" in MonteCarlo.columns:
+                CampaignWorkbook(MonteCarlo[MonteCarlo["Run"].isin(completed)],path,list(MonteCarlo.columns))
+        MapFile=r'{}\Outputs\Monte Carlo Map.xlsx'.format(self.directory)
+        if TableExists(MapFile)==True:
+            MonteCarlo=ReadTable(MapFile)
+            CampaignWorkbook(MonteCarlo,r'{}\Outputs\Monte Carlo Map.csv'.format(self.directory),list(MonteCarlo.columns))
+        StatisticsFile=r'{}\Outputs\Solver Statistics.csv'.format(self.directory)
+        if os.path.isfile(StatisticsFile)==True:
+            Statistics=pd.read_csv(StatisticsFile)
+            if "Run" in Statistics.columns:
+                CampaignWorkbook(Statistics[Statistics["Run"].isin(completed)],StatisticsFile,list(Statistics.columns))
+
+    def run(self,Run,Simulate):
+        """Runs one campaign member: seeds it, calls Simulate(State) and records the outcome. A failed run is reported and retried on the next resume. The completed record goes through the output writer behind the run's own outputs, so it reaches the disk only after them."""
+        State=self.state(Run)
+        Seed=self.seed_run(Run)
+        Start=time.perf_counter()
+        try:
+            Simulate(State)
+        except Exception:
+            """A failed output write stops the campaign rather than failing every remaining run:"""
+            if self.opened==False or Writer.error is not None:
+                raise
+            traceback.print_exc()
+            print("Run {} failed; it will be repeated when the campaign is resumed.".format(Run))
+            self.record(Run,State,"failed",Seed,round(time.perf_counter()-Start,3))
+            return False
+        Writer.submit(self.record,Run,State,"completed",Seed,round(time.perf_counter()-Start,3))
+        return True
+
+def SeedRun(Seed,Run):
+    """Seeds numpy's and random's global generators for run Run of the campaign seeded Seed; returns the run's seed. The distributed work queue seeds its legacy runs through this too."""
+    seed=int(np.random.SeedSequence([Seed,Run]).generate_state(1)[0])
+    np.random.seed(seed)
+    random.seed(seed)
+    return seed
+
+def Changes(old,new,prefix=""):
+    """Keys of the campaign definition that differ between two manifests."""
+    keys=[]
+    for key in sorted(set(old)|set(new)):
+        if isinstance(old.get(key),dict) and isinstance(new.get(key),dict):
+            keys+=Changes(old[key],new[key],prefix+key+".")
+        elif old.get(key)!=new.get(key):
+            keys.append(prefix+key)
+    return keys
@@ -16,6 +16,62 @@ import scipy.stats as st
 import matplotlib.pyplot as plt
 from scipy.stats import gaussian_kde
 import os
+import heapq
+
+def TrajectoryRead(path):
+    """Loads a viewer trajectory. The solvers write a .npz copy next to each OpenGL*.xlsx; it is used when it is at least as new as the workbook. Otherwise the workbook is read once and the .npz copy is written for the next time."""
+    binary=os.path.splitext(path)[0]+'.npz'
+    if os.path.isfile(binary) and (os.path.isfile(path)==False or os.path.getmtime(binary)>=os.path.getmtime(path)):
+        with np.load(binary) as arrays:
+            return pd.DataFrame({column:arrays[column] for column in arrays.files})
+    Trajectory=pd.read_excel(path,header=0)
+    np.savez(binary,**{column:Trajectory[column].to_numpy(dtype=float) for column in Trajectory.columns})
+    return Trajectory
+
+def TrajectoryImportance(vertices,tolerance,budget=4096):
+    """Douglas-Peucker importance of each vertex: the deviation (metres) at which it is first needed, capped by its parent's so the levels are nested. Splits are taken largest deviation first and stop below the tolerance or after budget splits, which bounds the load time. Returns the importances and the deviation the hierarchy is complete down to."""
+    number=len(vertices)
+    importance=np.zeros(number)
+    importance[0]=np.inf
+    importance[-1]=np.inf
+    queue=[]
+
+    def push(first,last,parent):
+        if last-first<2:
+            return
+        segment=vertices[first+1:last]-vertices[first]
+        chord=vertices[last]-vertices[first]
+        length=np.linalg.norm(chord)
+        if length==0:
+            deviation=np.linalg.norm(segment,axis=1)
+        else:
+            deviation=np.linalg.norm(np.cross(segment,chord),axis=1)/length
+        split=int(np.argmax(deviation))
+        heapq.heappush(queue,(-min(deviation[split],parent),first,last,first+1+split))
+
+    push(0,number-1,np.inf)
+    complete=tolerance
+    splits=0
+    while queue:
+        value,first,last,split=queue[0]
+        if -value<tolerance:
+            break
+        if splits>=budget:
+            complete=-value
+            break
+        heapq.heappop(queue)
+        importance[split]=-value
+        push(first,split,-value)
+        push(split,last,-value)
+        splits+=1
+    return importance,complete
+
+def TrajectoryLevels(vertices,tolerance=0.25,levels=12):
+    """Level-of-detail hierarchy: level 0 keeps every vertex, level k keeps the vertices needed for a deviation of tolerance*2**(k-1) metres (levels finer than the split budget allows are left out). Returns the tolerances and the kept vertex indices for each level."""
+    importance,complete=TrajectoryImportance(vertices,tolerance)
+    tolerances=[0]+[tolerance*2**(level-1) for level in range(1,levels) if tolerance*2**(level-1)>=complete]
+    indices=[np.arange(len(vertices))]+[np.flatnonzero(importance>=value) for value in tolerances[1:]]
+    return tolerances,indices
 
 def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
     scale=scale_user
@@ -78,32 +134,249 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
         texture5 = load_texture(r'body\graphics\paint2.png')
 
         if state==0:
-            Trajectory=pd.read_excel(r'body\OpenGL.xlsx',header=0)
+            Trajectory=TrajectoryRead(r'body\OpenGL.xlsx')
             print('0')
         if state==1:
-            Trajectory=pd.read_excel(r'body\OpenGL1.xlsx',header=0)
+            Trajectory=TrajectoryRead(r'body\OpenGL1.xlsx')
             print('1')
         if state==2:
-            Trajectory=pd.read_excel(r'body\OpenTrajectoryPlot.xlsx',header=0)
+            Trajectory=TrajectoryRead(r'body\OpenTrajectoryPlot.xlsx')
             print('2')
         if state==3:            
-            Trajectory=pd.read_excel(r'body\OpenGL3.xlsx',header=0)
+            Trajectory=TrajectoryRead(r'body\OpenGL3.xlsx')
             print('3')
         if state==4:            
-            Trajectory=pd.read_excel(r'body\OpenGL4.xlsx',header=0)
+            Trajectory=TrajectoryRead(r'body\OpenGL4.xlsx')
             print('4')
 
+
+        """Columns as arrays (per-cell DataFrame access is too slow inside the draw loop):"""
+        Track={column:Trajectory[column].to_numpy(dtype=float) for column in Trajectory.columns}
+        TrackRates=Trajectory.iloc[:,13:16].to_numpy(dtype=float)
+
+        """Retained-mode geometry, compiled once at load (the draw loop only changes transforms, colours and textures):"""
+        GridList=glGenLists(1)
+        glNewList(GridList,GL_COMPILE)
+        glBegin(GL_QUADS)
+
+        Grid1=0
+        while Grid1 < 11:
+            glColor3f(1, 1,1)
+            glVertex3f(Grid1, 0, 0)
+            glColor3f(1, 1, 1)
+            glVertex3f(Grid1, 10, 0)
+            glColor3f(1, 1, 1)
+            glVertex3f(Grid1+0.02, 10, 0)
+            glColor3f(1, 1, 1)
+            glVertex3f(Grid1+0.02,  0, 0)
+
+            glColor3f(1, 1,1)
+            glVertex3f(0, Grid1, 0)
+            glColor3f(1, 1, 1)
+            glVertex3f(10, Grid1, 0)
+            glColor3f(1, 1, 1)
+            glVertex3f(10, Grid1+0.02, 0)
+            glColor3f(1, 1, 1)
+            glVertex3f(0,  Grid1+0.02, 0)
+            Grid1+=1
+
+        Grid2=0
+        while Grid2 < 11:
+            glColor3f(1, 1,1)
+            glVertex3f(Grid2, 0, 0)
+            glColor3f(1, 1, 1)
+            glVertex3f(Grid2, 0, 10)
+            glColor3f(1, 1, 1)
+            glVertex3f(Grid2+0.02, 0, 10)
+            glColor3f(1, 1, 1)
+            glVertex3f(Grid2+0.02,  0, 0)
+            glColor3f(1, 1,1)
+            glVertex3f(0, 0, Grid2)
+            glColor3f(1, 1, 1)
+            glVertex3f(10, 0, Grid2)
+            glColor3f(1, 1, 1)
+            glVertex3f(10, 0, Grid2+0.02)
+            glColor3f(1, 1, 1)
+            glVertex3f(0,  0, Grid2+0.02)
+            Grid2+=1
+
+        Grid3=0
+        while Grid3 < 11:
+            glColor3f(1, 1,1)
+            glVertex3f(0,Grid3, 0)
+            glColor3f(1, 1, 1)
+            glVertex3f(0,Grid3, 10)
+            glColor3f(1, 1, 1)
+            glVertex3f(0,Grid3+0.02, 10)
+            glColor3f(1, 1, 1)
+            glVertex3f(0,Grid3+0.02, 0)
+
+            glColor3f(1, 1,1)
+            glVertex3f(0, 0, Grid3)
+            glColor3f(1, 1, 1)
+            glVertex3f(0,10, Grid3)
+            glColor3f(1, 1, 1)
+            glVertex3f(0,10, Grid3+0.02)
+            glColor3f(1, 1, 1)
+            glVertex3f(0,  0, Grid3+0.02)
+            Grid3+=1
+
+        glEnd()
+        glEndList()
+        MapList1=glGenLists(1)
+        glNewList(MapList1,GL_COMPILE)
+        glBegin(GL_QUADS)
+
+        glTexCoord(0,0)
+        glVertex3f(-0.6*land, -0.97*land,0)
+        glTexCoord(0,1)
+        glVertex3f(-0.6*land, 1.03*land,0)
+        glTexCoord(1,1)
+        glVertex3f(2.4*land, 1.03*land,0)
+        glTexCoord(1,0)
+        glVertex3f(2.4*land, -0.97*land,0)
+
+        glEnd()
+        glEndList()
+        MapList2=glGenLists(1)
+        glNewList(MapList2,GL_COMPILE)
+        glBegin(GL_QUADS)
+        glTexCoord(0,1)
+        glVertex3f(-land, -land,0)
+        glTexCoord(1,1)
+        glVertex3f(-land, land,0)
+        glTexCoord(1,0)
+        glVertex3f(land, land,0)
+        glTexCoord(0,0)
+        glVertex3f(land, -land,0)
+        glEnd()
+        glEndList()
+        MapList3=glGenLists(1)
+        glNewList(MapList3,GL_COMPILE)
+        glBegin(GL_QUADS)
+        glTexCoord(1,0)
+        glVertex3f(-land, -land,0)
+        glTexCoord(0,0)
+        glVertex3f(-land, land,0)
+        glTexCoord(0,1)
+        glVertex3f(land, land,0)
+        glTexCoord(1,1)
+        glVertex3f(land, -land,0)
+        glEnd()
+        glEndList()
+        RocketList1=glGenLists(1)
+        glNewList(RocketList1,GL_COMPILE)
+        glDisable(GL_DEPTH_TEST)
+        glDepthMask(GL_FALSE)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glColor4f(1,1,1,1)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, texture4)
+        qobj = gluNewQuadric()
+        gluQuadricTexture(qobj, GL_TRUE)
+        gluCylinder(qobj,0.087,0.087,4.07,200,200) 
+        gluDeleteQuadric(qobj)      
+        glDisable(GL_TEXTURE_2D)
+        glEnable(GL_DEPTH_TEST)
+        glDisable(GL_BLEND)
+        glDepthMask(GL_TRUE)
+
+        glTranslatef(0,0, 4.07)
+        glColor4f(1,0.5,0,1)
+        glutSolidCone(0.087,0.85,50,50)     
+        glTranslatef(0,0,-3.929-0.123)
+
+        glBegin(GL_QUADS)
+
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0.087,0,0.39)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0.257,0,0.12)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0.257,0,0.087)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0.087,0,0.087)
+
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(-0.087,0,0.39)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(-0.257,0,0.12)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(-0.257,0,0.087)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(-0.087,0,0.087)
+
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0,0.087,0.39)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0,0.257,0.12)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0,0.257,0.087)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0,0.087,0.087)
+
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0,-0.087,0.39)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0,-0.257,0.12)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0,-0.257,0.087)
+        glColor3f(0.5,0.5,0.5)
+        glVertex3f(0,-0.087,0.087)
+
+        glEnd()
+
+        glTranslatef(0,0,-0.15)
+        glEndList()
+        RocketList2=glGenLists(1)
+        glNewList(RocketList2,GL_COMPILE)
+        glDisable(GL_DEPTH_TEST)
+        glDepthMask(GL_FALSE)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glColor4f(1,1,1,1)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, texture5)
+        qobj = gluNewQuadric()
+        gluQuadricTexture(qobj, GL_TRUE)
+        gluCylinder(qobj,0.3,0.3,6.6,200,200) 
+        gluDeleteQuadric(qobj)      
+        glDisable(GL_TEXTURE_2D)
+        glEnable(GL_DEPTH_TEST)
+        glDisable(GL_BLEND)
+        glDepthMask(GL_TRUE)
+
+        glTranslatef(0,0,6.6)
+        glColor4f(1,1,1,1)
+        glutSolidCone(0.3,1.8,50, 50)     
+        glTranslatef(0,0,-5)
+        glEndList()
+
+        """Trajectory uploaded once to vertex buffers, one per level of detail (built from every 'trajectory'-th sample, as plotted before):"""
+        TrajectorySamples=np.arange(0,len(Trajectory),trajectory)
+        TrajectoryVertices=np.c_[np.round(Track['East'],1),np.round(Track['North'],1),-np.round(Track['altitude'],1)][TrajectorySamples].astype(np.float32)
+        TrajectoryTolerances,TrajectoryIndices=TrajectoryLevels(TrajectoryVertices.astype(float))
+        TrajectorySamples=[TrajectorySamples[indices] for indices in TrajectoryIndices]
+        TrajectoryBuffers=glGenBuffers(len(TrajectoryIndices))
+        for level,indices in enumerate(TrajectoryIndices):
+            vertices=np.ascontiguousarray(TrajectoryVertices[indices])
+            glBindBuffer(GL_ARRAY_BUFFER, TrajectoryBuffers[level])
+            glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        """Accumulated zoom of the modelview matrix (glScalef is applied every frame):"""
+        Zoom=1
         
         Trajectory2=0
-        Quantity1=Trajectory.at[0,'time']
+        Quantity1=Track['time'][0]
         timeMotion=Quantity1
-        Quantity2=round(Trajectory.at[0,'North'],1)
-        Quantity3=round(Trajectory.at[0,'East'],1)
-        Quantity4=round(Trajectory.at[0,'altitude'],1)
-        Quantity5=round(Trajectory.at[0,'roll']*180/math.pi,1)
-        Quantity6=-round(Trajectory.at[0,'pitch']*180/math.pi,1)
+        Quantity2=round(Track['North'][0],1)
+        Quantity3=round(Track['East'][0],1)
+        Quantity4=round(Track['altitude'][0],1)
+        Quantity5=round(Track['roll'][0]*180/math.pi,1)
+        Quantity6=-round(Track['pitch'][0]*180/math.pi,1)
         """There was a glitch in old software causing yaw at t0 to be default "vehicle creation" orientation"""
-        Quantity7=45-(round(abs(360-Trajectory.at[1,'yaw']*180/math.pi),1)-45)
+        Quantity7=45-(round(abs(360-Track['yaw'][1]*180/math.pi),1)-45)
         Quantity8=0
         Quantity9=0
         Quantity10=0
@@ -132,34 +405,34 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
             if keypress[pygame.K_c]:
                 if Counter<len(Trajectory)-interval:
                     Counter+=interval
-                    timeMotion=Trajectory.at[Counter,'time']
-                    position1=round(Trajectory.at[Counter,'North'],1)
-                    position2=round(Trajectory.at[Counter,'East'],1)
-                    position3=-round(Trajectory.at[Counter,'altitude'],1)
+                    timeMotion=Track['time'][Counter]
+                    position1=round(Track['North'][Counter],1)
+                    position2=round(Track['East'][Counter],1)
+                    position3=-round(Track['altitude'][Counter],1)
 
                     previous=Counter-1
-                    position11=round(Trajectory.at[Counter,'North'],1)-round(Trajectory.at[previous,'North'],1)
-                    position12=round(Trajectory.at[Counter,'East'],1)-round(Trajectory.at[previous,'East'],1)
-                    position13=round(Trajectory.at[Counter,'altitude'],1)-round(Trajectory.at[previous,'altitude'],1)
+                    position11=round(Track['North'][Counter],1)-round(Track['North'][previous],1)
+                    position12=round(Track['East'][Counter],1)-round(Track['East'][previous],1)
+                    position13=round(Track['altitude'][Counter],1)-round(Track['altitude'][previous],1)
                     
-                    if round(Trajectory.at[Counter,'North'],1)-round(Trajectory.at[previous,'North'],1)>0:
+                    if round(Track['North'][Counter],1)-round(Track['North'][previous],1)>0:
                         Move3-=10*position11
                     else:
                         Move3+=10*position11
 
-                    if round(Trajectory.at[Counter,'East'],1)-round(Trajectory.at[previous,'East'],1)>0:
+                    if round(Track['East'][Counter],1)-round(Track['East'][previous],1)>0:
                         Move1-=10*position12
                     else:
                         Move1+=10*position12
                         
-                    if round(Trajectory.at[Counter,'altitude'],1)-round(Trajectory.at[previous,'altitude'],1)>0:
+                    if round(Track['altitude'][Counter],1)-round(Track['altitude'][previous],1)>0:
                         Move2-=10*position13
                     else:
                         Move2+=10*position13
                     
-                    orientation1=round(Trajectory.at[Counter,'roll']*180/math.pi,1)
-                    orientation2=-round(Trajectory.at[Counter,'pitch']*180/math.pi,1)
-                    orientation3=round(abs(360-Trajectory.at[Counter,'yaw']*180/math.pi),1)
+                    orientation1=round(Track['roll'][Counter]*180/math.pi,1)
+                    orientation2=-round(Track['pitch'][Counter]*180/math.pi,1)
+                    orientation3=round(abs(360-Track['yaw'][Counter]*180/math.pi),1)
                     Quantity1=timeMotion
                     Quantity3=position1
                     Quantity2=position2
@@ -172,13 +445,13 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
                 else:
                     """Upper bound of counter:"""
                     Counter=Trajectory.index[-1]
-                    timeMotion=Trajectory.at[len(Trajectory)-1,'time']
-                    position1=round(Trajectory.at[len(Trajectory)-1,'North'],1)
-                    position2=round(Trajectory.at[len(Trajectory)-1,'East'],1)
-                    position3=-round(Trajectory.at[len(Trajectory)-1,'altitude'],1)
-                    orientation1=round(Trajectory.at[len(Trajectory)-1,'roll']*180/math.pi,1)
-                    orientation2=-round(Trajectory.at[len(Trajectory)-1,'pitch']*180/math.pi,1)
-                    orientation3=round(abs(360-Trajectory.at[len(Trajectory)-1,'yaw']*180/math.pi),1)
+                    timeMotion=Track['time'][len(Trajectory)-1]
+                    position1=round(Track['North'][len(Trajectory)-1],1)
+                    position2=round(Track['East'][len(Trajectory)-1],1)
+                    position3=-round(Track['altitude'][len(Trajectory)-1],1)
+                    orientation1=round(Track['roll'][len(Trajectory)-1]*180/math.pi,1)
+                    orientation2=-round(Track['pitch'][len(Trajectory)-1]*180/math.pi,1)
+                    orientation3=round(abs(360-Track['yaw'][len(Trajectory)-1]*180/math.pi),1)
                     Quantity1=timeMotion
                     Quantity3=position1
                     Quantity2=position2
@@ -192,13 +465,13 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
                 """Lower bound of counter:"""
                 if Counter==Trajectory.index[-1]: 
                     Counter=(math.floor(Counter/interval))*interval
-                    timeMotion=Trajectory.at[Counter,'time']
-                    position1=round(Trajectory.at[Counter,'North'],1)
-                    position2=round(Trajectory.at[Counter,'East'],1)
-                    position3=-round(Trajectory.at[Counter,'altitude'],1)
-                    orientation1=round(Trajectory.at[Counter,'roll']*180/math.pi,1)
-                    orientation2=-round(Trajectory.at[Counter,'pitch']*180/math.pi,1)
-                    orientation3=round(abs(360-Trajectory.at[Counter,'yaw']*180/math.pi),1)
+                    timeMotion=Track['time'][Counter]
+                    position1=round(Track['North'][Counter],1)
+                    position2=round(Track['East'][Counter],1)
+                    position3=-round(Track['altitude'][Counter],1)
+                    orientation1=round(Track['roll'][Counter]*180/math.pi,1)
+                    orientation2=-round(Track['pitch'][Counter]*180/math.pi,1)
+                    orientation3=round(abs(360-Track['yaw'][Counter]*180/math.pi),1)
                     Quantity1=timeMotion
                     Quantity3=position1
                     Quantity2=position2
@@ -208,29 +481,29 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
                     Quantity7=45-(orientation3-45)
                 elif Counter>1:
                     Counter-=interval
-                    timeMotion=Trajectory.at[Counter,'time']
-                    position1=round(Trajectory.at[Counter,'North'],1)
-                    position2=round(Trajectory.at[Counter,'East'],1)
-                    position3=-round(Trajectory.at[Counter,'altitude'],1)
+                    timeMotion=Track['time'][Counter]
+                    position1=round(Track['North'][Counter],1)
+                    position2=round(Track['East'][Counter],1)
+                    position3=-round(Track['altitude'][Counter],1)
 
-                    if round(Trajectory.at[Counter,'North'],1)-round(Trajectory.at[previous,'North'],1)>0:
+                    if round(Track['North'][Counter],1)-round(Track['North'][previous],1)>0:
                         Move3-=10*position11
                     else:
                         Move3+=10*position11
 
-                    if round(Trajectory.at[Counter,'East'],1)-round(Trajectory.at[previous,'East'],1)>0:
+                    if round(Track['East'][Counter],1)-round(Track['East'][previous],1)>0:
                         Move1-=10*position12
                     else:
                         Move1+=10*position12
                         
-                    if round(Trajectory.at[Counter,'altitude'],1)-round(Trajectory.at[previous,'altitude'],1)>0:
+                    if round(Track['altitude'][Counter],1)-round(Track['altitude'][previous],1)>0:
                         Move2-=10*position13
                     else:
                         Move2+=10*position13
                     
-                    orientation1=round(Trajectory.at[Counter,'roll']*180/math.pi,1)
-                    orientation2=-round(Trajectory.at[Counter,'pitch']*180/math.pi,1)
-                    orientation3=round(abs(360-Trajectory.at[Counter,'yaw']*180/math.pi),1)
+                    orientation1=round(Track['roll'][Counter]*180/math.pi,1)
+                    orientation2=-round(Track['pitch'][Counter]*180/math.pi,1)
+                    orientation3=round(abs(360-Track['yaw'][Counter]*180/math.pi),1)
                     Quantity1=timeMotion
                     Quantity3=position1
                     Quantity2=position2
@@ -241,13 +514,13 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
                     """Return to t0:"""
                 elif Counter==1:
                     Counter-=1
-                    timeMotion=Trajectory.at[Counter,'time']
-                    position1=round(Trajectory.at[Counter,'North'],1)
-                    position2=round(Trajectory.at[Counter,'East'],1)
+                    timeMotion=Track['time'][Counter]
+                    position1=round(Track['North'][Counter],1)
+                    position2=round(Track['East'][Counter],1)
                     position3=0.0
-                    orientation1=round(Trajectory.at[Counter,'roll']*180/math.pi,1)
-                    orientation2=-round(Trajectory.at[Counter,'pitch']*180/math.pi,1)
-                    orientation3=round(abs(360-Trajectory.at[1,'yaw']*180/math.pi),1)
+                    orientation1=round(Track['roll'][Counter]*180/math.pi,1)
+                    orientation2=-round(Track['pitch'][Counter]*180/math.pi,1)
+                    orientation3=round(abs(360-Track['yaw'][1]*180/math.pi),1)
                     Quantity1=timeMotion
                     Quantity3=position1
                     Quantity2=position2
@@ -257,13 +530,13 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
                     Quantity7=45-(orientation3-45)
                 elif Counter<1:
                     Counter=Trajectory.index[0]
-                    timeMotion=Trajectory.at[0,'time']
-                    position1=round(Trajectory.at[0,'North'],1)
-                    position2=round(Trajectory.at[0,'East'],1)
+                    timeMotion=Track['time'][0]
+                    position1=round(Track['North'][0],1)
+                    position2=round(Track['East'][0],1)
                     position3=0.0
-                    orientation1=round(Trajectory.at[0,'roll']*180/math.pi,1)
-                    orientation2=-round(Trajectory.at[0,'pitch']*180/math.pi,1)
-                    orientation3=round(abs(360-Trajectory.at[1,'yaw']*180/math.pi),1)
+                    orientation1=round(Track['roll'][0]*180/math.pi,1)
+                    orientation2=-round(Track['pitch'][0]*180/math.pi,1)
+                    orientation3=round(abs(360-Track['yaw'][1]*180/math.pi),1)
                     Quantity1=timeMotion
                     Quantity3=position1
                     Quantity2=position2
@@ -358,6 +631,7 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
 
             gluLookAt(Rotate1,Rotate2,z,0,0,-1,Rotate3,1,0)
             glScalef(ZoomFactor,ZoomFactor,ZoomFactor)
+            Zoom*=ZoomFactor
             glTranslatef(Move1,Move2,Move3)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
@@ -366,71 +640,7 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
             glTranslated(150, 100, 0)
             glRotated(0, 0, 0, 1)
             glScale(200, 200, 200)
-            glBegin(GL_QUADS)
-
-            Grid1=0
-            while Grid1 < 11:
-                glColor3f(1, 1,1)
-                glVertex3f(Grid1, 0, 0)
-                glColor3f(1, 1, 1)
-                glVertex3f(Grid1, 10, 0)
-                glColor3f(1, 1, 1)
-                glVertex3f(Grid1+0.02, 10, 0)
-                glColor3f(1, 1, 1)
-                glVertex3f(Grid1+0.02,  0, 0)
-                
-                glColor3f(1, 1,1)
-                glVertex3f(0, Grid1, 0)
-                glColor3f(1, 1, 1)
-                glVertex3f(10, Grid1, 0)
-                glColor3f(1, 1, 1)
-                glVertex3f(10, Grid1+0.02, 0)
-                glColor3f(1, 1, 1)
-                glVertex3f(0,  Grid1+0.02, 0)
-                Grid1+=1
-
-            Grid2=0
-            while Grid2 < 11:
-                glColor3f(1, 1,1)
-                glVertex3f(Grid2, 0, 0)
-                glColor3f(1, 1, 1)
-                glVertex3f(Grid2, 0, 10)
-                glColor3f(1, 1, 1)
-                glVertex3f(Grid2+0.02, 0, 10)
-                glColor3f(1, 1, 1)
-                glVertex3f(Grid2+0.02,  0, 0)
-                glColor3f(1, 1,1)
-                glVertex3f(0, 0, Grid2)
-                glColor3f(1, 1, 1)
-                glVertex3f(10, 0, Grid2)
-                glColor3f(1, 1, 1)
-                glVertex3f(10, 0, Grid2+0.02)
-                glColor3f(1, 1, 1)
-                glVertex3f(0,  0, Grid2+0.02)
-                Grid2+=1
-
-            Grid3=0
-            while Grid3 < 11:
-                glColor3f(1, 1,1)
-                glVertex3f(0,Grid3, 0)
-                glColor3f(1, 1, 1)
-                glVertex3f(0,Grid3, 10)
-                glColor3f(1, 1, 1)
-                glVertex3f(0,Grid3+0.02, 10)
-                glColor3f(1, 1, 1)
-                glVertex3f(0,Grid3+0.02, 0)
-
-                glColor3f(1, 1,1)
-                glVertex3f(0, 0, Grid3)
-                glColor3f(1, 1, 1)
-                glVertex3f(0,10, Grid3)
-                glColor3f(1, 1, 1)
-                glVertex3f(0,10, Grid3+0.02)
-                glColor3f(1, 1, 1)
-                glVertex3f(0,  0, Grid3+0.02)
-                Grid3+=1
-            
-            glEnd()
+            glCallList(GridList)
             glPopMatrix()
 
             """Fade-Unfade Textures"""      
@@ -447,18 +657,7 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
             glColor4f(1.0,1.0,1.0,1)
             glEnable(GL_TEXTURE_2D)
             glBindTexture(GL_TEXTURE_2D, texture1)
-            glBegin(GL_QUADS)
-
-            glTexCoord(0,0)
-            glVertex3f(-0.6*land, -0.97*land,0)
-            glTexCoord(0,1)
-            glVertex3f(-0.6*land, 1.03*land,0)
-            glTexCoord(1,1)
-            glVertex3f(2.4*land, 1.03*land,0)
-            glTexCoord(1,0)
-            glVertex3f(2.4*land, -0.97*land,0)
-            
-            glEnd()
+            glCallList(MapList1)
             glDisable(GL_TEXTURE_2D)
             glEnable(GL_DEPTH_TEST)
             glDisable(GL_BLEND)
@@ -473,16 +672,7 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
             glEnable(GL_TEXTURE_2D)
             glBindTexture(GL_TEXTURE_2D, texture2)
             glRotated(180, 0, 0, 1)
-            glBegin(GL_QUADS)
-            glTexCoord(0,1)
-            glVertex3f(-land, -land,0)
-            glTexCoord(1,1)
-            glVertex3f(-land, land,0)
-            glTexCoord(1,0)
-            glVertex3f(land, land,0)
-            glTexCoord(0,0)
-            glVertex3f(land, -land,0)
-            glEnd()
+            glCallList(MapList2)
             glPopMatrix()
             glDisable(GL_TEXTURE_2D)
             glEnable(GL_DEPTH_TEST)
@@ -495,13 +685,13 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
             glTranslatef(150, 100, 0)
             glTranslated(Quantity2, Quantity3, Quantity4)
 
-            position1=round(Trajectory.at[len(Trajectory)-1,'North'],1)
-            position2=round(Trajectory.at[len(Trajectory)-1,'East'],1)
-            position3=-round(Trajectory.at[len(Trajectory)-1,'altitude'],1)
+            position1=round(Track['North'][len(Trajectory)-1],1)
+            position2=round(Track['East'][len(Trajectory)-1],1)
+            position3=-round(Track['altitude'][len(Trajectory)-1],1)
 
             glScale(scale, scale, scale)
             if toggle==0:
-                #if Trajectory.at[Counter,'range']==0 or -(Trajectory.at[Counter,'altitude']-Trajectory.at[Counter-1,'altitude'])>0:
+                #if Track['range'][Counter]==0 or -(Track['altitude'][Counter]-Track['altitude'][Counter-1])>0:
                 ParachuteTrajectory1=0
                 ParachuteTrajectory2=0
                 
@@ -509,82 +699,21 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
                 glRotated(90-Quantity6,0,1,0)
                 glRotated(Quantity5, 0, 0, 1)
                 
-                glDisable(GL_DEPTH_TEST)
-                glDepthMask(GL_FALSE)
-                glEnable(GL_BLEND)
-                glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-                glColor4f(1,1,1,1)
-                glEnable(GL_TEXTURE_2D)
-                glBindTexture(GL_TEXTURE_2D, texture4)
-                qobj = gluNewQuadric()
-                gluQuadricTexture(qobj, GL_TRUE)
-                gluCylinder(qobj,0.087,0.087,4.07,200,200) 
-                gluDeleteQuadric(qobj)      
-                glDisable(GL_TEXTURE_2D)
-                glEnable(GL_DEPTH_TEST)
-                glDisable(GL_BLEND)
-                glDepthMask(GL_TRUE)
-
-                glTranslatef(0,0, 4.07)
-                glColor4f(1,0.5,0,1)
-                glutSolidCone(0.087,0.85,50,50)     
-                glTranslatef(0,0,-3.929-0.123)
-
-                glBegin(GL_QUADS)
-
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0.087,0,0.39)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0.257,0,0.12)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0.257,0,0.087)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0.087,0,0.087)
-
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(-0.087,0,0.39)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(-0.257,0,0.12)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(-0.257,0,0.087)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(-0.087,0,0.087)
-
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0,0.087,0.39)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0,0.257,0.12)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0,0.257,0.087)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0,0.087,0.087)
-
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0,-0.087,0.39)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0,-0.257,0.12)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0,-0.257,0.087)
-                glColor3f(0.5,0.5,0.5)
-                glVertex3f(0,-0.087,0.087)
-                
-                glEnd()
-
-                glTranslatef(0,0,-0.15)
+                glCallList(RocketList1)
 
 ##                else:
 ##                    previous=Counter-10
 ##                    ParachuteTrajectory1=0
 ##                    #ParachuteTrajectory2=-180
 ##
-##                    range1=math.sqrt(round(Trajectory.at[Counter,'North'],1)**2+round(Trajectory.at[Counter,'East'],1)**2)
-##                    range2=math.sqrt(round(Trajectory.at[previous,'North'],1)**2+round(Trajectory.at[previous,'East'],1)**2)
-##                    altitude1=round(Trajectory.at[Counter,'altitude'],1)-round(Trajectory.at[previous,'altitude'],1)
+##                    range1=math.sqrt(round(Track['North'][Counter],1)**2+round(Track['East'][Counter],1)**2)
+##                    range2=math.sqrt(round(Track['North'][previous],1)**2+round(Track['East'][previous],1)**2)
+##                    altitude1=round(Track['altitude'][Counter],1)-round(Track['altitude'][previous],1)
 ##                    
 ##                    ParachuteTrajectory2=180-math.atan2((range1-range2),(altitude1))*(180/math.pi)
 ##                    
-##                    #ParachuteTrajectory1=math.atan((Trajectory.at[Counter,'East']-Trajectory.at[previous,'East'])/(Trajectory.at[Counter,'North']-Trajectory.at[previous,'North']))*(180/math.pi)
-##                    #ParachuteTrajectory1=-100+90#-90+math.atan((Trajectory.at[Counter,'North']-Trajectory.at[previous,'North'])/(Trajectory.at[Counter,'East']-Trajectory.at[previous,'East']))*(180/math.pi)
+##                    #ParachuteTrajectory1=math.atan((Track['East'][Counter]-Track['East'][previous])/(Track['North'][Counter]-Track['North'][previous]))*(180/math.pi)
+##                    #ParachuteTrajectory1=-100+90#-90+math.atan((Track['North'][Counter]-Track['North'][previous])/(Track['East'][Counter]-Track['East'][previous]))*(180/math.pi)
 ##                    
 ##                    glRotated(ParachuteTrajectory1,0,0,1)
 ##                    glRotated(ParachuteTrajectory2,0,1,0)
@@ -634,26 +763,7 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
                     
             if toggle==1:
 
-                glDisable(GL_DEPTH_TEST)
-                glDepthMask(GL_FALSE)
-                glEnable(GL_BLEND)
-                glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-                glColor4f(1,1,1,1)
-                glEnable(GL_TEXTURE_2D)
-                glBindTexture(GL_TEXTURE_2D, texture5)
-                qobj = gluNewQuadric()
-                gluQuadricTexture(qobj, GL_TRUE)
-                gluCylinder(qobj,0.3,0.3,6.6,200,200) 
-                gluDeleteQuadric(qobj)      
-                glDisable(GL_TEXTURE_2D)
-                glEnable(GL_DEPTH_TEST)
-                glDisable(GL_BLEND)
-                glDepthMask(GL_TRUE)
-
-                glTranslatef(0,0,6.6)
-                glColor4f(1,1,1,1)
-                glutSolidCone(0.3,1.8,50, 50)     
-                glTranslatef(0,0,-5)
+                glCallList(RocketList2)
 
             glPopMatrix()
             
@@ -667,16 +777,7 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
             """DARKMODE: disable this:"""
             glEnable(GL_TEXTURE_2D)
             glBindTexture(GL_TEXTURE_2D, texture3)
-            glBegin(GL_QUADS)
-            glTexCoord(1,0)
-            glVertex3f(-land, -land,0)
-            glTexCoord(0,0)
-            glVertex3f(-land, land,0)
-            glTexCoord(0,1)
-            glVertex3f(land, land,0)
-            glTexCoord(1,1)
-            glVertex3f(land, -land,0)
-            glEnd()
+            glCallList(MapList3)
             """DARKMODE: enable this:"""
             glDisable(GL_TEXTURE_2D)
             """DARKMODE: disable this:"""
@@ -685,45 +786,45 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
             glDepthMask(GL_TRUE)
             glPopMatrix()
             
-            """Trajectory:"""
+            """Trajectory (one draw call per frame, over the samples up to the current one). The coarsest level whose deviation stays under half a pixel is drawn, so the cost does not grow with trajectory length:"""
             plot=1
             if plot==1:
-                TrajectoryPlot=0
-                while TrajectoryPlot<Counter:
-                    glPushMatrix()
-                    glTranslated(150, 100, 0)
-                    glTranslated(round(Trajectory.at[TrajectoryPlot,'East'],1),round(Trajectory.at[TrajectoryPlot,'North'],1),-round(Trajectory.at[TrajectoryPlot,'altitude'],1))
-
-                    glColor3f(1,1,1)
-                    """OpenGL Trajectory Line Thickness"""
-                    glPointSize(2.0)
-                    glBegin(GL_POINTS)
-                    glVertex2f(0.0, 0.0)
-                    glEnd()
-
-                    glPopMatrix()
-                    TrajectoryPlot+=trajectory
+                level=0
+                while level<len(TrajectoryTolerances)-1 and TrajectoryTolerances[level+1]<=0.5/max(abs(Zoom),1e-9):
+                    level+=1
+                glPushMatrix()
+                glTranslated(150, 100, 0)
+                glColor3f(1,1,1)
+                """OpenGL Trajectory Line Thickness"""
+                glLineWidth(2.0)
+                glBindBuffer(GL_ARRAY_BUFFER, TrajectoryBuffers[level])
+                glEnableClientState(GL_VERTEX_ARRAY)
+                glVertexPointer(3, GL_FLOAT, 0, None)
+                glDrawArrays(GL_LINE_STRIP, 0, int(np.searchsorted(TrajectorySamples[level], Counter)))
+                glDisableClientState(GL_VERTEX_ARRAY)
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
+                glPopMatrix()
                    
             else:
                 pass
 
             """Text:"""
             if Counter>=1:
-                Quantity8=round(Trajectory.at[Counter,'range'],3)
-                Quantity9=round(Trajectory.at[Counter,'velocity'],3)
-                Quantity10=round(Trajectory.at[Counter,'acceleration'],3)
-                Quantity11=round(Trajectory.at[Counter,'alpha'],3)
-                Quantity12=round(Trajectory.at[Counter,'beta'],3)
-                Quantity13=round(Trajectory.at[Counter,'aoa'],3)
+                Quantity8=round(Track['range'][Counter],3)
+                Quantity9=round(Track['velocity'][Counter],3)
+                Quantity10=round(Track['acceleration'][Counter],3)
+                Quantity11=round(Track['alpha'][Counter],3)
+                Quantity12=round(Track['beta'][Counter],3)
+                Quantity13=round(Track['aoa'][Counter],3)
                 """Note: be wary of NaN in trajectory input file"""
 
             else:
-                Quantity8=round(Trajectory.at[Counter,'range'],3)
-                Quantity9=round(Trajectory.at[Counter,'velocity'],3)
-                Quantity10=round(Trajectory.at[Counter,'acceleration'],3)
-                Quantity11=round(Trajectory.at[1,'alpha'],3)
-                Quantity12=round(Trajectory.at[1,'beta'],3)
-                Quantity13=round(Trajectory.at[1,'aoa'],3)
+                Quantity8=round(Track['range'][Counter],3)
+                Quantity9=round(Track['velocity'][Counter],3)
+                Quantity10=round(Track['acceleration'][Counter],3)
+                Quantity11=round(Track['alpha'][1],3)
+                Quantity12=round(Track['beta'][1],3)
+                Quantity13=round(Track['aoa'][1],3)
             
             text(30, 310, (1, 1, 1), "Time:")
             string=str(round(timeMotion,4))
@@ -758,7 +859,7 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
                 string=str((round(Quantity7-90,3)))
                 text(130, 130, (1, 1, 1), string)
             else:
-                HeadingParachute=45-(round(abs(360-Trajectory.at[1,'yaw']*180/math.pi),1)-45)-90
+                HeadingParachute=45-(round(abs(360-Track['yaw'][1]*180/math.pi),1)-45)-90
                 string=str(HeadingParachute)
                 text(130, 130, (1, 1, 1), string)
 
@@ -811,15 +912,15 @@ def GraphicsLibrary(scale_user,interval,trajectory,view,land,state):
             text(795, 50, (1, 1, 1), string)
 
             text(30, 20, (1, 1, 1), "Roll Rate:")
-            string=str(round(Trajectory.iloc[Counter,13],3))
+            string=str(round(TrackRates[Counter,0],3))
             text(150, 20, (1, 1, 1), string)
 
             text(340, 20, (1, 1, 1), "Pitch Rate:")
-            string=str(round(Trajectory.iloc[Counter,14],3))
+            string=str(round(TrackRates[Counter,1],3))
             text(470, 20, (1, 1, 1), string)
 
             text(630, 20, (1, 1, 1), "Yaw Rate:")
-            string=str(round(Trajectory.iloc[Counter,15],3))
+            string=str(round(TrackRates[Counter,2],3))
             text(795, 20, (1, 1, 1), string)
             
             pygame.display.flip()
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from .constants import *
 
 def EarthRadiusFunction(latitude):
@@ -14,3 +15,44 @@ def EllipseGravity(height,latitude):
     latitude=abs(latitude)
     g0=-9.7803*(1.0+(0.0053*(math.sin(latitude))**2)-(0.0000058*(math.sin(2.0*latitude))**2))
     return(g0*((EarthRadiusFunction(latitude))**2/(EarthRadiusFunction(latitude)+height)**2))
+
+class ellipse_gravity:
+    """WGS84 radius and gravity expanded to first order about the launch latitude. Latitude only drifts by a fraction of a degree over a flight, so the RHS avoids the tan/sqrt of EarthRadiusFunction. The expansion is re-centred if the latitude moves further than the tolerance (radians)."""
+    def __init__(self,latitude,tolerance=math.radians(1.0)):
+        self.tolerance=tolerance
+        self.centre(latitude)
+
+    def centre(self,latitude):
+        self.latitude=abs(latitude)
+        sinl=math.sin(self.latitude)
+        cosl=math.cos(self.latitude)
+        denom=(earthb*cosl)**2+(eartha*sinl)**2
+        self.radi=eartha*earthb/math.sqrt(denom)
+        self.dradi=-eartha*earthb*((eartha**2)-(earthb**2))*sinl*cosl/(denom**1.5)
+        self.g0=-9.7803*(1.0+(0.0053*sinl**2)-(0.0000058*(math.sin(2.0*self.latitude))**2))
+        self.dg0=-9.7803*((0.0053*math.sin(2.0*self.latitude))-(0.0000116*math.sin(4.0*self.latitude)))
+
+    def radius(self,latitude):
+        dlat=abs(latitude)-self.latitude
+        if abs(dlat)>self.tolerance:
+            self.centre(latitude)
+            dlat=0
+        return self.radi+(self.dradi*dlat)
+
+    def gravity(self,height,latitude):
+        """Same sign convention as EllipseGravity (negative is downward)."""
+        radi=self.radius(latitude)
+        g0=self.g0+(self.dg0*(abs(latitude)-self.latitude))
+        return g0*(radi**2/(radi+height)**2)
+
+    @staticmethod
+    def radius_array(latitude):
+        latitude=np.abs(np.asarray(latitude,dtype=float))
+        return eartha*earthb/np.sqrt((earthb*np.cos(latitude))**2+(eartha*np.sin(latitude))**2)
+
+    @staticmethod
+    def gravity_array(height,latitude):
+        latitude=np.abs(np.asarray(latitude,dtype=float))
+        radi=ellipse_gravity.radius_array(latitude)
+        g0=-9.7803*(1.0+(0.0053*np.sin(latitude)**2)-(0.0000058*np.sin(2.0*latitude)**2))
+        return g0*(radi**2/(radi+np.asarray(height,dtype=float))**2)
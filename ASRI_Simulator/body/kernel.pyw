@@ -0,0 +1,758 @@
+import math
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.spatial.transform import Rotation
+from scipy.integrate import solve_ivp
+from body.fins import fins
+from body.sidedamping import SideDamping
+from body.gravitation_WGS84 import ellipse_gravity
+from body.profiler import profiler
+
+"""Right hand side of the 6DOF flight model shared by main (solve_ivp) and the fixed step solver, and the rigid body helpers it is built from: frame transforms, translational and angular accelerations, coordinate and quaternion rates, Euler angles."""
+"""derivatives(t,y,params,tables,phase) only works on its arguments: the per-run constants and dispersions (Parameters), the input tables read once per run (Tables) and the flight phase (Phase), which the solvers advance through events and breakpoints (Transition). Several runs can therefore be integrated side by side in one process."""
+
+"""Earth rotation (rad/s), gravitational constant and mass, air properties:"""
+omgt=7.292e-5
+EarthGravitationalConstant=6.67428e-11
+EarthMass=5.9736e24
+gamma=1.4
+Rair=287.0
+
+"""Attitude held while the body is solved as a point mass (parachute descent, separated nosecone or booster, tumbling rocket):"""
+LockedQuaternion=np.array([-0.7071,0,-0.7071,0],dtype=float)
+
+"""A profiler that times nothing, for callers that do not pass HotPath:"""
+Quiet=profiler(False)
+
+"""Columns of Outputs\\Simulation.xlsx, in the order of the rows returned by derivatives(...,Output=True):"""
+OutputColumns=["step_number","time (s)","altitude (m)","mass (kg)","MOI_xx","MOI_yy","MOI_zz","position_kinematic_North (m)","position_kinematic_East (m)","position_kinematic_Down (m)","velocity_kinematic_North (m/s)","velocity_kinematic_East (m/s)","velocity_kinematic_Down (m/s)","acceleration_kinematic_North (m/s2)","acceleration_kinematic_East (m/s2)","acceleration_kinematic_Down (m/s2)","position_angular_roll (rad)","position_angular_pitch (rad)","position_angular_yaw (rad)","velocity_angular_roll (rad/s)","velocity_angular_pitch (rad/s)","velocity_angular_yaw (rad/s)","acceleration_angular_roll (rad/s2)","acceleration_angular_pitch (rad/s2)","acceleration_angular_yaw (rad/s2)","air_speed (m/s)","speed_of_sound (m/s)","mach_number","centre-of-gravity (m)","centre-of-pressure (m)","stability_margin (calibres)","angle_of_attack (rad)","angle_of_sideslip (rad)","total_angle_of_attack (rad)","CD","CL","CC","air_density (kg/m3)","air_pressure (Pa)","aerodynamic_forces_body[0] (N)","aerodynamic_forces_body[1] (N)","aerodynamic_forces_body[2] (N)","aerodynamic_moments_body[0] (Nm)","aerodynamic_moments_body[1] (Nm)","aerodynamic_moments_body[2] (Nm)","wind_magnitude (m/s)","wind_bearing (deg clockwise)","wind_relative_velocity (m/s)","thrust_magnitude (N)","acceleration_gravity (m/s2)","latitude (deg)","longitude (deg)","pitch_damping_coefficient","yaw_damping_coefficient","momentum_thrust (N)","aerodynamic_roll_angle (rad)","roll_moment (Nm)","parachute_drag_acceleration,North (m/s2)","parachute_drag_acceleration,East (m/s2)","parachute_drag_acceleration,Down (m/s2)","reference_area (m2)","dynamic_pressure (Pa)","exit_pressure (Pa)","CN","Thruster","list5","list6"]
+
+def TransformBO(vector,panga):
+    """transform_frame.transformBO with a zero offset: earth-fixed (NED) vector to the body frame."""
+    transform=np.array([0,0,0],dtype=float)
+    transform[0]=(vector[0]*( (math.cos(panga[1])*math.cos(panga[2]) )))-(vector[1]*( (math.cos(panga[1])*math.sin(panga[2]) ) ))+(vector[2]*math.sin(panga[1] ))
+    transform[1]=(vector[0]*( (math.sin(panga[0])*math.sin(panga[1])*math.cos(panga[2]))+(math.cos(panga[0])*math.sin(panga[2]))))+(vector[1]*(-(math.sin(panga[0])*math.sin(panga[1])*math.sin(panga[2]))+(math.cos(panga[0])*math.cos(panga[2]))))-(vector[2]*math.sin(panga[0])*math.cos(panga[1]))
+    transform[2]=(vector[0]*(-(math.cos(panga[0])*math.sin(panga[1])*math.cos(panga[2]))+(math.sin(panga[0])*math.sin(panga[2]))))+(vector[1]*( (math.cos(panga[0])*math.sin(panga[1])*math.sin(panga[2]))+(math.sin(panga[0])*math.cos(panga[2]))))+(vector[2]*math.cos(panga[0])*math.cos(panga[1]))
+    return transform
+
+def TransformOB(vector,panga):
+    """transform_frame.transformOB with a zero offset: body frame vector to the earth-fixed (NED) frame."""
+    transform=np.array([0,0,0],dtype=float)
+    transform[0]=(vector[0]*( math.cos(panga[2])*math.cos(panga[1]))+vector[1]*( math.sin(panga[2])*math.cos(panga[0])+math.cos(panga[2])*math.sin(panga[1])*math.sin(panga[0]))+vector[2]*( math.sin(panga[2])*math.sin(panga[0])-math.cos(panga[2])*math.sin(panga[1])*math.cos(panga[0]) ))
+    transform[1]=(vector[0]*(-math.sin(panga[2])*math.cos(panga[1]))+vector[1]*( math.cos(panga[2])*math.cos(panga[0])-math.sin(panga[2])*math.sin(panga[1])*math.sin(panga[0]))+vector[2]*( math.cos(panga[2])*math.sin(panga[0])+math.sin(panga[2])*math.sin(panga[1])*math.cos(panga[0]) ))
+    transform[2]=(vector[0]*( math.sin(panga[1]) )+vector[1]*(-math.cos(panga[1])*math.sin(panga[0]) )+vector[2]*( math.cos(panga[1])*math.cos(panga[0]) ))
+    return transform
+
+def TranslationalAcceleration(acceleration,vgeoa,latitude,toth,omgt,gr):
+    """Earth-fixed acceleration from the specific force already rotated to the NED frame: curvature and Coriolis/centripetal terms of the rotating spherical earth, plus gravity (downward positive)."""
+    dA=acceleration[0]
+    dB=acceleration[1]
+    dC=acceleration[2]
+    dA-=(1/toth)*(-(vgeoa[0]*vgeoa[2])+(vgeoa[1]*vgeoa[1]*math.tan(latitude)))
+    dB-=(1/toth)*(-(vgeoa[1]*vgeoa[2])-(vgeoa[0]*vgeoa[1]*math.tan(latitude)))
+    dC-=(1/toth)*(vgeoa[0]*vgeoa[0]+vgeoa[1]*vgeoa[1])
+    dA-=omgt*((2*vgeoa[1]*math.sin(latitude))+(omgt*toth*math.sin(latitude)*math.cos(latitude)))
+    dB-=omgt*2*(-(vgeoa[2]*math.cos(latitude))-(vgeoa[0]*math.sin(latitude)))
+    dC-=omgt*((2*vgeoa[1]*math.cos(latitude))+(omgt*toth*math.cos(latitude)*math.cos(latitude)))
+    dC+=gr
+    return np.array([dA,dB,dC],dtype=float)
+
+def EarthRate(omgt,latitude,panga):
+    """Rotation rate of the earth at the current latitude, expressed in the body frame."""
+    omgtt=np.array([omgt*math.cos(latitude),0,-omgt*math.sin(latitude)],dtype=float)
+    return TransformBO(omgtt,panga)
+
+def AngularAcceleration(omega,Cmom,inertia,omegt):
+    """Euler's rigid body equations with products of inertia and the earth rate omegt. inertia=(A,B,C,D,E,F): principal moments and the negated products of inertia, as in HYROPS."""
+    A,B,C,D,E,F=inertia
+    DDD,EEE,FFF=omega[0],omega[1],omega[2]
+    J=((FFF*EEE)*(B-C))+(E*DDD*EEE)-(F*FFF*DDD)+(D*((EEE*EEE)-(FFF*FFF)))+Cmom[0]
+    K=((FFF*DDD)*(C-A))+(F*FFF*EEE)-(D*DDD*EEE)+(E*((FFF*FFF)-(DDD*DDD)))+Cmom[1]
+    L=((DDD*EEE)*(A-B))+(D*DDD*FFF)-(E*FFF*EEE)+(F*((DDD*DDD)-(EEE*EEE)))+Cmom[2]
+    J-=(A*((FFF*omegt[1])-(EEE*omegt[2])))+((C-B)*((EEE*omegt[2])+(FFF*omegt[1])+(omegt[2]*omegt[1])))
+    K-=(B*((DDD*omegt[2])-(FFF*omegt[0])))+((A-C)*((DDD*omegt[2])+(FFF*omegt[0])+(omegt[2]*omegt[0])))
+    L-=(C*((EEE*omegt[0])-(DDD*omegt[1])))+((B-A)*((EEE*omegt[0])+(DDD*omegt[1])+(omegt[0]*omegt[1])))
+    J-=2*((omegt[0]*((F*FFF)-(E*EEE)))+(D*((FFF*omegt[2])-(EEE*omegt[1]))))
+    K-=2*((omegt[1]*((D*DDD)-(F*FFF)))+(E*((FFF*omegt[2])-(EEE*omegt[1]))))
+    L-=2*((omegt[2]*((E*EEE)-(D*DDD)))+(F*((FFF*omegt[2])-(EEE*omegt[1]))))
+    J-=(D*((omegt[2]*omegt[2])-(omegt[1]*omegt[1])))+(F*omegt[2]*omegt[0])-(E*omegt[1]*omegt[0])
+    K-=(E*((omegt[0]*omegt[0])-(omegt[2]*omegt[2])))+(D*omegt[0]*omegt[1])-(F*omegt[2]*omegt[1])
+    L-=(F*((omegt[1]*omegt[1])-(omegt[0]*omegt[0])))+(E*omegt[1]*omegt[2])-(D*omegt[0]*omegt[2])
+
+    D0=(A*B*C)-(2*D*E*F)-((A*D*D)+(B*E*E)+(C*F*F))
+    D1=(J*((B*C)-(D*D)))+(K*((F*C)+(E*D)))+(L*((F*D)+(B*E)))
+    D2=(J*((F*C)+(D*E)))+(K*((A*C)-(E*E)))+(L*((A*D)+(E*F)))
+    D3=(J*((F*D)+(B*E)))+(K*((A*D)+(E*F)))+(L*((A*B)-(F*F)))
+    return np.array([D1/D0,D2/D0,D3/D0],dtype=float)
+
+def CoordinateRates(vgeoa,latitude,toth):
+    """Rates of change of latitude and longitude (radians per second) over a sphere of radius toth."""
+    dG=vgeoa[0]/toth
+    dH=vgeoa[1]/(toth*math.cos(latitude))
+    return dG,dH
+
+def QuaternionRates(qanga,omega):
+    """Quaternion kinematics with the HYROPS orthonormality correction that pulls |q| back to one."""
+    ortherr=1-((qanga[0]*qanga[0])+(qanga[1]*qanga[1])+(qanga[2]*qanga[2])+(qanga[3]*qanga[3]))
+    dqana=np.array([0,0,0,0],dtype=float)
+    dqana[0]=0.5*(-(omega[0]*qanga[1])-(omega[1]*qanga[2])-(omega[2]*qanga[3]))
+    dqana[1]=0.5*( (omega[0]*qanga[0])+(omega[2]*qanga[2])-(omega[1]*qanga[3]))
+    dqana[2]=0.5*( (omega[1]*qanga[0])-(omega[2]*qanga[1])+(omega[0]*qanga[3]))
+    dqana[3]=0.5*( (omega[2]*qanga[0])+(omega[1]*qanga[1])-(omega[0]*qanga[2]))
+    dqana[0]+=qanga[0]*0.5*ortherr
+    dqana[1]+=qanga[1]*0.5*ortherr
+    dqana[2]+=qanga[2]*0.5*ortherr
+    dqana[3]+=qanga[3]*0.5*ortherr
+    return dqana
+
+def EulerAngles(qanga,panga):
+    """Roll, elevation and azimuth from the quaternion. Components that cannot be resolved (numerator and denominator both zero, elevation out of domain) keep their value from panga, which is not modified."""
+    panga=np.array([panga[0],panga[1],panga[2]],dtype=float)
+    numer=2*((qanga[1]*qanga[2])+(qanga[0]*qanga[3]))
+    denom=(qanga[0]*qanga[0])+(qanga[1]*qanga[1])-(qanga[2]*qanga[2])-(qanga[3]*qanga[3])
+    if numer>=0 and denom>0:
+        panga[2]=math.atan(numer/denom)
+    if numer<=0 and denom<0:
+        panga[2]=math.atan(abs(numer)/abs(denom))+math.pi
+    if numer>=0 and denom<0:
+        panga[2]=math.pi-math.atan(abs(numer)/abs(denom))
+    if numer<=0 and denom>0:
+        panga[2]=2*math.pi-math.atan(abs(numer)/abs(denom))
+
+    numer=2*((qanga[2]*qanga[3])+(qanga[0]*qanga[1]))
+    denom=(qanga[0]*qanga[0])-(qanga[1]*qanga[1])-(qanga[2]*qanga[2])+(qanga[3]*qanga[3])
+    if numer>=0 and denom>0:
+        panga[0]=math.atan(numer/denom)
+    if numer<=0 and denom<0:
+        panga[0]=math.atan(abs(numer)/abs(denom))+math.pi
+    if numer>=0 and denom<0:
+        panga[0]=math.pi-math.atan(abs(numer)/abs(denom))
+    if numer<=0 and denom>0:
+        panga[0]=2*math.pi-math.atan(abs(numer)/abs(denom))
+
+    elevf=-2*((qanga[1]*qanga[3])-(qanga[0]*qanga[2]))
+    if elevf>=-1 and elevf<=1:
+        panga[1]=math.asin(elevf)
+
+    while(panga[0]>(2*math.pi)):
+        panga[0]-=2*math.pi
+    while(panga[0]<(-2*math.pi)):
+        panga[0]+=2*math.pi
+    while(panga[1]>(2*math.pi)):
+        panga[1]-=2*math.pi
+    while(panga[1]<(-2*math.pi)):
+        panga[1]+=2*math.pi
+    while panga[2]>2*math.pi:
+        panga[2]-=2*math.pi
+    while panga[2]<(-2*math.pi):
+        panga[2]+=2*math.pi
+    return panga
+
+def Quaternion(panga):
+    """Orientation quaternion of the roll, elevation and azimuth angles (radians)."""
+    return np.array([math.cos(panga[2]/2)*math.cos(panga[1]/2)*math.cos(panga[0]/2)+math.sin(panga[2]/2)*math.sin(panga[1]/2)*math.sin(panga[0]/2),
+                     math.cos(panga[2]/2)*math.cos(panga[1]/2)*math.sin(panga[0]/2)-math.sin(panga[2]/2)*math.sin(panga[1]/2)*math.cos(panga[0]/2),
+                     math.cos(panga[2]/2)*math.sin(panga[1]/2)*math.cos(panga[0]/2)+math.sin(panga[2]/2)*math.cos(panga[1]/2)*math.sin(panga[0]/2),
+                     math.sin(panga[2]/2)*math.cos(panga[1]/2)*math.cos(panga[0]/2)-math.cos(panga[2]/2)*math.sin(panga[1]/2)*math.sin(panga[0]/2)],dtype=float)
+
+def Draw(size,random_state=None):
+    """Uniform-like samples in [-1,1] from the truncated normal used by HYROPS' NormalRandom()."""
+    return (-1)+stats.truncnorm.rvs((0)/1.1,(1)/1.1,loc=0,scale=1.1,size=size,random_state=random_state)*(1-(-1))
+
+def Parameters(input_values,BodyState,outputs,random_state=None):
+    """Constants of one run: the launcher inputs, the body state, the Monte Carlo dispersions (monte_carlo.outputs(), zero when Monte Carlo is off) and the quantities derived from them once instead of on every evaluation. The random draws HYROPS makes on every step (turbulence, parachute moment variation) are drawn here, one per TimeSize interval, so the right hand side returns the same value every time it is called at the same t."""
+    params=dict(input_values)
+    params["BodyState"]=BodyState
+    MonteCarlo=np.array(outputs,dtype=float)
+    if input_values["CheckMonteCarloUI"]==0:
+        MonteCarlo=np.zeros_like(MonteCarlo)
+    params["MonteCarlo"]=MonteCarlo
+    params["BurnTime"]=input_values["TimeBurn"]+MonteCarlo[5]
+    """New feature: user can now specify the position of the launch lug on the rocket body (referred to the rocket boat tail)"""
+    params["RailLength"]=input_values["LaunchRailLength"]-input_values["Lug"]
+    params["Latitude"]=np.array([input_values["LaunchLatitude"]*(math.pi/180),input_values["LaunchLongitude"]*(math.pi/180)],dtype=float)
+
+    """pang[1]*=MC_ALT and pang[2]*=MC_AZI in HYROPS. In HYROPS: Elevation is called "Altitud" """
+    params["Attitude"]=np.array([0,(-input_values["LaunchElevation"]-MonteCarlo[0])*(math.pi/180),(input_values["LaunchAzimuth"]+MonteCarlo[1])*(math.pi/180)],dtype=float)
+    params["Quaternion"]=Quaternion(params["Attitude"])
+    inpa=EulerAngles(params["Quaternion"],np.zeros(3))
+    raild=Rotation.from_euler('xyz',[0,-inpa[1]*(180/math.pi),0],degrees=True).apply(np.array([1,0,0],dtype=float))
+    raild=Rotation.from_euler('xyz',[0,0,-inpa[2]*(180/math.pi)],degrees=True).apply(raild)
+    params["Rail"]=raild/np.linalg.norm(raild)
+
+    """thrustv RotateY(MC_TM) and RotateX(MC_TRA) in HYROPS:"""
+    thrust_vector=Rotation.from_euler('xyz',[0,MonteCarlo[3],0],degrees=True).apply(np.array([1,0,0],dtype=float))
+    params["ThrustVector"]=Rotation.from_euler('xyz',[0,0,MonteCarlo[2]],degrees=True).apply(thrust_vector)
+
+    Samples=int(input_values["TimeMax"]/input_values["TimeSize"])+2
+    params["Turbulence"]=np.zeros(Samples)
+    if input_values["CheckTurbulence"]==True:
+        params["Turbulence"]=Draw(Samples,random_state)
+    params["Variation"]=np.zeros(Samples)
+    if input_values["CheckMonteCarloUI"]==1:
+        params["Variation"]=Draw(Samples,random_state)
+
+    params["Body"]=[input_values["NoseRadius"],input_values["NoseLength"],input_values["FinRootChord"],input_values["FinTipChord"],input_values["FinSweep"],input_values["FinSpan"],input_values["FinLocation"]]
+    params["Fins"]=[input_values["FinRootChord"],input_values["FinTipChord"],input_values["FinSweep"],input_values["FinSpan"],input_values["FinLocation"],input_values["FinSpanRoot"],input_values["FinCantAngle"],input_values["CheckRollControl"],input_values["RollControlTimeInitial"],input_values["RollControlTimeFinal"],input_values["RollControlFrequency"],input_values["RollControlLower"],input_values["RollControlUpper"],input_values["RollControlForce"]]
+    return params
+
+def Tables(input_values,aerodynamic_tables,aerodynamic_tables_nose,aerodynamic_tables_booster,thrust_curve,wind_vector):
+    """Input tables of one run, read once: atmosphere, mass properties, thrust curves, side damping segments, aerodynamic lookups, wind profile and the WGS84 gravity expansion about the launch site."""
+    Directory=input_values["Directory"]
+    df_atmosphere=pd.read_excel(r'{}\inputs\atmosphere_data.xlsx'.format(Directory),header=None)
+    df_mass=pd.read_excel(r'{}\inputs\mass_properties.xlsx'.format(Directory),header=0)
+    df_thrust_hybrid=pd.read_excel(r'{}\inputs\thrust_curve_hybrid.xlsx'.format(Directory),header=0)
+    df_thrust_liquid=pd.read_excel(r'{}\inputs\thrust_curve_liquid.xlsx'.format(Directory),header=0)
+    dfSideDamping=pd.read_excel(r'{}\inputs\side_damping.xlsx'.format(Directory),header=0,engine='openpyxl')
+    tables={"Aerodynamics":aerodynamic_tables,"Nose":aerodynamic_tables_nose,"Booster":aerodynamic_tables_booster,
+            "Atmosphere":tuple(df_atmosphere.iloc[:,column].to_numpy(dtype=float) for column in range(4)),
+            "Mass":tuple(df_mass.iloc[:,column].to_numpy(dtype=float) for column in range(6)),
+            "Hybrid":tuple(df_thrust_hybrid.iloc[:,column].to_numpy(dtype=float) for column in range(3)),
+            "Liquid":(np.flip(df_thrust_liquid.iloc[:,0].to_numpy(dtype=float)),np.flip(df_thrust_liquid.iloc[:,1].to_numpy(dtype=float))),
+            "SideDamping":[float(dfSideDamping.at[row,"Segment Radius (m)"]) for row in range(8)]+[float(dfSideDamping.at[row,"Segment Length (m)"]) for row in range(8)],
+            "Wind":(wind_vector.altitude_array,wind_vector.magnitude1_array,wind_vector.magnitude2_array),
+            "Gravity":ellipse_gravity(input_values["LaunchLatitude"]*(math.pi/180),tolerance=math.inf),
+            "Thrust":None,"Staging":None}
+    if input_values["CheckThrust"]==True:
+        tables["Thrust"]=thrust_curve.polynomial()
+    if input_values["CheckStaging"]==True:
+        df_thrust_staging=pd.read_excel(r'{}\inputs\thrust_curve_staging.xlsx'.format(Directory),header=0)
+        tables["Staging"]=tuple(df_thrust_staging.iloc[:,column].to_numpy(dtype=float) for column in range(3))
+    return tables
+
+def Phase():
+    """Flight phase of a run: apogee time (1e10 until it is reached), the point mass (3DOF) lock, ground impact and the breakpoints already passed."""
+    return {"Apogee":1e10,"Solve3DOF":False,"Completed":False,"Passed":set()}
+
+def InitialState(params):
+    """NED velocity, body rates, latitude/longitude offsets, quaternion and NED position on the launch rail:"""
+    return np.concatenate([np.zeros(8),params["Quaternion"],np.zeros(3)])
+
+def Sample(samples,t,params):
+    return samples[min(max(int(t/params["TimeSize"]),0),len(samples)-1)]
+
+def derivatives(t,y,params,tables,phase,Output=False,Profile=Quiet):
+    """State derivatives at t of y=[v North,East,Down, roll,pitch,yaw rate, latitude,longitude offset, quaternion w,x,y,z, position North,East,Down]. With Output=True the output row of OutputColumns is returned as well."""
+    Profile.start()
+    BodyState=params["BodyState"]
+    MonteCarlo=params["MonteCarlo"]
+    Check4in1=params["Check4in1"]==True
+    TimeApogee=phase["Apogee"]
+    TimeSeparation=TimeApogee+params["StageDelay"]
+    TimeDeployment=TimeSeparation+params["DrogueDelay"]
+    State=BodyState
+    if params["CheckStaging"]==True and t>params["StageTime"]+params["StageDelay"]:
+        State=5
+    Deployed=State==2 and t>TimeDeployment
+    Separated=(State==3 or State==4) and t>TimeSeparation
+    Locked=phase["Solve3DOF"]==True or Separated
+    Finless=(State==2 or State==3) and t>TimeApogee
+
+    AAA,BBB,CCC=y[0],y[1],y[2]
+    GGG,HHH=y[6],y[7]
+    omega=np.array([y[3],y[4],y[5]],dtype=float)
+    qanga=np.array([y[8],y[9],y[10],y[11]],dtype=float)
+    pgeoa=np.array([y[12],y[13],y[14]],dtype=float)
+    if Locked==True:
+        omega=np.zeros(3)
+        qanga=LockedQuaternion
+    panga=EulerAngles(qanga,params["Attitude"])
+
+    """Vehicle translational motion constrained as it is supported by the launch gantry (or ground) for a maximum of the first 0.5 seconds of the launch."""
+    if t<0.5 and CCC>0:
+        AAA,BBB,CCC=0,0,0
+    vgeoa=np.array([AAA,BBB,CCC],dtype=float)
+
+    """Altitude variable not in HYROPS. In HYROPS: Elevation is called "Altitud" """
+    alti=params["LaunchAltitude"]-pgeoa[2]
+    height=alti
+    Altitude,Temperature,Pressure,Density=tables["Atmosphere"]
+    pres=float(np.interp(height,Altitude,Pressure))
+    rho=float(np.interp(height,Altitude,Density))
+    SpeedOfSound=math.sqrt(gamma*Rair*float(np.interp(height,Altitude,Temperature)))
+    Profile.lap("state")
+
+    """Wind at the current height. vwnda*=MC_WINDM and vwnda RotateZ(MC_WINDD) in HYROPS:"""
+    WindAltitude,WindNorth,WindEast=tables["Wind"]
+    wind_magnitude_1=float(np.interp(height,WindAltitude,WindNorth))
+    wind_magnitude_2=float(np.interp(height,WindAltitude,WindEast))
+    WindBearing=math.atan2(wind_magnitude_2,wind_magnitude_1)
+    WindMagnitude=math.sqrt(wind_magnitude_1*wind_magnitude_1+wind_magnitude_2*wind_magnitude_2)*(1+(MonteCarlo[6]/100))
+    wind_magnitude_1*=1+(MonteCarlo[6]/100)
+    wind_magnitude_2*=1+(MonteCarlo[6]/100)
+    WindDirection=MonteCarlo[7]
+    if Check4in1==True and t>TimeSeparation:
+        WindDirection+=MonteCarlo[19]
+    WindDirection*=math.pi/180
+    vwnda=np.array([wind_magnitude_1*math.cos(WindDirection)-wind_magnitude_2*math.sin(WindDirection),wind_magnitude_1*math.sin(WindDirection)+wind_magnitude_2*math.cos(WindDirection),0],dtype=float)
+    if params["CheckTurbulence"]==True:
+        vwnda[2]+=Sample(params["Turbulence"],t,params)
+
+    """The below line has been adjusted to use the equation contained in Boiffier, "The Dynamics of Flight". Boiffier: "Vk=Vw+Va". "Vk=Va-Vw" in line 5044 in simulatex.h in the HYROPS code."""
+    vaera=vgeoa-vwnda
+    """Once the recovery configuration is flying and the body climbs, the wind is no longer applied to the air velocity:"""
+    Recovery=(Deployed==True and pgeoa[2]>-params["ParachuteDelay"]) or Separated==True or (State==1 and t>TimeSeparation and phase["Solve3DOF"]==True)
+    if Recovery==True and CCC<0:
+        vaera=vgeoa
+    RelativeVelocityWind=vgeoa-vaera
+    Va2=vaera[0]*vaera[0]+vaera[1]*vaera[1]+vaera[2]*vaera[2]
+    Profile.lap("wind")
+
+    """Aerodynamic angle of attack (see HYROPS key for variable names):"""
+    gama=0
+    xsia=0
+    alpa=0
+    if(Va2>0):
+        gama=math.asin(vaera[2]/math.sqrt(Va2))
+        quant2=vaera[0]/(math.sqrt(Va2)*math.cos(gama))
+        if quant2>=-1 and quant2<=1:
+            xsia=math.acos(quant2)
+        if(vaera[1]>0):
+            xsia=(2*math.pi)-xsia
+
+    a11pa=(math.cos(xsia)*math.cos(gama)*math.cos(panga[1])*math.cos(panga[2]))+(math.sin(xsia)*math.cos(gama)*math.sin(panga[2])*math.cos(panga[1]))+(math.sin(gama)*math.sin(panga[1]))
+    a12pa=(math.cos(xsia)*math.cos(gama)*((math.sin(panga[1])*math.sin(panga[0])*math.cos(panga[2]))-(math.sin(panga[2])*math.cos(panga[0]))))+(math.sin(xsia)*math.cos(gama)*((math.sin(panga[1])*math.sin(panga[0])*math.sin(panga[2]))+(math.cos(panga[2])*math.cos(panga[0]))))-(math.sin(gama)*math.cos(panga[1])*math.sin(panga[0]))
+    a13pa=(math.cos(xsia)*math.cos(gama)*((math.cos(panga[2])*math.sin(panga[1])*math.cos(panga[0]))+(math.sin(panga[0])*math.sin(panga[2]))))+(math.sin(xsia)*math.cos(gama)*((math.sin(panga[1])*math.cos(panga[0])*math.sin(panga[2]))-(math.sin(panga[0])*math.cos(panga[2]))))-(math.sin(gama)*math.cos(panga[1])*math.cos(panga[0]))
+
+    beta=math.asin(min(max(a12pa,-1),1))
+    if(math.cos(beta)!=0):
+        quant2=a13pa/math.cos(beta)
+        if((quant2>=-1) and (quant2<=1)):
+            alpa=math.asin(quant2)
+            if(a11pa<0):
+                if(alpa>0):
+                    alpa=math.pi-alpa
+                if(alpa<0):
+                    alpa=-math.pi-alpa
+
+    """Air velocity in the body frame, rotated by beta about z and by -alpha about y:"""
+    VaB=math.sqrt(Va2)*np.array([math.cos(beta)*math.cos(alpa),math.sin(beta),math.cos(beta)*math.sin(alpa)],dtype=float)
+    taoa=0
+    if Va2>0:
+        taoa=math.asin(min(math.sqrt((VaB[1]*VaB[1])+(VaB[2]*VaB[2]))/math.sqrt(Va2),1))
+
+    phip=0
+    if abs(VaB[2])>0:
+        phip=math.atan(abs(VaB[1])/abs(VaB[2]))
+        if((VaB[1]>=0) and (VaB[2]<0)):
+            phip=math.pi-phip
+        if((VaB[1]<=0) and (VaB[2]<0)):
+            phip=math.pi+phip
+        if((VaB[1]<=0) and (VaB[2]>0)):
+            phip=(2*math.pi)-phip
+    if(VaB[2]==0):
+        if(VaB[1]>0):
+            phip=math.pi*0.5
+        if(VaB[1]<0):
+            phip=math.pi*1.5
+
+    AirSpeed=math.sqrt(Va2)
+    mach=AirSpeed/SpeedOfSound
+    taoaeq=abs(taoa*(180/math.pi))
+    Profile.lap("transforms")
+
+    """Mass properties, replaced by those of the separated body after apogee:"""
+    Time,Mass,Ixx,Iyy,Izz,Cog=tables["Mass"]
+    cog=float(np.interp(t,Time,Cog))
+    mass=float(np.interp(t,Time,Mass))
+    ixx=float(np.interp(t,Time,Ixx))
+    iyy=float(np.interp(t,Time,Iyy))
+    izz=float(np.interp(t,Time,Izz))
+    if t>=TimeApogee and Check4in1==True:
+        if (BodyState==2 or BodyState==3) and ((State==2 and t>TimeDeployment) or State==3) and taoaeq<=15:
+            mass=params["NoseMass"]
+            cog=params["NoseCOMx"]
+            ixx=params["NoseMOIx"]
+            iyy=params["NoseMOIy"]
+            izz=params["NoseMOIz"]
+            if State==2:
+                """0.980164 kg parachute mass:"""
+                mass+=0.980164
+        if BodyState==4:
+            mass=params["BoosterMass"]
+            cog=params["BoosterCOMx"]
+            ixx=params["BoosterMOIx"]
+            iyy=params["BoosterMOIy"]
+            izz=params["BoosterMOIz"]
+
+    """PyROPS gravity convention: downward is positive:"""
+    latitude=params["Latitude"][0]+GGG
+    if params["CheckEarthModelWGS"]==0:
+        EarthRadius=6378000
+        gr=(EarthGravitationalConstant*EarthMass)/((EarthRadius+alti)**2)
+    else:
+        EarthRadius=tables["Gravity"].radius(latitude)
+        gr=-tables["Gravity"].gravity(-pgeoa[2],latitude)
+    toth=EarthRadius+alti
+    Profile.lap("gravity")
+
+    """Thrust. time*=MC_THRFAC and thrust*MC_THRMAG in HYROPS:"""
+    NozzleExitArea=params["NozzleExitArea"]
+    thrust=0
+    MomentumThrust=0
+    ExitPressure=pres
+    if t<params["BurnTime"]:
+        if params["CheckThrust"]==True:
+            """Approximating the momentum thrust. Using n-th degree thrust curve polynomial specified by user:"""
+            MomentumThrust=float(tables["Thrust"](t))
+            ExitPressure=float(np.interp(t,tables["Hybrid"][0],tables["Hybrid"][2]))
+            thrust=MomentumThrust+(ExitPressure-pres)*NozzleExitArea
+        elif params["ThrustHybrid"]==True:
+            MomentumThrust=float(np.interp(t,tables["Hybrid"][0],tables["Hybrid"][1]))
+            ExitPressure=float(np.interp(t,tables["Hybrid"][0],tables["Hybrid"][2]))
+            thrust=MomentumThrust+(ExitPressure-pres)*NozzleExitArea
+        else:
+            thrust=float(np.interp(pres,tables["Liquid"][0],tables["Liquid"][1]))
+            ExitPressure=0
+        thrust+=thrust*MonteCarlo[4]/100
+    elif State==5:
+        StagingTime,StagingThrust,StagingPressure=tables["Staging"]
+        MomentumThrust=float(np.interp(t,StagingTime,StagingThrust))
+        if params["CheckThrust"]==True:
+            MomentumThrust=float(tables["Thrust"](t))
+        ExitPressure=float(np.interp(t,StagingTime,StagingPressure))
+        thrust=MomentumThrust+(ExitPressure-pres)*NozzleExitArea
+        thrust+=thrust*MonteCarlo[4]/100
+    thrustv=thrust*params["ThrustVector"]
+    ThrustMagnitude=float(np.linalg.norm(thrustv))
+    Profile.lap("thrust")
+
+    """Aerodynamic coefficients. The lookup tables cover total angles of attack up to MaxTAOA:"""
+    RocketLength=params["RocketBodyLength"]
+    if taoaeq<=4:
+        RASAero=tables["Aerodynamics"].lookup(mach,abs(taoa))
+    elif taoaeq<=params["MaxTAOA"]:
+        RASAero=tables["Aerodynamics"].lookup15(mach,abs(taoa))
+    else:
+        RASAero=tables["Aerodynamics"].lookup15(mach,params["MaxTAOA"]*(math.pi/180))
+    CA=float(RASAero[0])
+    CN=float(RASAero[1])
+    cop=float(RocketLength-RASAero[2])
+    if phase["Solve3DOF"]==True:
+        CA,CN,cop=0,0,0
+
+    """Modelling body state aerodynamics post-separation:"""
+    rbod=params["RocketBodyRadius"]
+    if t>=TimeApogee and Check4in1==True:
+        if State==2 and t>TimeDeployment:
+            """CN=0.4*taoa*10.0 and a 1 metre moment arm (Xc=1.0) once the parachute is deployed, as in HYROPS simulatex.h:"""
+            CA=0
+            CN=4*taoa
+            cop=cog-1
+            rbod=params["ParachuteDiameter"]/2
+            if pgeoa[2]<=-(params["ParachuteDelay"]):
+                rbod=params["DrogueDiameter"]/2
+        if State==3 and t>TimeSeparation:
+            CA=0
+            CN=0
+            cop=float(params["NoseLength"]-tables["Nose"].lookup15(mach,15*math.pi/180)[2])
+            rbod=params["NoseRadius"]
+        if State==4 and t>TimeSeparation:
+            CA=0
+            CN=0
+            cop=float(RocketLength-(params["NoseLength"]-2*params["NoseRadius"])-tables["Booster"].lookup15(mach,15*math.pi/180)[2])
+            rbod=params["RocketBodyRadius"]
+    Schar=math.pi*rbod*rbod
+
+    """Clin[0]*=MC_DRAG, Clin[2]*=MC_LIFT and cop*=MC_CP in HYROPS, except for the finless bodies of a 4-in-1 simulation after separation:"""
+    if not (Check4in1==True and t>TimeSeparation and Finless==True):
+        CA*=1+(MonteCarlo[8]/100)
+        CN*=1+(MonteCarlo[9]/100)
+        cop*=1+(MonteCarlo[11]/100)
+
+    StabilityMargin=(cog-cop)/(2*rbod)
+
+    """Linear aerodynamic coefficients:"""
+    Ccof=np.array([-CA,CN*math.sin(phip),CN*math.cos(phip)],dtype=float)
+    Profile.lap("aerodynamics")
+
+    """Side damping coefficients:"""
+    Segments=tables["SideDamping"]
+    if t>TimeSeparation and Finless==True:
+        Segments=[params["NoseRadius"],0,0,0,0,0,0,0,params["NoseLength"],0,0,0,0,0,0,0]
+    damping=SideDamping(omega[1],omega[2],cog,Segments,params["Body"],Schar,Va2)
+    pitdamp=damping[0]
+    yawdamp=damping[1]
+    Profile.lap("side damping")
+
+    """Fins and roll control. cant*=MC_FINCANT in HYROPS:"""
+    Spin=not ((t>TimeSeparation and Finless==True) or phase["Solve3DOF"]==True)
+    Thruster=False
+    Cmom=np.array([0,0,0],dtype=float)
+    if Va2>0 and Spin==True:
+        Fins=fins(mach,taoa,phip,params["Fins"],Va2,omega[0],Schar,MonteCarlo[12],params["TimeSize"],rbod,Thruster,t)
+        Cmom[0]=Fins[1]*Va2*0.5*rho*Schar
+        Cmom[0]+=((Ccof[1]*params["SolidWorksCOMz"])+(Ccof[2]*params["SolidWorksCOMy"]))*Va2*0.5*rho*Schar
+        Cmom[0]+=(params["SolidWorksCOMy"]*thrustv[2])+(params["SolidWorksCOMz"]*thrustv[1])
+        Ccof[0]-=Fins[0]
+        Cmom[0]+=Fins[2]
+        Thruster=Fins[3]
+    Profile.lap("fins")
+
+    """marm*=MC_MOM in HYROPS; under the parachute the moment arm varies by up to 1% on every step:"""
+    marm=(cog-cop)*(1+(MonteCarlo[10]/100))
+    if State==2 and t>TimeDeployment:
+        marm=(cog-cop)*(1+Sample(params["Variation"],t,params)/100)
+    if(omega[1]<0):
+        pitdamp*=-1
+    if(omega[2]<0):
+        yawdamp*=-1
+
+    Cmom[1]=-0.5*rho*Schar*Va2*((Ccof[2]*marm)+(Ccof[0]*params["SolidWorksCOMz"])-pitdamp)
+    Cmom[2]= 0.5*rho*Schar*Va2*((Ccof[1]*marm)+(Ccof[0]*params["SolidWorksCOMy"])-yawdamp)
+    Cmom[1]+=(params["SolidWorksCOMz"]*thrustv[0])+(cog*thrustv[2])
+    Cmom[2]+=(params["SolidWorksCOMy"]*thrustv[0])+(cog*thrustv[1])
+
+    Area=Schar
+    if Check4in1==True and Deployed==True:
+        Area=math.pi*params["NoseRadius"]*params["NoseRadius"]
+    fgeoa=((0.5*rho*Area*Ccof*Va2)+thrustv)/mass
+
+    KinematicAcceleration=TransformOB(fgeoa,panga)
+    dA,dB,dC=TranslationalAcceleration(KinematicAcceleration,vgeoa,GGG,toth,omgt,gr)
+
+    """Accelerations due to the drag of the parachute, the separated bodies or the tumbling rocket:"""
+    DragCD=None
+    if Deployed==True:
+        DragCD=params["ParachuteCD"]
+        if pgeoa[2]<=-(params["ParachuteDelay"]):
+            DragCD=params["DrogueCD"]
+    if State==3 and t>TimeSeparation:
+        DragCD=params["NoseCD"]
+    if State==4 and t>TimeSeparation:
+        DragCD=params["BoosterCD"]
+    if State==1 and t>TimeSeparation and phase["Solve3DOF"]==True:
+        DragCD=params["CombinedCD"]
+    DragAcceleration=np.array([0,0,0],dtype=float)
+    KinematicVelocityMagnitude=math.sqrt(AAA*AAA+BBB*BBB+CCC*CCC)
+    if DragCD is not None and KinematicVelocityMagnitude>0:
+        DragAccelerationMagnitude=0.5*rho*Schar*Va2*DragCD/mass
+        DragAcceleration[0]=-np.sign(AAA)*DragAccelerationMagnitude*(abs(AAA)/KinematicVelocityMagnitude)
+        DragAcceleration[1]=-np.sign(BBB)*DragAccelerationMagnitude*(abs(BBB)/KinematicVelocityMagnitude)
+        DragAcceleration[2]=-np.sign(gr)*DragAccelerationMagnitude*(abs(CCC)/KinematicVelocityMagnitude)
+        dA+=DragAcceleration[0]
+        dB+=DragAcceleration[1]
+        dC+=DragAcceleration[2]
+
+    """On the rail the acceleration is projected on the rail direction and the body does not rotate. HYROPS: ageoa=raild*(dA*raild[0]+dB*raild[1]+dC*raild[2])"""
+    rates=omega
+    if np.linalg.norm(pgeoa)<params["RailLength"]:
+        MAGNITUDE=math.sqrt(dA*dA+dB*dB+dC*dC)
+        dA,dB,dC=MAGNITUDE*params["Rail"]
+        dD,dE,dF=0,0,0
+        rates=np.zeros(3)
+    else:
+        omegt=EarthRate(omgt,GGG,panga)
+        dD,dE,dF=AngularAcceleration(omega,Cmom,(ixx,iyy,izz,0,0,0),omegt)
+    Profile.lap("dynamics")
+
+    dG,dH=CoordinateRates(vgeoa,GGG,toth)
+    dI,dJ,dK,dL=QuaternionRates(qanga,rates)
+    if Locked==True:
+        dD,dE,dF=0,0,0
+        dI,dJ,dK,dL=0,0,0,0
+        Cmom=np.array([0,0,0],dtype=float)
+
+    """Position: under the parachute the body also drifts with the wind:"""
+    dP=np.array(vgeoa,dtype=float)
+    if Deployed==True:
+        dP+=vwnda
+    dy=np.array([dA,dB,dC,dD,dE,dF,dG,dH,dI,dJ,dK,dL,dP[0],dP[1],dP[2]],dtype=float)
+    Profile.lap("transforms")
+    if Output==False:
+        return dy
+
+    DynamicPressure=0.5*rho*Schar*(Va2)
+    row=[0,t,alti,mass,ixx,iyy,izz,pgeoa[0],pgeoa[1],pgeoa[2],AAA,BBB,CCC,dA,dB,dC,panga[0],panga[1],panga[2],omega[0],omega[1],omega[2],dD,dE,dF,
+         AirSpeed,SpeedOfSound,mach,cog,cop,StabilityMargin,alpa,beta,taoa,Ccof[0],Ccof[1],Ccof[2],rho,pres,Ccof[0]*0.5*rho*Schar*Va2,Ccof[1]*0.5*rho*Schar*Va2,Ccof[2]*0.5*rho*Schar*Va2,
+         Cmom[0],Cmom[1],Cmom[2],WindMagnitude,WindBearing*180/math.pi,RelativeVelocityWind,ThrustMagnitude,gr,(params["Latitude"][0]+GGG)*(180/math.pi),(params["Latitude"][1]+HHH)*(180/math.pi),
+         pitdamp,yawdamp,MomentumThrust,phip,Cmom[0],DragAcceleration[0],DragAcceleration[1],DragAcceleration[2],Schar,DynamicPressure,ExitPressure,CN,Thruster,0,0]
+    Profile.lap("output")
+    return dy,row
+
+def Row(t,y,params,tables,phase):
+    """Output row at (t,y), as a dict of OutputColumns."""
+    return dict(zip(OutputColumns,derivatives(t,y,params,tables,phase,Output=True)[1]))
+
+def OffRail(y,params):
+    return math.sqrt(y[12]*y[12]+y[13]*y[13]+y[14]*y[14])>=params["RailLength"]
+
+def FlightPhase(t,y,params,phase):
+    """Rail, powered, coast or descent, as numbered by solver_monitor.PhaseIndex:"""
+    if t>=phase["Apogee"]:
+        return 3
+    if t>=params["BurnTime"]:
+        return 2
+    if OffRail(y,params):
+        return 1
+    return 0
+
+def Apogee(t,y,params,tables,phase):
+    """Kinematic velocity (Down) turning positive once off the rail, until the apogee is found:"""
+    if phase["Apogee"]<1e10 or not OffRail(y,params):
+        return -1.0
+    return y[2]
+Apogee.direction=1
+
+def Impact(t,y,params,tables,phase):
+    """Inertial position one metre below the earth radius:"""
+    return params["LaunchAltitude"]-y[14]+1.0
+Impact.direction=-1
+
+def Lock(t,y,params,tables,phase):
+    """Total angle of attack above the limit of the parachute (25 degrees) or, for the complete rocket after apogee, MaxTAOA; the body is then solved as a point mass."""
+    if phase["Solve3DOF"]==True:
+        return -1.0
+    Limit=None
+    if params["BodyState"]==2 and t>phase["Apogee"]+params["StageDelay"]+params["DrogueDelay"]:
+        Limit=25
+    if params["BodyState"]==1 and t>phase["Apogee"]+params["StageDelay"]:
+        Limit=params["MaxTAOA"]
+    if Limit is None:
+        return -1.0
+    return abs(derivatives(t,y,params,tables,phase,Output=True)[1][33]*(180/math.pi))-Limit
+Lock.direction=1
+
+"""Events of the flight phase, located by the solvers; each one is handled by Transition with its name:"""
+Events={"apogee":Apogee,"impact":Impact,"lock":Lock}
+
+def Located(params,tables,phase):
+    """The events of one run as terminal solve_ivp events, in the order of Events:"""
+    located=[]
+    for event in Events.values():
+        def located_event(t,y,event=event):
+            return event(t,y,params,tables,phase)
+        located_event.terminal=True
+        located_event.direction=event.direction
+        located.append(located_event)
+    return located
+
+def Breakpoints(params,phase):
+    """Times at which the right hand side is discontinuous. The solvers stop there so that no step straddles one."""
+    Times={"pad":0.5,"burnout":params["BurnTime"],"separation":phase["Apogee"]+params["StageDelay"],"deployment":phase["Apogee"]+params["StageDelay"]+params["DrogueDelay"]}
+    if params["CheckStaging"]==True:
+        Times["staging"]=params["StageTime"]+params["StageDelay"]
+    return {Name:Time for Name,Time in Times.items() if Name not in phase["Passed"]}
+
+def Transition(Name,t,y,params,phase):
+    """Advances the flight phase at an event or breakpoint and returns the state to continue from."""
+    y=np.array(y,dtype=float)
+    MonteCarlo=params["MonteCarlo"]
+    if Name in Events:
+        if Name=="apogee":
+            phase["Apogee"]=t
+            print("Apogee {0:.3f}m".format(params["LaunchAltitude"]-y[14])," reached at T{0:.3f} seconds".format(t))
+        if Name=="impact":
+            phase["Completed"]=True
+            print("Message: Inertial Position < Earth Radius")
+        if Name=="lock":
+            phase["Solve3DOF"]=True
+            y[3:6]=0
+            y[8:12]=LockedQuaternion
+        return y
+    phase["Passed"].add(Name)
+    if Name=="separation" and (params["BodyState"]==3 or params["BodyState"]==4):
+        y[3:6]=0
+        y[8:12]=LockedQuaternion
+    """Uncertainties during separation at apogee:"""
+    if Name=="deployment" and params["BodyState"]!=1 and params["CheckTurbulence"]==True:
+        print("Apogee Elevation Variation (deg):",round(abs(-MonteCarlo[17]),3))
+        print("Apogee Azimuth Variation (deg):",round(MonteCarlo[18],3))
+        print("Apogee Wind Direction Variation (deg):",round(MonteCarlo[19],3))
+        finpa=EulerAngles(y[8:12],np.zeros(3))
+        y[8:12]=Quaternion(np.array([finpa[0],finpa[1]-MonteCarlo[17]*(math.pi/180),finpa[2]+MonteCarlo[18]*(math.pi/180)],dtype=float))
+    return y
+
+def Segments(rhs,params,tables,phase,Ascent,Descent=None):
+    """Integrates a run with solve_ivp from breakpoint to breakpoint, stopping at the events as well, so no step straddles a discontinuity of the right hand side. Ascent and Descent are (method, solve_ivp options); the descent settings take over at apogee when given. Yields (method, solution) of every segment before the event that ended it is handled, so its output rows still see the phase they were solved in."""
+    t=0.0
+    y=InitialState(params)
+    while t<params["TimeMax"] and phase["Completed"]==False:
+        for Name,Time in sorted(Breakpoints(params,phase).items(),key=lambda item:item[1]):
+            if Time<=t:
+                y=Transition(Name,t,y,params,phase)
+        if Lock(t,y,params,tables,phase)>0:
+            y=Transition("lock",t,y,params,phase)
+        TimeEnd=min([params["TimeMax"]]+[Time for Time in Breakpoints(params,phase).values() if Time>t])
+        Method,Options=Ascent
+        if Descent is not None and t>=phase["Apogee"]:
+            Method,Options=Descent
+        Options=dict(Options)
+        if "first_step" in Options:
+            Options["first_step"]=min(Options["first_step"],TimeEnd-t)
+        solution=solve_ivp(rhs,(t,TimeEnd),y,method=Method,dense_output=True,events=Located(params,tables,phase),**Options)
+        yield Method,solution
+        t=solution.t[-1]
+        y=solution.y[:,-1]
+        if solution.status==1:
+            for Name,Times in zip(Events,solution.t_events):
+                if len(Times)>0:
+                    y=Transition(Name,t,y,params,phase)
+        elif solution.status==-1:
+            print(solution.message)
+            return
+
+class messages:
+    """Console messages of a run, printed once each from the recorded output rows (the right hand side itself prints nothing)."""
+    def __init__(self,params,phase):
+        self.params=params
+        self.phase=phase
+        self.shown=set()
+        self.second=-1
+
+    def once(self,name,text,*args):
+        if name not in self.shown:
+            self.shown.add(name)
+            print(text,*args)
+
+    def __call__(self,row):
+        params=self.params
+        t=row["time (s)"]
+        pgeoa=np.array([row["position_kinematic_North (m)"],row["position_kinematic_East (m)"],row["position_kinematic_Down (m)"]],dtype=float)
+        taoaeq=abs(row["total_angle_of_attack (rad)"]*(180/math.pi))
+        TimeSeparation=self.phase["Apogee"]+params["StageDelay"]
+        if np.linalg.norm(pgeoa)>=params["RailLength"]:
+            self.once("rail",'Rocket left the launch gantry at T{0:.3f} seconds.'.format(t))
+            if taoaeq>4:
+                self.once("aoa","Angle of attack:",taoaeq,"degrees exceeds 4 degrees at T{0:.3f} seconds. Flight conditions are not favorable.".format(t))
+            if taoaeq>15:
+                self.once("aoa2","Angle of attack:",taoaeq,"degrees exceeds 15 degrees at T{0:.3f} seconds. Flight conditions are not favorable.".format(t))
+        if t>=params["BurnTime"]:
+            self.once("burnout","Burnout at T{0:.3f} seconds.".format(params["BurnTime"]))
+        if row["stability_margin (calibres)"]<0:
+            self.once("stability","StabilityMargin: {0:.3f}".format(row["stability_margin (calibres)"])+" calibres less than zero at T{000:.3f} seconds. Flight is unstable.".format(t))
+        if params["BodyState"]==2 and t>TimeSeparation+params["DrogueDelay"]:
+            if pgeoa[2]<=-(params["ParachuteDelay"]):
+                self.once("drogue",'Drogue parachute deployment at T{0:.3f} seconds.'.format(t))
+            else:
+                self.once("main",'Main parachute deployment at T{0:.3f} seconds.'.format(t))
+        if params["BodyState"]==3 and t>TimeSeparation:
+            self.once("nose",'Nosecone separation at T{0:.3f} seconds.'.format(t))
+        if params["BodyState"]==4 and t>TimeSeparation:
+            self.once("booster",'Booster separation at T{0:.3f} seconds.'.format(t))
+        if params["BodyState"]==1 and t>TimeSeparation and self.phase["Solve3DOF"]==True:
+            self.once("3dof",'3DOF simulation.')
+        if int(t)>self.second:
+            self.second=int(t)
+            Range=math.sqrt(pgeoa[0]*pgeoa[0]+pgeoa[1]*pgeoa[1])
+            print('time {0:.3f} s.'.format(t),' altitude {0:.3f} m.'.format(-pgeoa[2]),' elevation {0:.3f}\xb0.'.format(row["position_angular_pitch (rad)"]*(180/math.pi)),' latitude {0:.3f}\xb0 N.'.format(row["latitude (deg)"]),' longitude {0:.3f}\xb0 E.'.format(row["longitude (deg)"]),' range {0:.3f} m.'.format(Range)," M: {0:.3f}".format(row["mach_number"]))
+
+def Announce(params):
+    """Prints the dispersions of the run:"""
+    MonteCarlo=params["MonteCarlo"]
+    print("Monte Carlo Uncertainties:")
+    print("Thrust Misalignment (Yawing) (deg):",round(MonteCarlo[2],3))
+    print("Thrust Misalignment (Pitching) (deg):",round(MonteCarlo[3],3))
+    print("Thrust Magnitude Variation (%):",round(MonteCarlo[4],3))
+    print("Wind Magnitude Variation (%):",round(MonteCarlo[6],3))
+    print("Wind Direction Variation (deg):",round(MonteCarlo[7],3))
+    print("Aerodynamic Drag Coefficient Variation (%):",round(MonteCarlo[8],3))
+    print("Aerodynamic Lift Coefficient Variation (%):",round(MonteCarlo[9],3))
+    print("Aerodynamic Moment Coefficient Variation (%):",round(MonteCarlo[10],3))
+    print("Centre-Of-Pressure Variation (%):",round(MonteCarlo[11],3))
+    print("Fin Cant Angle Variation (deg):",round(MonteCarlo[12],3))
+    print("Launch Altitude (m):",round(params["LaunchAltitude"]+MonteCarlo[13],3))
+    print("Launch Elevation (deg):",round(abs(-params["LaunchElevation"]-MonteCarlo[0]),3))
+    print("Launch Azimuth (deg):",round(params["LaunchAzimuth"]+MonteCarlo[1],3))
+    print("Burnout Time (s):",round(params["BurnTime"],3))
@@ -3,20 +3,96 @@ from matplotlib.pyplot import figure
 import pandas as pd
 import numpy as np
 from scipy import stats as st
-from scipy.stats import gaussian_kde
+from scipy.signal import fftconvolve
 import matplotlib.pyplot as plt
 
-def MonteCarloDensity(DensityZoom,Directory):
+r"""Images are written relative to the simulator folder (the launcher runs from C:\ASRI_Simulator). map2.png and map3.png are the textures used by graphics_library.pyw:"""
+DensityImages=[r'body\MonteCarloDensity1.png',r'body\graphics\map2.png',r'body\MonteCarloDensity2.png',r'body\graphics\map3.png']
+
+"""Grid nodes per axis: at least bins, and enough that the spacing is at most a third of the kernel width, up to MaxBins:"""
+MaxBins=2048
+
+def BinnedDensity(x,y,bins=512,bandwidth=None):
+     """Gaussian kernel density on a regular grid: landing points are linearly binned and the histogram is convolved with the kernel by FFT. Cost is O(N + bins^2 log bins) instead of O(N^2) for gaussian_kde. The bandwidth (covariance) defaults to Scott's rule, as in gaussian_kde. The grid spans the landing points plus four kernel widths; the density is zero outside it."""
+     x=np.asarray(x,dtype=float)
+     y=np.asarray(y,dtype=float)
+     n=len(x)
+     if n==0:
+          raise ValueError("No landing points to estimate a density from.")
+     if bandwidth is None:
+          if n<2:
+               bandwidth=np.zeros((2,2))
+          else:
+               bandwidth=np.atleast_2d(np.cov(x,y))*(n**(-1/6))**2
+     bandwidth=np.asarray(bandwidth,dtype=float)
+     if np.all(np.isfinite(bandwidth))==False:
+          bandwidth=np.zeros((2,2))
+     if np.linalg.det(bandwidth)<=0 or np.linalg.eigvalsh(bandwidth)[0]<=0:
+          """Degenerate campaigns (one run, or all points on a line) get a 1 m kernel across the degenerate direction:"""
+          bandwidth=bandwidth+np.eye(2)
+     sigmax,sigmay=np.sqrt(np.diag(bandwidth))
+     """Narrowest width of the kernel (its minor axis), which sets the grid spacing:"""
+     sigma=math.sqrt(np.linalg.eigvalsh(bandwidth)[0])
+
+     xmin,xmax,ymin,ymax=x.min()-4*sigmax,x.max()+4*sigmax,y.min()-4*sigmay,y.max()+4*sigmay
+     binsx=int(min(MaxBins,max(bins,math.ceil(3*(xmax-xmin)/sigma)+1)))
+     binsy=int(min(MaxBins,max(bins,math.ceil(3*(ymax-ymin)/sigma)+1)))
+     xgrid=np.linspace(xmin,xmax,binsx)
+     ygrid=np.linspace(ymin,ymax,binsy)
+     dx=xgrid[1]-xgrid[0]
+     dy=ygrid[1]-ygrid[0]
+
+     """Linear binning (each point shared between its four neighbouring nodes):"""
+     fx=(x-xmin)/dx
+     fy=(y-ymin)/dy
+     ix=np.clip(np.floor(fx).astype(int),0,binsx-2)
+     iy=np.clip(np.floor(fy).astype(int),0,binsy-2)
+     wx=fx-ix
+     wy=fy-iy
+     counts=np.zeros(binsx*binsy)
+     for jx,jy,weight in ((ix,iy,(1-wx)*(1-wy)),(ix+1,iy,wx*(1-wy)),(ix,iy+1,(1-wx)*wy),(ix+1,iy+1,wx*wy)):
+          counts+=np.bincount(jx*binsy+jy,weights=weight,minlength=binsx*binsy)
+     counts=counts.reshape(binsx,binsy)
+
+     """Kernel sampled on the same spacing out to four standard deviations, normalised so that the sampled kernel integrates to one (exact when MaxBins limits the spacing):"""
+     Lx=min(binsx-1,int(math.ceil(4*sigmax/dx)))
+     Ly=min(binsy-1,int(math.ceil(4*sigmay/dy)))
+     kx,ky=np.meshgrid(np.arange(-Lx,Lx+1)*dx,np.arange(-Ly,Ly+1)*dy,indexing='ij')
+     inverse=np.linalg.inv(bandwidth)
+     quadratic=inverse[0,0]*kx*kx+2*inverse[0,1]*kx*ky+inverse[1,1]*ky*ky
+     kernel=np.exp(-0.5*quadratic)
+     kernel=kernel/(kernel.sum()*dx*dy)
+
+     density=np.clip(fftconvolve(counts,kernel,mode='same')/n,0,None)
+     return xgrid,ygrid,density
+
+def PointDensity(x,y,xgrid,ygrid,density):
+     """Bilinear lookup of the binned density at each landing point (replaces gaussian_kde(xy)(xy)):"""
+     x=np.asarray(x,dtype=float)
+     y=np.asarray(y,dtype=float)
+     dx=xgrid[1]-xgrid[0]
+     dy=ygrid[1]-ygrid[0]
+     fx=(x-xgrid[0])/dx
+     fy=(y-ygrid[0])/dy
+     inside=(fx>=0)&(fx<=len(xgrid)-1)&(fy>=0)&(fy<=len(ygrid)-1)
+     ix=np.clip(np.floor(fx).astype(int),0,len(xgrid)-2)
+     iy=np.clip(np.floor(fy).astype(int),0,len(ygrid)-2)
+     wx=np.clip(fx-ix,0,1)
+     wy=np.clip(fy-iy,0,1)
+     values=density[ix,iy]*(1-wx)*(1-wy)+density[ix+1,iy]*wx*(1-wy)+density[ix,iy+1]*(1-wx)*wy+density[ix+1,iy+1]*wx*wy
+     """Points beyond four kernel widths of every landing point:"""
+     return np.where(inside,values,0.0)
+
+def MonteCarloDensity(DensityZoom,Directory,ImagePaths=DensityImages,Show=True,bins=512):
+     """ImagePaths: contour image, its map texture, scatter image, its map texture. Show=False runs headless (images are only written to file)."""
      df = pd.read_excel(r'{}\Outputs\Monte Carlo.xlsx'.format(Directory),header=0)
      df.columns=['North (metres)','East (metres)','Apogee (metres)']
      x=df.loc[:,"North (metres)"].values
      y=df.loc[:,"East (metres)"].values
      xmin,xmax,ymin,ymax=-DensityZoom,DensityZoom,-DensityZoom,DensityZoom
+     xgrid,ygrid,density=BinnedDensity(x,y,bins=bins)
      xx, yy = np.mgrid[xmin:xmax:100j, ymin:ymax:100j]
-     positions = np.vstack([xx.ravel(), yy.ravel()])
-     values = np.vstack([x, y])
-     kernel = st.gaussian_kde(values)
-     f = np.reshape(kernel(positions).T, xx.shape)
+     f = np.reshape(PointDensity(xx.ravel(),yy.ravel(),xgrid,ygrid,density), xx.shape)
      fig = plt.figure(figsize=(10,10))
      """Alternatively, use .set_figwidth(30)#.set_figheight(30)"""
      ax = fig.gca()
@@ -24,13 +100,14 @@ def MonteCarloDensity(DensityZoom,Directory):
      cfset = ax.contourf(xx, yy, f, cmap= 'viridis',levels=30)
 
      plt.axis('off')
-     plt.savefig(r'C:\ASRI_Simulator\body\MonteCarloDensity1.png', dpi=100,bbox_inches='tight',pad_inches=0)
-     plt.savefig(r'C:\ASRI_Simulator\body\graphics\map2.png', dpi=100,bbox_inches='tight',pad_inches=0)
-     plt.show()
+     plt.savefig(ImagePaths[0], dpi=100,bbox_inches='tight',pad_inches=0)
+     plt.savefig(ImagePaths[1], dpi=100,bbox_inches='tight',pad_inches=0)
+     if Show==True:
+          plt.show()
+     plt.close(fig)
 
-     xy = np.vstack([x,y])
      """Calculate point density:"""
-     z = gaussian_kde(xy)(xy)
+     z = PointDensity(x,y,xgrid,ygrid,density)
      fig, ax2 = plt.subplots(figsize=(10,10))
      ax2.scatter(x, y, c=z, s=10)
      """fig.set_facecolor('black')"""
@@ -38,6 +115,8 @@ def MonteCarloDensity(DensityZoom,Directory):
      plt.yticks(np.linspace(-DensityZoom, DensityZoom, 11))
      plt.xticks(np.linspace(-DensityZoom, DensityZoom, 11))
      plt.axis('off')
-     plt.savefig(r'C:\ASRI_Simulator\body\MonteCarloDensity2.png', dpi=100,bbox_inches='tight',pad_inches=0,transparent=True)
-     plt.savefig(r'C:\ASRI_Simulator\body\graphics\map3.png', dpi=100,bbox_inches='tight',pad_inches=0,transparent=True)
-     plt.show()
+     plt.savefig(ImagePaths[2], dpi=100,bbox_inches='tight',pad_inches=0,transparent=True)
+     plt.savefig(ImagePaths[3], dpi=100,bbox_inches='tight',pad_inches=0,transparent=True)
+     if Show==True:
+          plt.show()
+     plt.close(fig)
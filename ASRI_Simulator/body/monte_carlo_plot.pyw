@@ -29,22 +29,107 @@ import matplotlib.pyplot as plt
 import matplotlib.transforms as transforms
 from matplotlib.pyplot import figure
 from matplotlib.patches import Ellipse
+from body.output_tables import ReadTable
+
+class map_tail:
+    r"""Reads only the rows appended to Outputs\Monte Carlo Map.csv since the previous call (main.pyw appends one row per run). skip: data rows already loaded from elsewhere."""
+    def __init__(self,path,skip=0):
+        self.path=path
+        self.skip=skip
+        self.offset=0
+        self.partial=b''
+
+    def read(self):
+        """Returns the new (East, North) points and whether the file was restarted (new campaign)."""
+        restarted=False
+        if os.path.isfile(self.path)==False:
+            return np.zeros((0,2)),restarted
+        if os.path.getsize(self.path)<self.offset:
+            self.offset=0
+            self.partial=b''
+            self.skip=0
+            restarted=True
+        with open(self.path,'rb') as file1:
+            file1.seek(self.offset)
+            data=self.partial+file1.read()
+            self.offset=file1.tell()
+        lines=data.split(b'\n')
+        """Keep an incomplete last line for the next call:"""
+        self.partial=lines.pop()
+        points=[]
+        for row in csv.reader(line.decode('utf-8-sig').strip('\r') for line in lines):
+            if len(row)<2 or row[0]=="East (metres)":
+                continue
+            if self.skip>0:
+                self.skip-=1
+                continue
+            points.append([float(row[0]),float(row[1])])
+        return np.array(points,dtype=float).reshape(-1,2),restarted
+
+class dispersion_statistics:
+    """Running mean/covariance (Chan et al. pairwise update) and convex hull of the splashdown points. Each update only touches the new points and the current hull vertices, so the cost does not grow with the campaign."""
+    def __init__(self):
+        self.count=0
+        self.mean=np.zeros(2)
+        self.M2=np.zeros((2,2))
+        self.hull=np.zeros((0,2))
+
+    def update(self,points):
+        points=np.asarray(points,dtype=float).reshape(-1,2)
+        if len(points)==0:
+            return
+        count=len(points)
+        mean=points.mean(axis=0)
+        M2=(points-mean).T@(points-mean)
+        delta=mean-self.mean
+        total=self.count+count
+        self.M2=self.M2+M2+np.outer(delta,delta)*(self.count*count/total)
+        self.mean=self.mean+delta*(count/total)
+        self.count=total
+        self.hull=dispersion_statistics.hull_vertices(np.vstack((self.hull,points)))
+
+    @staticmethod
+    def hull_vertices(points):
+        if len(points)<3:
+            return points
+        try:
+            return points[ConvexHull(points).vertices,:]
+        except Exception:
+            """Collinear or repeated points: keep the extremes along the dominant axis."""
+            axis=np.argmax(np.ptp(points,axis=0))
+            return points[[np.argmin(points[:,axis]),np.argmax(points[:,axis])],:]
+
+    def covariance(self):
+        if self.count<2:
+            return np.zeros((2,2))
+        return self.M2/(self.count-1)
+
+    def ellipse(self,nstd=3):
+        """Width, height and angle (degrees) of the nstd-sigma dispersion ellipse:"""
+        eigenvalues,eigenvectors=np.linalg.eigh(self.covariance())
+        eigenvalues=np.clip(eigenvalues,0,None)
+        angle=math.degrees(math.atan2(eigenvectors[1,1],eigenvectors[0,1]))
+        return 2*nstd*math.sqrt(eigenvalues[1]),2*nstd*math.sqrt(eigenvalues[0]),angle
 
 def MonteCarloPlot(PlotScalingFactor,LocationOffset,BoundaryThickness,NominalSplashdown,CampaignSplashdown,RefreshRate,PlotZoom,Directory):
     SettingsPlotList=[PlotScalingFactor,LocationOffset,BoundaryThickness,NominalSplashdown[0],NominalSplashdown[1],CampaignSplashdown[0],CampaignSplashdown[1],RefreshRate]
-    df = pd.read_excel(r'{}\Outputs\Monte Carlo Map.xlsx'.format(Directory),header=0)
-    MonteCarloPoints=len(df)
+    MapFile=r'{}\Outputs\Monte Carlo Map.csv'.format(Directory)
+    if os.path.isfile(MapFile)==True:
+        MapTail=map_tail(MapFile)
+        points,restarted=MapTail.read()
+    else:
+        """Campaigns written before the append-only map file existed: load the workbook once, then only tail the rows added after it."""
+        df = ReadTable(r'{}\Outputs\Monte Carlo Map.xlsx'.format(Directory),MemoryMap=True)
+        points=df.iloc[:,0:2].to_numpy(dtype=float)
+        MapTail=map_tail(MapFile,skip=len(points))
 
     #dfWind = pd.read_excel(r'{}\Outputs\Monte Carlo Map Wind.xlsx'.format(Directory),header=0)
     #MonteCarloPointsWind=len(dfWind)
-    
-    #df.columns=['East (metres)','North (metres)','Apogee (metres)']
-    df.columns=["East (metres)","North (metres)","Apogee (metres)","Simulation completed","Thrust Misalignment (Yawing) (deg):","Thrust Misalignment (Pitching) (deg):","Thrust Magnitude Variation (%):","Wind Magnitude Variation (%):","Wind Direction Variation (deg):","Aerodynamic Drag Coefficient Variation (%):","Aerodynamic Lift Coefficient Variation (%):","Aerodynamic Moment Coefficient Variation (%):","Centre-Of-Pressure Variation (%):","Fin Cant Angle Variation (deg):","Launch Altitude (m):","Launch Elevation (deg):","Launch Azimuth (deg):","Burnout Time (s):"]
 
-    #x=df.loc[0,'East (metres)']
-    x=df.loc[:,'East (metres)'].values
-    #y=df.loc[0,'North (metres)']
-    y=df.loc[:,'North (metres)'].values
+    Statistics=dispersion_statistics()
+    Statistics.update(points)
+    x=points[:,0]
+    y=points[:,1]
 
     xmin,xmax,ymin,ymax=0.5,PlotZoom,0.5,PlotZoom
     fig, ax = plt.subplots()
@@ -60,9 +145,6 @@ def MonteCarloPlot(PlotScalingFactor,LocationOffset,BoundaryThickness,NominalSpl
     ##    OTR3=plt.imread(r"body\OTR\TR.png")
     ##    OTR4=plt.imread(r"body\OTR\BR.png")
 
-    x=df.loc[:,'East (metres)'].values
-    y=df.loc[:,'North (metres)'].values
-
     #x7=dfWind.loc[:,'East (metres)'].values
     #y7=dfWind.loc[:,'North (metres)'].values
     
@@ -113,13 +195,21 @@ def MonteCarloPlot(PlotScalingFactor,LocationOffset,BoundaryThickness,NominalSpl
         poly = plt.Polygon(p[hull.vertices,:], **kw)
         return poly
 
+    def circles(centres,radius,resolution):
+        """resolution points on a circle of the given radius around each centre:"""
+        angles=np.arange(resolution,0,-1)*(2*math.pi/resolution)
+        return np.c_[(centres[:,0:1]+radius*np.sin(angles)).ravel(),(centres[:,1:2]+radius*np.cos(angles)).ravel()]
+
     Counter=0
     DisplayMap=0
+    SettingsPlotTime=None
     while DisplayMap<1:
         plt.ion()
 
-        """Change plot settings while code is running"""
-        SettingsPlot=pd.read_excel(r'{}\Inputs\SettingsPlot.xlsx'.format(Directory),header=0)
+        """Change plot settings while code is running (the workbook is only re-read when it has been saved):"""
+        if os.path.getmtime(r'{}\Inputs\SettingsPlot.xlsx'.format(Directory))!=SettingsPlotTime:
+            SettingsPlotTime=os.path.getmtime(r'{}\Inputs\SettingsPlot.xlsx'.format(Directory))
+            SettingsPlot=pd.read_excel(r'{}\Inputs\SettingsPlot.xlsx'.format(Directory),header=0)
 
         """nominal simulation splashdown coordinates:"""
         x01=SettingsPlotList[3]
@@ -161,17 +251,17 @@ def MonteCarloPlot(PlotScalingFactor,LocationOffset,BoundaryThickness,NominalSpl
         #plot7.remove()
         ax.lines[0].remove()
 
-        df = pd.read_excel(r'{}\Outputs\Monte Carlo Map.xlsx'.format(Directory),header=0)
-
-        """If new splashdown point detected, update footprint."""
-        if len(df)>MonteCarloPoints:
-            x_value=np.array([df.loc[(len(df)-1),'East (metres)']])
-            y_value=np.array([df.loc[(len(df)-1),'North (metres)']])
-
-            x=np.concatenate((x,x_value),axis = 0)
-            y=np.concatenate((y,y_value),axis = 0)
+        """If new splashdown points detected, update footprint:"""
+        points,restarted=MapTail.read()
+        if restarted==True:
+            Statistics=dispersion_statistics()
+            x=np.zeros(0)
+            y=np.zeros(0)
+        if len(points)>0:
+            Statistics.update(points)
+            x=np.concatenate((x,points[:,0]),axis = 0)
+            y=np.concatenate((y,points[:,1]),axis = 0)
             plot3.set_offsets(np.c_[x,y])#plot3=ax.scatter(x, y)
-            MonteCarloPoints+=1
 
 ##        if len(dfWind)>MonteCarloPointsWind:
 ##            x7_value=np.array([df.loc[(len(dfWind)-1),'East (metres)']])
@@ -186,33 +276,19 @@ def MonteCarloPlot(PlotScalingFactor,LocationOffset,BoundaryThickness,NominalSpl
         if Counter>=1:
             c1.remove()
             c2.remove()
+            c3.remove()
+        if Statistics.count==0:
+            Counter=0
+            continue
 
-        """Use points to create a symmetric safety envelope."""
-        x_mirror=np.array([])
-        y_mirror=np.array([])
-        counter=0
-        m=np.mean(y)/np.mean(x)
-        counterlength=len(x)
-        while counter<(counterlength):
-            """Gradient of line fron launch pad to mean splashdown point coordinates:"""
-            x_new=2*((x[counter]+(y[counter])*m)/(1+m**2))-x[counter]
-            y_new=2*((x[counter]+(y[counter])*m)/(1+m**2))*m-y[counter]
-            xnew=np.array([x_new])
-            ynew=np.array([y_new])
-            x_mirror=np.concatenate((x_mirror,xnew),axis = 0)
-            y_mirror=np.concatenate((y_mirror,ynew),axis = 0)
-            counter+=1
+        """Use points to create a symmetric safety envelope. Mirroring across the line from the launch pad to the mean splashdown point is linear, so the hull of the points and their mirror images is the hull of the mirrored hull vertices:"""
+        m=Statistics.mean[1]/Statistics.mean[0]
+        hull=Statistics.hull
+        x_mirror=2*((hull[:,0]+(hull[:,1])*m)/(1+m**2))-hull[:,0]
+        y_mirror=2*((hull[:,0]+(hull[:,1])*m)/(1+m**2))*m-hull[:,1]
 
         """Setting up the safety envelope boundary."""
-        x_boundary=np.concatenate((x,x_mirror),axis = 0)
-        y_boundary=np.concatenate((y,y_mirror),axis = 0)
-        M=[np.mean(x_boundary),np.mean(y_boundary)]
-        Factor1=max(abs(min(x_mirror)),abs(max(x_mirror)))-M[0]
-        Factor2=max(abs(min(y_mirror)),abs(max(y_mirror)))-M[1]
-        PlotScalingFactor1=max([Factor1/2000,Factor2/2000])
-        PlotScalingFactor2=min([Factor1/2000,Factor2/2000])
-        LocationOffset=np.linalg.norm(np.array([Factor1,Factor2]))/np.linalg.norm(np.array([M[0],M[1]]))
-        PlotScalingFactor=PlotScalingFactor2
+        boundary_points=np.r_[hull,np.c_[x_mirror,y_mirror]]
 
         PlotScalingFactor=SettingsPlotList[0]
         if SettingsPlot.iloc[0,0]!=0:
@@ -226,69 +302,19 @@ def MonteCarloPlot(PlotScalingFactor,LocationOffset,BoundaryThickness,NominalSpl
         if SettingsPlot.iloc[0,2]!=0:
             BoundaryThickness=SettingsPlot.iloc[0,2]
 
-        """Contours:"""
-        NumberRuns=len(x_boundary)
-        row_number=1
-        while row_number<(NumberRuns):
-            boundary=BoundaryThickness*PlotScalingFactor
-            resolution=16
-            while resolution>0:
-                row_write=[x_boundary[row_number]+boundary*math.sin(resolution*math.pi/8),y_boundary[row_number]+boundary*math.cos(resolution*math.pi/8)]
-                with open(r'body\points.csv', 'a', newline='') as inner_enclosure:
-                    writer = csv.writer(inner_enclosure)
-                    writer.writerow(row_write)
-                resolution-=1
-            row_number+=1
-        resolution=160
-        while resolution>0:
-            row_write_last=[boundary*math.sin(resolution*math.pi/80),boundary*math.cos(resolution*math.pi/80)]
-            Locationx=np.mean(x)+np.mean(x)*LocationOffset
-            Locationy=np.mean(y)+np.mean(y)*LocationOffset
-            row_write_lastt=[Locationx+(PlotScalingFactor*(boundary+800-800/3))*math.sin(resolution*math.pi/80),Locationy+(PlotScalingFactor*(boundary+800-800/3))*math.cos(resolution*math.pi/80)]
-            with open(r'body\points.csv', 'a', newline='') as outer_enclosure:
-                writer = csv.writer(outer_enclosure)
-                writer.writerow(row_write_last)
-                writer.writerow(row_write_lastt)
-            resolution-=1
-
-        row_number=1
-        while row_number<(NumberRuns):
-            boundary=(BoundaryThickness)*PlotScalingFactor+BoundaryThickness
-            resolution=16
-            while resolution>0:
-                row_write=[x_boundary[row_number]+boundary*math.sin(resolution*math.pi/8),y_boundary[row_number]+boundary*math.cos(resolution*math.pi/8)]
-                with open(r'body\points2.csv', 'a', newline='') as inner_enclosure:
-                    writer = csv.writer(inner_enclosure)
-                    writer.writerow(row_write)
-                resolution-=1
-            row_number+=1
-        resolution=160
-        while resolution>0:
-            row_write_last=[boundary*math.sin(resolution*math.pi/80),boundary*math.cos(resolution*math.pi/80)]
-            row_write_lastt=[Locationx+(PlotScalingFactor*boundary)*math.sin(resolution*math.pi/80),Locationy+(PlotScalingFactor*boundary)*math.cos(resolution*math.pi/80)]
-            with open(r'body\points2.csv', 'a', newline='') as outer_enclosure:
-                writer = csv.writer(outer_enclosure)
-                writer.writerow(row_write_last)
-                writer.writerow(row_write_lastt)
-            resolution-=1
-
-        """Splashdown point coordinates:"""
-        df = pd.read_csv(r'body\points.csv',header='infer')    
-        df.columns=['x','y']
-        x2=df.loc[:,"x"].values
-        y2=df.loc[:,"y"].values
-        encircle(x2, y2, ec="k", fc="gold", alpha=0.2)
-        c1=ax.add_patch(encircle(x2, y2, ec="k", fc="gold", alpha=0.2))
-
-        df = pd.read_csv(r'body\points2.csv',header='infer')    
-        df.columns=['x','y']
-        x3=df.loc[:,"x"].values
-        y3=df.loc[:,"y"].values
-        encircle(x3, y3, ec="k", fc="red", alpha=0.2)
-        c2=ax.add_patch(encircle(x3, y3, ec="k", fc="red", alpha=0.2))
-
-        os.remove(r'body\points.csv')
-        os.remove(r'body\points2.csv')
+        """Contours (circles around the boundary points, the launch pad and the offset mean splashdown point):"""
+        Location=np.array([[Statistics.mean[0]+Statistics.mean[0]*LocationOffset,Statistics.mean[1]+Statistics.mean[1]*LocationOffset]])
+        boundary=BoundaryThickness*PlotScalingFactor
+        inner=np.r_[circles(boundary_points,boundary,16),circles(np.zeros((1,2)),boundary,160),circles(Location,PlotScalingFactor*(boundary+800-800/3),160)]
+        boundary=(BoundaryThickness)*PlotScalingFactor+BoundaryThickness
+        outer=np.r_[circles(boundary_points,boundary,16),circles(np.zeros((1,2)),boundary,160),circles(Location,PlotScalingFactor*boundary,160)]
+
+        c1=ax.add_patch(encircle(inner[:,0], inner[:,1], ec="k", fc="gold", alpha=0.2))
+        c2=ax.add_patch(encircle(outer[:,0], outer[:,1], ec="k", fc="red", alpha=0.2))
+
+        """3-sigma dispersion ellipse from the running covariance:"""
+        width,height,angle=Statistics.ellipse(3)
+        c3=ax.add_patch(Ellipse((Statistics.mean[0],Statistics.mean[1]),width,height,angle=angle,ec="white",fc="none",linestyle="--",linewidth=1,zorder=2))
         Counter+=1
 
     plt.waitforbuttonpress()
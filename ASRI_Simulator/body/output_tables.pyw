@@ -0,0 +1,109 @@
+import os
+import glob
+import numpy as np
+import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa=None
+
+"""Columnar output files. Tables the solvers write (Simulation, the Monte Carlo summaries) are named by their .xlsx path as before, but are stored in the format chosen by PYROPS_OUTPUT:
+arrow   - Arrow IPC file (.arrow), uncompressed so readers memory-map it (default)
+parquet - zstd compressed Parquet (.parquet), smallest on disk
+excel   - the workbook itself (.xlsx), as written before; also the fallback when pyarrow is not installed
+PYROPS_OUTPUT_FLOAT32=1 stores float columns as float32. ExportExcel converts any table to a workbook on request; ExportOutputs (the launcher's Export Excel button) converts every table in Outputs."""
+
+Extensions={"arrow":".arrow","parquet":".parquet","excel":".xlsx"}
+Warned=[]
+
+def OutputFormat():
+    Format=os.environ.get("PYROPS_OUTPUT","arrow").lower()
+    if Format not in Extensions:
+        raise ValueError("PYROPS_OUTPUT must be one of {}, not '{}'".format(", ".join(Extensions),Format))
+    if Format!="excel" and pa is None:
+        if not Warned:
+            print("pyarrow is not installed; output tables are written as Excel workbooks.")
+            Warned.append(True)
+        return "excel"
+    return Format
+
+def OutputPath(path,Format=None):
+    """File that holds the table named by path in the given (default: current) format."""
+    return os.path.splitext(path)[0]+Extensions[Format or OutputFormat()]
+
+def TablePath(path):
+    """Newest existing file of the table named by path, in any format, or None."""
+    found=[OutputPath(path,Format) for Format in Extensions if os.path.isfile(OutputPath(path,Format))]
+    if len(found)==0:
+        return None
+    return max(found,key=os.path.getmtime)
+
+def TableExists(path):
+    return TablePath(path) is not None
+
+def WriteTable(Frame,path,Columns=None):
+    """Writes Frame (optionally only Columns) atomically through a temporary file; returns the file written."""
+    Format=OutputFormat()
+    if Columns is not None:
+        Frame=Frame[list(Columns)]
+    target=OutputPath(path,Format)
+    partial=os.path.splitext(target)[0]+".partial"+Extensions[Format]
+    if Format=="excel":
+        Frame.to_excel(partial,index=False)
+    else:
+        Frame=Frame.infer_objects()
+        try:
+            Table=pa.Table.from_pandas(Frame,preserve_index=False)
+        except (pa.ArrowTypeError,pa.ArrowInvalid):
+            """Mixed-type object columns are stored as text:"""
+            Table=pa.Table.from_pandas(Frame.astype({column:str for column in Frame.columns if Frame[column].dtype==object}),preserve_index=False)
+        if os.environ.get("PYROPS_OUTPUT_FLOAT32","0").lower() not in ("","0","off","false","no"):
+            Table=Table.cast(pa.schema([pa.field(field.name,pa.float32()) if pa.types.is_float64(field.type) else field for field in Table.schema]))
+        if Format=="arrow":
+            with pa.OSFile(partial,"wb") as sink:
+                with pa.ipc.new_file(sink,Table.schema) as writer:
+                    writer.write_table(Table)
+        else:
+            pq.write_table(Table,partial,compression="zstd")
+    os.replace(partial,target)
+    return target
+
+def ReadTable(path,header=0,MemoryMap=False):
+    """Reads the table named by path from the newest file it was written to. With MemoryMap=True an Arrow file is mapped rather than read, so plotting a few columns of a long trajectory only touches those pages; a mapped file cannot be replaced on Windows until the frame is released, so the solvers' read-append-write tables are read normally."""
+    found=TablePath(path)
+    if found is None:
+        raise FileNotFoundError(path)
+    if found.endswith(".xlsx"):
+        return pd.read_excel(found,header=header)
+    if found.endswith(".parquet"):
+        return pq.read_table(found,memory_map=MemoryMap).to_pandas()
+    if MemoryMap==True:
+        return pa.ipc.open_file(pa.memory_map(found,"r")).read_all().to_pandas(split_blocks=True)
+    with pa.OSFile(found,"rb") as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+def RemoveTable(path):
+    for Format in Extensions:
+        if os.path.isfile(OutputPath(path,Format)):
+            os.remove(OutputPath(path,Format))
+
+def ExportExcel(path):
+    r"""Explicit Excel export of a table (e.g. Outputs\Simulation.xlsx from Simulation.arrow); returns the workbook path."""
+    found=TablePath(path)
+    Frame=ReadTable(path)
+    workbook=OutputPath(path,"excel")
+    Frame.to_excel(workbook,index=False)
+    if found!=workbook:
+        """The workbook is a copy: it takes the source's time, so the source stays the file ReadTable picks:"""
+        os.utime(workbook,ns=(os.stat(found).st_atime_ns,os.stat(found).st_mtime_ns))
+    return workbook
+
+def ExportOutputs(Directory):
+    """Excel workbooks of every Arrow/Parquet table in Outputs whose workbook is missing or older; returns the workbooks written."""
+    tables=set()
+    for Format in ("arrow","parquet"):
+        for path in glob.glob(r'{}\Outputs\*{}'.format(Directory,Extensions[Format])):
+            if not path.endswith(".partial"+Extensions[Format]):
+                tables.add(os.path.splitext(path)[0]+".xlsx")
+    return [ExportExcel(path) for path in sorted(tables) if os.path.isfile(path)==False or os.path.getmtime(path)<os.path.getmtime(TablePath(path))]
@@ -0,0 +1,103 @@
+import os
+import queue
+import atexit
+import threading
+import pandas as pd
+from body.output_tables import WriteTable,ReadTable,TableExists
+
+"""Background output stage. The solvers hand their output files to Writer, which writes them on one thread, in submission order, while the next run computes. The queue holds at most PYROPS_WRITER_QUEUE tasks (default 8): a solver submitting to a full queue waits, so memory stays bounded. PYROPS_WRITER=0 writes synchronously, as before. Arrow and Parquet writes release the GIL; Excel (openpyxl) writes mostly do not, so they overlap less with the solver."""
+
+class output_writer:
+    def __init__(self,size=None,enabled=None):
+        if enabled is None:
+            enabled=os.environ.get("PYROPS_WRITER","1").lower() not in ("","0","off","false","no")
+        if size is None:
+            size=int(os.environ.get("PYROPS_WRITER_QUEUE","8"))
+        self.enabled=enabled
+        self.tasks=queue.Queue(maxsize=max(size,1))
+        self.thread=None
+        self.error=None
+        """Monte Carlo tables as last written, so each run appends to memory instead of re-reading the file:"""
+        self.tables={}
+
+    def start(self):
+        if self.thread is None:
+            self.thread=threading.Thread(target=self.drain,name="PyROPS output writer",daemon=True)
+            self.thread.start()
+            atexit.register(self.tasks.join)
+
+    def drain(self):
+        while True:
+            function,args=self.tasks.get()
+            try:
+                """After a failed write nothing more is written (in particular no campaign record claiming the run completed):"""
+                if self.error is None:
+                    function(*args)
+            except Exception as error:
+                self.error=error
+            finally:
+                self.tasks.task_done()
+
+    def check(self):
+        if self.error is not None:
+            raise RuntimeError("Output writer failed: {}: {}".format(type(self.error).__name__,self.error)) from self.error
+
+    def submit(self,function,*args):
+        """Queues function(*args); waits while the queue is full. Raises the error of an earlier failed write."""
+        self.check()
+        if self.enabled==False:
+            function(*args)
+            return
+        self.start()
+        self.tasks.put((function,args))
+
+    def flush(self):
+        """Waits until every submitted output is on disk."""
+        if self.thread is not None:
+            self.tasks.join()
+        self.check()
+
+    def reset(self):
+        """Start of a Simulate: waits for outstanding writes, then forgets the cached tables and any earlier error."""
+        if self.thread is not None:
+            self.tasks.join()
+        self.tables={}
+        self.error=None
+
+    def write(self,Frame,path):
+        self.submit(WriteTable,Frame,path)
+
+    def append(self,path,Row,Columns,Keep=True):
+        """Appends a Monte Carlo row (if Keep) and rewrites the table."""
+        self.submit(self.append_table,path,Row,Columns,Keep)
+
+    def append_map(self,Directory,Row,Columns,Keep=True):
+        """As append, for Monte Carlo Map; also extends the append-only Map.csv tailed by the live dispersion map."""
+        self.submit(self.append_map_table,Directory,Row,Columns,Keep)
+
+    def append_table(self,path,Row,Columns,Keep):
+        if path in self.tables:
+            MonteCarlo=self.tables[path]
+        elif TableExists(path)==True:
+            MonteCarlo=ReadTable(path)
+        else:
+            MonteCarlo=pd.DataFrame(columns=Columns)
+        if Keep==True:
+            MonteCarlo=MonteCarlo._append(Row)
+        WriteTable(MonteCarlo,path,Columns)
+        self.tables[path]=MonteCarlo
+        return MonteCarlo
+
+    def append_map_table(self,Directory,Row,Columns,Keep):
+        path=r'{}\Outputs\Monte Carlo Map.xlsx'.format(Directory)
+        MonteCarloTail=r'{}\Outputs\Monte Carlo Map.csv'.format(Directory)
+        MonteCarloFile=path in self.tables or TableExists(path)
+        MonteCarloTailFile=os.path.isfile(MonteCarloTail)
+        if Keep==True and MonteCarloFile==True and MonteCarloTailFile==True:
+            Row.to_csv(MonteCarloTail,columns=Columns,index=False,header=False,mode='a')
+        MonteCarlo=self.append_table(path,Row,Columns,Keep)
+        if MonteCarloFile==False or MonteCarloTailFile==False:
+            MonteCarlo.to_csv(MonteCarloTail,columns=Columns,index=False)
+
+"""One writer per process, shared by both solvers and the launcher:"""
+Writer=output_writer()
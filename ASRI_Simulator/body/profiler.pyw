@@ -0,0 +1,132 @@
+import os
+import time
+import json
+import random
+from array import array
+
+class profiler:
+    """Opt-in timing of the solver right-hand side, enabled by PYROPS_PROFILE. When it is not set, start and lap do nothing."""
+    Samples=65536
+    """Seconds between rewrites of Outputs\\Profile.json during a campaign:"""
+    WriteInterval=30.0
+
+    def __init__(self,enabled=None):
+        if enabled is None:
+            enabled=os.environ.get("PYROPS_PROFILE","0").lower() not in ("","0","off","false","no")
+        self.enabled=enabled
+        self.sampler=random.Random(0)
+        self.campaign=self.empty()
+        self.run=self.empty()
+        self.current={}
+        self.mark=None
+        self.report=None
+        self.written=None
+        if self.enabled==False:
+            self.start=self.skip
+            self.lap=self.skip
+
+    def skip(self,*args):
+        return
+
+    def empty(self):
+        return {"runs":0,"calls":0,"total":{},"count":{},"samples":{}}
+
+    def reset(self):
+        """Start a new campaign (the launcher calls this once per Simulate)."""
+        self.campaign=self.empty()
+        self.report=None
+        self.written=None
+
+    def begin(self,label):
+        """Start a new run."""
+        self.run=self.empty()
+        self.run["label"]=label
+        self.current={}
+        self.mark=None
+
+    def start(self):
+        """Called at the top of every right-hand side evaluation. Time since the previous evaluation ended is booked to the solver."""
+        now=time.perf_counter()
+        self.flush()
+        if self.mark is not None:
+            self.current["solver"]=now-self.mark
+        self.run["calls"]+=1
+        self.mark=time.perf_counter()
+
+    def lap(self,name):
+        """Books the time since the previous start or lap to a subsystem."""
+        now=time.perf_counter()
+        self.current[name]=self.current.get(name,0.0)+(now-self.mark)
+        self.mark=now
+
+    def add(self,record,name,elapsed,count=1):
+        record["total"][name]=record["total"].get(name,0.0)+elapsed
+        record["count"][name]=record["count"].get(name,0)+count
+
+    def sample(self,record,name,elapsed):
+        """Reservoir sampling keeps the percentiles bounded in memory on long campaigns."""
+        samples=record["samples"].setdefault(name,array('d'))
+        if len(samples)<self.Samples:
+            samples.append(elapsed)
+        else:
+            slot=self.sampler.randrange(record["count"][name])
+            if slot<self.Samples:
+                samples[slot]=elapsed
+
+    def flush(self):
+        for name,elapsed in self.current.items():
+            self.add(self.run,name,elapsed)
+            self.sample(self.run,name,elapsed)
+        self.current={}
+
+    def summary(self,record):
+        total=sum(record["total"].values())
+        rows=[]
+        for name in sorted(record["total"],key=record["total"].get,reverse=True):
+            samples=sorted(record["samples"][name])
+            def percentile(q):
+                return samples[min(len(samples)-1,int(q*len(samples)))]*1e6
+            rows.append({"subsystem":name,"calls":record["count"][name],"total_s":record["total"][name],"share":record["total"][name]/total if total>0 else 0.0,
+                         "mean_us":record["total"][name]/record["count"][name]*1e6,"p50_us":percentile(0.50),"p95_us":percentile(0.95),"p99_us":percentile(0.99)})
+        return {"label":record.get("label"),"runs":record["runs"],"rhs_calls":record["calls"],"total_s":total,"subsystems":rows}
+
+    def table(self,summary):
+        lines=["Hot path profile: {} ({} RHS calls, {:.3f} s)".format(summary["label"] or "campaign",summary["rhs_calls"],summary["total_s"]),
+               "{:<16}{:>10}{:>11}{:>8}{:>11}{:>11}{:>11}{:>11}".format("subsystem","calls","total s","share","mean us","p50 us","p95 us","p99 us")]
+        for row in summary["subsystems"]:
+            lines.append("{:<16}{:>10}{:>11.3f}{:>7.1f}%{:>11.1f}{:>11.1f}{:>11.1f}{:>11.1f}".format(row["subsystem"],row["calls"],row["total_s"],100*row["share"],row["mean_us"],row["p50_us"],row["p95_us"],row["p99_us"]))
+        return "\n".join(lines)
+
+    def end(self,Directory):
+        """Closes the run and prints its table. The run and campaign summaries go to Outputs\\Profile.json after the first run and then at most every WriteInterval seconds, so long campaigns do not rewrite it after every run."""
+        if self.enabled==False:
+            return None
+        self.flush()
+        self.mark=None
+        self.run["runs"]=1
+        self.campaign["runs"]+=1
+        self.campaign["calls"]+=self.run["calls"]
+        for name in self.run["total"]:
+            self.add(self.campaign,name,0.0,0)
+            for elapsed in self.run["samples"][name]:
+                self.campaign["count"][name]+=1
+                self.sample(self.campaign,name,elapsed)
+            """Totals and counts are exact; only the percentile samples are thinned:"""
+            self.campaign["count"][name]+=self.run["count"][name]-len(self.run["samples"][name])
+            self.campaign["total"][name]+=self.run["total"][name]
+        self.report={"run":self.summary(self.run),"campaign":self.summary(self.campaign)}
+        print(self.table(self.report["run"]))
+        if self.written is None or time.perf_counter()-self.written>=self.WriteInterval:
+            self.write(Directory)
+        return self.report
+
+    def write(self,Directory):
+        """Writes the latest summaries to Outputs\\Profile.json; the launcher calls this once more when the campaign has finished."""
+        if self.enabled==False or self.report is None:
+            return
+        with open(r'{}\Outputs\Profile.json'.format(Directory),"w") as file1:
+            json.dump(self.report,file1,indent=2)
+        self.written=time.perf_counter()
+
+"""One profiler per process, so the totals of a Monte Carlo campaign accumulate across runs:"""
+HotPath=profiler()
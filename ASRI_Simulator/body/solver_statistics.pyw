@@ -0,0 +1,187 @@
+import os
+import csv
+import json
+import bisect
+import numpy as np
+import pandas as pd
+from time import perf_counter
+
+"""Runs costing more than this multiple of the campaign median wall time are listed as outliers:"""
+OutlierFactor=10
+
+class solver_monitor:
+    """Counts right-hand side evaluations and their wall time per flight phase (rail, powered, coast, descent)."""
+    Phases=["rail","powered","coast","descent"]
+
+    def __init__(self,ode_system=None,phase=None):
+        self.ode_system=ode_system
+        self.phase=phase
+        self.calls=[0,0,0,0]
+        self.time=[0.0,0.0,0.0,0.0]
+        self.start=[None,None,None,None]
+        self.times=[]
+        self.began=perf_counter()
+        self.clock=self.began
+
+    @staticmethod
+    def PhaseIndex(RailMessage,BurnoutMessage,ApogeeMessage):
+        if ApogeeMessage==True:
+            return 3
+        if BurnoutMessage==True:
+            return 2
+        if RailMessage==True:
+            return 1
+        return 0
+
+    def __call__(self,t,y):
+        """Stands in for ode_system in solve_ivp; phase(t,y) names the flight phase of the evaluation."""
+        Start=perf_counter()
+        dy=self.ode_system(t,y)
+        self.book(t,self.phase(t,y),perf_counter()-Start)
+        return dy
+
+    def book(self,t,Phase,elapsed):
+        self.calls[Phase]+=1
+        self.time[Phase]+=elapsed
+        if self.start[Phase] is None:
+            self.start[Phase]=t
+
+    def tick(self,t,Phase):
+        """Fixed-step version of __call__: books the time since the previous tick to the step ending at t."""
+        now=perf_counter()
+        self.book(t,Phase,now-self.clock)
+        self.clock=now
+        self.times.append(t)
+
+    def statistics(self,method,times=None,nfev=None,njev=0,attempts=None,status=0,message=""):
+        if times is None:
+            times=[0.0]+self.times
+        times=np.asarray(times,dtype=float)
+        steps=np.diff(times)
+        accepted=len(steps)
+        nfev=sum(self.calls) if nfev is None else int(nfev)
+        attempts=accepted if attempts is None else int(attempts)
+
+        """Accepted steps per phase, split at the first evaluation seen in each phase:"""
+        Starts=[start for start in self.start if start is not None]
+        Phases={}
+        for index,name in enumerate(self.Phases):
+            if self.start[index] is None:
+                continue
+            Ends=[start for start in Starts if start>self.start[index]]
+            End=min(Ends) if Ends else np.inf
+            Phases[name]={"start_s":float(self.start[index]),"rhs_calls":self.calls[index],"wall_s":self.time[index],
+                          "steps":int(np.count_nonzero((times[1:]>=self.start[index])&(times[1:]<End)))}
+
+        return {"method":method,"nfev":nfev,"njev":int(njev),"steps":accepted,"rejected":max(attempts-accepted,0),
+                "min_step":float(steps.min()) if accepted else 0.0,"max_step":float(steps.max()) if accepted else 0.0,
+                "median_step":float(np.median(steps)) if accepted else 0.0,"wall_s":perf_counter()-self.began,
+                "status":int(status),"message":str(message),"phases":Phases,"step_times":times[1:],"step_sizes":steps}
+
+def SolverColumns(statistics):
+    """Scalar statistics appended to each Monte Carlo results row."""
+    return {"Solver method":statistics["method"],"RHS evaluations":statistics["nfev"],"Jacobian evaluations":statistics["njev"],
+            "Accepted steps":statistics["steps"],"Rejected steps":statistics["rejected"],"Minimum step (s)":statistics["min_step"],
+            "Maximum step (s)":statistics["max_step"],"Solver wall time (s)":statistics["wall_s"],"Solver status":statistics["status"]}
+
+def StepHistory(Inputs):
+    """Runs that also write their step-size history (Outputs\\Solver Steps.csv): single runs and every run of a detailed (MCDetailed) campaign. Both solvers use this."""
+    return Inputs["CheckMonteCarloUI"]==0 or Inputs["MCDetailed"]==1
+
+def Quantile(values,q):
+    """Quantile of a sorted list, interpolated as pandas does."""
+    position=(len(values)-1)*q
+    lower=int(position)
+    upper=min(lower+1,len(values)-1)
+    return values[lower]+(values[upper]-values[lower])*(position-lower)
+
+class solver_campaign:
+    """Running totals of the runs in Outputs\\Solver Statistics.csv, so updating the summary does not slow down as the campaign grows. The csv is only read back when it changed under the campaign (a new campaign removed it, or a resume pruned the interrupted runs)."""
+    def __init__(self,path):
+        self.path=path
+        self.size=None
+
+    def load(self):
+        self.runs=0
+        self.nfev_total=0
+        self.wall_total=0.0
+        self.rejected=0
+        self.steps=0
+        self.min_step=np.inf
+        self.failed=0
+        self.phase_wall={name:0.0 for name in solver_monitor.Phases}
+        """Kept sorted, for the quantiles and the outliers:"""
+        self.nfev=[]
+        self.wall=[]
+        self.costly=[]
+        if os.path.isfile(self.path)==True:
+            with open(self.path,newline="") as file1:
+                for row in csv.DictReader(file1):
+                    self.add(row)
+        self.size=os.path.getsize(self.path) if os.path.isfile(self.path)==True else 0
+
+    def add(self,row):
+        """Adds one run, as written or as read back from the csv."""
+        nfev=int(float(row["nfev"]))
+        wall=float(row["wall_s"])
+        self.runs+=1
+        self.nfev_total+=nfev
+        self.wall_total+=wall
+        self.rejected+=int(float(row["rejected"]))
+        self.steps+=int(float(row["steps"]))
+        self.min_step=min(self.min_step,float(row["min_step"]))
+        self.failed+=int(float(row["status"]))<0
+        for name in solver_monitor.Phases:
+            self.phase_wall[name]+=float(row[name+"_wall_s"])
+        bisect.insort(self.nfev,nfev)
+        bisect.insort(self.wall,wall)
+        bisect.insort(self.costly,(wall,int(float(row["Run"])),int(float(row["body_state"])),nfev))
+
+    def append(self,row):
+        if (os.path.getsize(self.path) if os.path.isfile(self.path)==True else 0)!=self.size:
+            self.load()
+        exist=os.path.isfile(self.path)
+        with open(self.path,"a",newline="") as file1:
+            writer=csv.DictWriter(file1,fieldnames=list(row))
+            if exist==False:
+                writer.writeheader()
+            writer.writerow(row)
+        self.size=os.path.getsize(self.path)
+        self.add(row)
+
+    def summary(self):
+        median=Quantile(self.wall,0.5)
+        """Runs over OutlierFactor times the median wall time, in run order:"""
+        outliers=sorted(self.costly[bisect.bisect_right(self.costly,(OutlierFactor*median,np.inf)):],key=lambda entry:entry[1]) if median>0 else []
+        return {"runs":self.runs,"nfev_total":self.nfev_total,
+                "nfev":{"median":float(Quantile(self.nfev,0.5)),"p95":float(Quantile(self.nfev,0.95)),"max":self.nfev[-1]},
+                "wall_s":{"total":self.wall_total,"median":median,"p95":Quantile(self.wall,0.95),"max":self.wall[-1]},
+                "rejected_fraction":self.rejected/max(self.rejected+self.steps,1),
+                "min_step":self.min_step,"failed_runs":self.failed,
+                "phase_wall_s":dict(self.phase_wall),
+                "outliers":[{"run":Run,"body_state":State,"wall_s":wall,"cost_vs_median":wall/median,"nfev":nfev} for wall,Run,State,nfev in outliers]}
+
+"""One solver_campaign per Outputs\\Solver Statistics.csv; only the output writer thread uses them:"""
+Campaigns={}
+
+def SolverCampaign(statistics,Directory,BodyState,Run,Detailed):
+    """Appends the run to Outputs\\Solver Statistics.csv and rewrites the campaign summary Outputs\\Solver Statistics.json. Detailed runs (see StepHistory) also write their step-size history."""
+    path=r'{}\Outputs\Solver Statistics.csv'.format(Directory)
+    row={"Run":Run,"body_state":BodyState}
+    row.update({key:value for key,value in statistics.items() if key not in ("phases","step_times","step_sizes")})
+    for name in solver_monitor.Phases:
+        phase=statistics["phases"].get(name,{})
+        row[name+"_rhs_calls"]=phase.get("rhs_calls",0)
+        row[name+"_steps"]=phase.get("steps",0)
+        row[name+"_wall_s"]=phase.get("wall_s",0.0)
+    if path not in Campaigns:
+        Campaigns[path]=solver_campaign(path)
+    Campaigns[path].append(row)
+
+    if Detailed==True:
+        pd.DataFrame({"time (s)":statistics["step_times"],"step (s)":statistics["step_sizes"]}).to_csv(r'{}\Outputs\Solver Steps.csv'.format(Directory),index=False)
+
+    summary=Campaigns[path].summary()
+    with open(r'{}\Outputs\Solver Statistics.json'.format(Directory),"w") as file1:
+        json.dump(summary,file1,indent=2)
+    return summary
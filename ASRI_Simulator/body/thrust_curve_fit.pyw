@@ -16,7 +16,8 @@ class thrust_curve:
         self.ThrustCurveFitDegree=ThrustCurveFitDegree
         self.Directory=Directory
     
-    def fit(self,time):
+    def polynomial(self):
+        """Fitted momentum thrust curve, for callers that evaluate it on every step without re-reading thrust_curve.xlsx (kernel.Tables):"""
         ThrustDataframe=pd.read_excel(r'{}\inputs\thrust_curve.xlsx'.format(self.Directory),header=0)
         ThrustDataframe.columns=['Time (s)','Momentum Thrust (N)','Exit Pressure (Pa)']
 
@@ -35,4 +36,7 @@ class thrust_curve:
         Lagu=lagu.convert()
         Lege=lege.convert()
 
-        return Cheb(time)
+        return Cheb
+
+    def fit(self,time):
+        return self.polynomial()(time)
@@ -0,0 +1,173 @@
+import os
+import json
+import warnings
+import shutil
+import numpy as np
+import pandas as pd
+
+r"""Campaign trajectory store. Detailed Monte Carlo campaigns (MCDetailed) append the full trajectory of every run to one raw array file in Outputs\Campaign\Trajectories, so they are not lost when the next run overwrites Outputs\Simulation:
+columns.json - column names and dtype, fixed by the first run
+data.bin     - one block per trajectory, column by column (so a column of a run is contiguous), back to back; the file grows in chunks of ChunkRows rows
+index.bin    - one (run, body state, first row, rows) record per stored trajectory, appended after its block is on disk
+Readers memory-map data.bin, so fetching one run is a slice and cross-run statistics only touch the pages of the columns they use. A repeated run (a resumed campaign) appends a new trajectory; the last record of a run wins. The index is read once per instance and re-read only when index.bin has grown, so looking up a run is a dictionary access."""
+
+IndexRecord=np.dtype([("run","<i8"),("state","<i8"),("offset","<i8"),("rows","<i8")])
+
+class trajectory_store:
+    ChunkRows=65536
+
+    def __init__(self,Directory):
+        self.folder=r'{}\Outputs\Campaign\Trajectories'.format(Directory)
+        self.columns_file=r'{}\columns.json'.format(self.folder)
+        self.data_file=r'{}\data.bin'.format(self.folder)
+        self.index_file=r'{}\index.bin'.format(self.folder)
+        self.columns=None
+        self.dtype=None
+        self.mapped=None
+        self.forget()
+        if os.path.isfile(self.columns_file)==True:
+            with open(self.columns_file) as file1:
+                header=json.load(file1)
+            self.columns=header["columns"]
+            self.dtype=np.dtype(header["dtype"])
+
+    def forget(self):
+        self.loaded=np.zeros(0,dtype=IndexRecord)
+        self.loaded_size=0
+        self.latest=None
+        self.positions={}
+
+    def records(self):
+        """Every index record in append order. index.bin is re-read only when it has grown (another instance, e.g. the output writer, appended)."""
+        size=os.path.getsize(self.index_file) if os.path.isfile(self.index_file)==True else 0
+        if size!=self.loaded_size:
+            count=size//IndexRecord.itemsize
+            self.loaded=np.fromfile(self.index_file,dtype=IndexRecord,count=count) if count else np.zeros(0,dtype=IndexRecord)
+            self.loaded_size=count*IndexRecord.itemsize
+            self.latest=None
+            self.mapped=None
+        return self.loaded
+
+    def append(self,Run,State,Frame):
+        """Stores one trajectory. Numeric columns only; columns missing from a later run are stored as NaN."""
+        if self.columns is None:
+            os.makedirs(self.folder,exist_ok=True)
+            self.columns=[column for column in Frame.columns if pd.api.types.is_numeric_dtype(Frame[column])]
+            single=os.environ.get("PYROPS_OUTPUT_FLOAT32","0").lower() not in ("","0","off","false","no")
+            self.dtype=np.dtype("<f4" if single else "<f8")
+            with open(self.columns_file,"w") as file1:
+                json.dump({"columns":self.columns,"dtype":self.dtype.str},file1,indent=2)
+        block=np.vstack([pd.to_numeric(Frame[column],errors="coerce").to_numpy(dtype=float) if column in Frame.columns else np.full(len(Frame),np.nan) for column in self.columns]).astype(self.dtype)
+
+        records=self.records()
+        offset=int((records["offset"]+records["rows"]).max()) if len(records) else 0
+        rowbytes=len(self.columns)*self.dtype.itemsize
+        """Rows past the last record belong to a run that crashed before its record was written and are overwritten:"""
+        with open(self.data_file,"r+b" if os.path.isfile(self.data_file) else "w+b") as file1:
+            size=os.fstat(file1.fileno()).st_size
+            if (offset+len(Frame))*rowbytes>size:
+                chunks=-(-(offset+len(Frame))//self.ChunkRows)
+                file1.truncate(chunks*self.ChunkRows*rowbytes)
+            file1.seek(offset*rowbytes)
+            file1.write(np.ascontiguousarray(block).tobytes())
+            file1.flush()
+            os.fsync(file1.fileno())
+        record=np.array([(Run,State,offset,len(Frame))],dtype=IndexRecord)
+        with open(self.index_file,"ab") as file1:
+            file1.write(record.tobytes())
+            file1.flush()
+            os.fsync(file1.fileno())
+        self.loaded=np.concatenate([records,record])
+        self.loaded_size+=IndexRecord.itemsize
+        self.latest=None
+        self.mapped=None
+
+    def index(self):
+        """Latest record of each stored run, in run order."""
+        records=self.records()
+        if self.latest is None:
+            runs,last=np.unique(records["run"][::-1],return_index=True)
+            self.latest=records[len(records)-1-last]
+            self.positions={int(run):position for position,run in enumerate(runs)}
+        return self.latest
+
+    def data(self):
+        """Read-only memory map of every stored block, as one flat array."""
+        if self.mapped is None:
+            records=self.records()
+            used=int((records["offset"]+records["rows"]).max()) if len(records) else 0
+            if used==0:
+                return np.zeros(0)
+            self.mapped=np.memmap(self.data_file,dtype=self.dtype,mode="r",shape=(used*len(self.columns),))
+        return self.mapped
+
+    def block(self,record):
+        offset,rows=int(record["offset"]),int(record["rows"])
+        return self.data()[offset*len(self.columns):(offset+rows)*len(self.columns)].reshape(len(self.columns),rows)
+
+    def record(self,Run):
+        index=self.index()
+        if int(Run) not in self.positions:
+            raise KeyError("Run {} is not in the trajectory store".format(Run))
+        return index[self.positions[int(Run)]]
+
+    def runs(self):
+        return [int(run) for run in self.index()["run"]]
+
+    def run(self,Run):
+        """Trajectory of one run as a DataFrame (columns are views of the memory map)."""
+        block=self.block(self.record(Run))
+        return pd.DataFrame({column:block[number] for number,column in enumerate(self.columns)},copy=False)
+
+    def column(self,Name,Run):
+        return self.block(self.record(Run))[self.columns.index(Name)]
+
+    def maximum(self,Name):
+        """Per-run maximum of a column (e.g. dynamic_pressure (Pa) for the max-Q distribution), as a Series by run."""
+        number=self.columns.index(Name)
+        index=self.index()
+        return pd.Series([np.nanmax(self.block(record)[number]) if record["rows"] else np.nan for record in index],index=index["run"],dtype=float)
+
+    def samples(self,Name,Times,TimeColumn="time (s)"):
+        """Values of a column at each of Times in every run, as a (runs, times) array; NaN outside a run's flight. Each run is interpolated at all times at once, reading only its time column and the rows around the requested times."""
+        number=self.columns.index(Name)
+        clock=self.columns.index(TimeColumn)
+        Times=np.atleast_1d(np.asarray(Times,dtype=float))
+        index=self.index()
+        result=np.full((len(index),len(Times)),np.nan)
+        for position,record in enumerate(index):
+            if record["rows"]==0:
+                continue
+            block=self.block(record)
+            times=block[clock]
+            upper=np.minimum(np.searchsorted(times,Times),int(record["rows"])-1)
+            lower=np.maximum(upper-1,0)
+            span=times[upper]-times[lower]
+            """Rows before the first sample have no earlier row and take the first:"""
+            weight=np.where(span>0,(Times-times[lower])/np.where(span>0,span,1),1.0)
+            values=block[number]
+            result[position]=np.where((Times<times[0])|(Times>times[-1]),np.nan,values[lower]+weight*(values[upper]-values[lower]))
+        return result
+
+    def at(self,Name,Time,TimeColumn="time (s)"):
+        """Value of a column at time Time in every run (NaN outside a run's flight), as a Series by run."""
+        return pd.Series(self.samples(Name,[Time],TimeColumn)[:,0],index=self.index()["run"])
+
+    def envelope(self,Name,Times,TimeColumn="time (s)"):
+        """Minimum, median and maximum of a column across runs at each time (e.g. the altitude envelope)."""
+        values=self.samples(Name,Times,TimeColumn).T
+        with warnings.catch_warnings():
+            """Times after every run has landed give NaN:"""
+            warnings.simplefilter("ignore",RuntimeWarning)
+            return pd.DataFrame({"time (s)":Times,"minimum":np.nanmin(values,axis=1),"median":np.nanmedian(values,axis=1),"maximum":np.nanmax(values,axis=1)})
+
+    def remove(self):
+        self.mapped=None
+        self.forget()
+        shutil.rmtree(self.folder,ignore_errors=True)
+        self.columns=None
+        self.dtype=None
+
+def StoreTrajectory(Directory,Run,State,Frame):
+    """Output writer task: opens the store when the write runs, so queued runs see the columns fixed by the first."""
+    trajectory_store(Directory).append(Run,State,Frame)
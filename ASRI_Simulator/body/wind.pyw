@@ -12,14 +12,26 @@ class wind_vector:
         self.altitude_array=altitude_array
         self.magnitude1_array=magnitude1_array
         self.magnitude2_array=magnitude2_array
+        self.height=None
 
     def interpolate(self,height):
+        """Both components and the bearing from one lookup. The RHS is evaluated several times per step at the same height, so the last result is reused."""
+        if height==self.height:
+            return self.wind_magnitude_1,self.wind_magnitude_2,self.WindAngle
         self.height=height
-        self.wind_magnitude_1=(np.interp(self.height, self.altitude_array, self.magnitude1_array))
-        self.wind_magnitude_2=(np.interp(self.height, self.altitude_array, self.magnitude2_array))
+        self.wind_magnitude_1=float(np.interp(self.height, self.altitude_array, self.magnitude1_array))
+        self.wind_magnitude_2=float(np.interp(self.height, self.altitude_array, self.magnitude2_array))
         self.WindAngle=math.atan2(self.wind_magnitude_2,self.wind_magnitude_1)
         return self.wind_magnitude_1,self.wind_magnitude_2,self.WindAngle
 
+    def interpolate_batch(self,heights):
+        """Array version of interpolate for ensembles of heights (e.g. Monte Carlo runs or a whole trajectory)."""
+        heights=np.asarray(heights,dtype=float)
+        wind_magnitude_1=np.interp(heights, self.altitude_array, self.magnitude1_array)
+        wind_magnitude_2=np.interp(heights, self.altitude_array, self.magnitude2_array)
+        WindAngle=np.arctan2(wind_magnitude_2,wind_magnitude_1)
+        return wind_magnitude_1,wind_magnitude_2,WindAngle
+
     @staticmethod
     def lookup(table):
         altitude_array_1=table.iloc[:,0].values
@@ -27,19 +39,19 @@ class wind_vector:
         magnitude_array_3=table.iloc[:,2].values
         return wind_vector(altitude_array_1,magnitude_array_2,magnitude_array_3)
 
+    @staticmethod
+    def profile(vector):
+        """North/East components of every row of wind.xlsx in one pass (bearing is counter-clockwise positive)."""
+        altitude_array=vector["altitude (m)"].to_numpy(dtype=float)
+        magnitude=vector["magnitude (m/s)"].to_numpy(dtype=float)
+        bearing=np.radians(vector["bearing (degrees)"].to_numpy(dtype=float))
+        magnitude1_array=magnitude*np.cos(bearing)
+        magnitude2_array=-magnitude*np.sin(bearing)
+        return altitude_array,magnitude1_array,magnitude2_array
+
     @staticmethod
     def coordinate_transform(vector):
-        dataframe=pd.DataFrame()
-        dataframe["altitude (m)"]=vector["altitude (m)"]
-        dataframe["magnitude1"]=0
-        dataframe["magnitude2"]=0
-        wind_counter=0
-        wind_counter_max=len(dataframe)
-        while wind_counter<(wind_counter_max-1):
-            dataframe.at[wind_counter,"magnitude1"]=vector.at[wind_counter,"magnitude (m/s)"]*math.cos(math.radians(vector.at[wind_counter,"bearing (degrees)"]))
-            dataframe.at[wind_counter,"magnitude2"]=-vector.at[wind_counter,"magnitude (m/s)"]*math.sin(math.radians(vector.at[wind_counter,"bearing (degrees)"]))
-            wind_counter+=1
-        return wind_vector.lookup(dataframe)
+        return wind_vector(*wind_vector.profile(vector))
     
     @staticmethod
     def read_excel(directory):
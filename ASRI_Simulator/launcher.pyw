@@ -844,6 +844,37 @@ def Start():
     entry209.insert(0, "{:.0f}".format(25))
     entry209.place(x=1080,y=10+33.5*22)
 
+    """Adaptive solvers: from apogee on, deployment and descent are solved with their own method and tolerances (scipy solve_ivp method name, e.g. LSODA, Radau, BDF):"""
+    label=Label(launch,text="Segment Descent at Apogee",anchor='w',width=30).place(x=895,y=10+34.5*22)
+    label=Label(launch,text="on=1 off=0",anchor='w',width=20).place(x=1300,y=10+34.5*22)
+    entry210=tk.Entry(launch,width=35,textvariable=tk.StringVar(),justify='right')
+    entry210.insert(0, "{:.0f}".format(1))
+    entry210.place(x=1080,y=10+34.5*22)
+
+    label=Label(launch,text="Descent Solver",anchor='w',width=30).place(x=895,y=10+35.5*22)
+    label=Label(launch,text="-",anchor='w',width=4).place(x=1300,y=10+35.5*22)
+    entry211=tk.Entry(launch,width=35,textvariable=tk.StringVar(),justify='right')
+    entry211.insert(0, "LSODA")
+    entry211.place(x=1080,y=10+35.5*22)
+
+    label=Label(launch,text="Descent Relative Tolerance",anchor='w',width=30).place(x=895,y=10+36.5*22)
+    label=Label(launch,text="-",anchor='w',width=4).place(x=1300,y=10+36.5*22)
+    entry212=tk.Entry(launch,width=35,textvariable=tk.StringVar(),justify='right')
+    entry212.insert(0, "{:.3f}".format(0.001))
+    entry212.place(x=1080,y=10+36.5*22)
+
+    label=Label(launch,text="Descent Absolute Tolerance",anchor='w',width=30).place(x=895,y=10+37.5*22)
+    label=Label(launch,text="-",anchor='w',width=4).place(x=1300,y=10+37.5*22)
+    entry213=tk.Entry(launch,width=35,textvariable=tk.StringVar(),justify='right')
+    entry213.insert(0, "{:.3f}".format(0.001))
+    entry213.place(x=1080,y=10+37.5*22)
+
+    label=Label(launch,text="Descent Max Step Size",anchor='w',width=30).place(x=895,y=10+38.5*22)
+    label=Label(launch,text="s",anchor='w',width=4).place(x=1300,y=10+38.5*22)
+    entry214=tk.Entry(launch,width=35,textvariable=tk.StringVar(),justify='right')
+    entry214.insert(0, "{:.3f}".format(1))
+    entry214.place(x=1080,y=10+38.5*22)
+
     entry120=tk.Entry(launch,width=33,textvariable=tk.StringVar(),justify='left')
     entry120.insert(0,(open(r"Path.txt","r").readlines()[0]))
     entry120.place(x=1130,y=5+0*22)
@@ -983,6 +1014,11 @@ def Start():
         global MCDetailed
         global ThrustHybrid
         global MaxTAOA
+        global CheckSegmented
+        global SolverDescentMethod
+        global SolverDescentRelative
+        global SolverDescentAbsolute
+        global SolverDescentTimeSizeMax
         
         TimeMax=float(entry1.get())
         TimeSize=float(entry2.get())
@@ -1121,6 +1157,11 @@ def Start():
         MCDetailed=float(entry207.get())
         ThrustHybrid=float(entry208.get())
         MaxTAOA=float(entry209.get())
+        CheckSegmented=float(entry210.get())
+        SolverDescentMethod=entry211.get().strip()
+        SolverDescentRelative=float(entry212.get())
+        SolverDescentAbsolute=float(entry213.get())
+        SolverDescentTimeSizeMax=float(entry214.get())
 
         """print(TimeMax,TimeSize,LaunchLatitude,LaunchLongitude,LaunchAltitude,LaunchElevation,LaunchAzimuth,RocketBodyRadius,RocketBodyLength,LaunchRailLength,NozzleExitArea,ThrustPolynomialDegree,MissileDATCOMCards,SolidWorksMass,SolidWorksCOMx,SolidWorksCOMy,SolidWorksCOMz,SolidWorksMOIx,SolidWorksMOIy,SolidWorksMOIz,TimeBurn,FuelDensity,FuelRadius,FuelThickness,FuelThicknessInitial,FuelCOM,FuelLength,ParachuteCD,ParachuteDiameter,ParachuteDelay,NoseMass,NoseCOMx,NoseCOMy,NoseCOMz,NoseMOIx,NoseMOIy,NoseMOIz,BoosterMass,BoosterCOMx,BoosterCOMy,BoosterCOMz,BoosterMOIx,BoosterMOIy,BoosterMOIz,NumberRuns,LaunchElevationLower,LaunchElevationUpper,LaunchAzimuthLower,LaunchAzimuthUpper,ThrustMisalignmentYawLower,ThrustMisalignmentYawUpper,ThrustMisalignmentPitchLower,ThrustMisalignmentPitchUpper,ThrustMagnitudeLower,ThrustMagnitudeUpper,TimeBurnLower,TimeBurnUpper,WindMagnitudeLower,WindMagnitudeUpper,WindDirectionLower,WindDirectionUpper,AerodynamicDragLower,AerodynamicDragUpper,AerodynamicLiftLower,AerodynamicLiftUpper,AerodynamicMomentLower,AerodynamicMomentUpper,CentreOfPressureLower,CentreOfPressuerUpper,FinCantAngleLower,FinCantAngleUpper,LaunchAltitudeLower,LaunchAltitudeUpper,CalculatorTimeSize,OxidiserDensity,OxidiserRadius,OxidiserLength,OxidiserLengthInitial,OxidiserCOM,TimeBurnFuel,NumberStages,StageTime,StageDelay,StageMass,StageCOMx,StageCOMy,StageCOMz,StageMOIx,StageMOIy,StageMOIz,NoseRadius,NoseLength,FinRootChord,FinTipChord,FinSweep,FinSpan,FinLocation,FinSpanRoot,FinCantAngle,CheckTurbulence,Check4in1,CheckStaging,CheckThrust,CheckRollControl,CheckStream,CheckOrder2,CheckOrder4,CheckOrder8,SolverRelative,SolverAbsolute,SolverTimeSizeFirst,SolverTimeSizeMax,RollControlLower,RollControlUpper,RollControlFrequency,RollControlForce,GraphicScale,TrajectoryResolution,Directory)"""
 
@@ -1403,6 +1444,18 @@ def Start():
             entry208.insert(0, " {:.0f}".format(LoadInputs.at[0,"ThrustHybrid"]))
             entry209.delete(1,END)
             entry209.insert(0, " {:.0f}".format(LoadInputs.at[0,"MaxTAOA"]))
+            """Settings saved before the descent solver settings keep the launcher defaults:"""
+            if "Descent Solver" in LoadInputs.columns:
+                entry210.delete(1,END)
+                entry210.insert(0, " {:.0f}".format(LoadInputs.at[0,"Segment Descent at Apogee"]))
+                entry211.delete(0,END)
+                entry211.insert(0, "{}".format(LoadInputs.at[0,"Descent Solver"]))
+                entry212.delete(1,END)
+                entry212.insert(0, " {:.6f}".format(LoadInputs.at[0,"Descent Relative Tolerance"]))
+                entry213.delete(1,END)
+                entry213.insert(0, " {:.6f}".format(LoadInputs.at[0,"Descent Absolute Tolerance"]))
+                entry214.delete(1,END)
+                entry214.insert(0, " {:.3f}".format(LoadInputs.at[0,"Descent Max Step Size"]))
         
         Load()
         Load()
@@ -1543,9 +1596,14 @@ def Start():
         Lug=float(entry204.get())
         ThrustHybrid=float(entry208.get())
         MaxTAOA=float(entry209.get())
-        SaveColumns=["Maximum Simulation Time","Time Step Size","Launch Latitude","Launch Longitude","Launch Altitude","Launch Elevation","Launch Azimuth","Rocket Body Radius","Rocket Body Length","Launch Rail Length","Nozzle Exit Area","Thrust Polynomial Degree","MissileDATCOM Cards","SolidWorks Mass","SolidWorks COMx","SolidWorks COMy","SolidWorks COMz","SolidWorks MOIx","SolidWorks MOIy","SolidWorks MOIz","Time Burn","Density Fuel","Radius Fuel","Thickness Fuel","Thickness Fuel Initial","COM Fuel","Length Fuel","CD Parachute","Diameter Parachute","Parachute Deployment Delay","Mass Nose Separated","COMx Nose Separated","COMy Nose Separated","COMz Nose Separated","MOIx Nose Separated","MOIy Nose Separated","MOIz Nose Separated","Mass Booster Separated","COMx Booster Separated","COMy Booster Separated","COMz Booster Separated","MOIx Booster Separated","MOIy Booster Separated","MOIz Booster Separated","Number Runs","Launch Elevation Uncertainty Lower","Launch Elevation Uncertainty Upper","Launch Azimuth Uncertainty Lower","Launch Azimuth Uncertainty Upper","Thrust Misalignment (Yaw) Uncertainty Lower","Thrust Misalignment (Yaw) Uncertainty Upper","Thrust Misalignment (Pitch) Uncertainty Lower","Thrust Misalignment (Pitch) Uncertainty Upper","Thrust Magnitude Lower","Thrust Magnitude Upper","Burn Time Uncertainty Lower","Burn Time Uncertainty Upper","Wind Magnitude Uncertainty Lower","Wind Magnitude Uncertainty Upper","Wind Direction Uncertainty Lower","Wind Direction Uncertainty Upper","Aerodynamic Drag Uncertainty Lower","Aerodynamic Drag Uncertainty Upper","Aerodynamic Lift Uncertainty Lower","Aerodynamic Lift Uncertainty Upper","Aerodynamic Moment Uncertainty Lower","Aerodynamic Moment Uncertainty Upper","Centre of Pressure Uncertainty Lower","Centre of Pressure Uncertainty Upper","Fin Cant Angle Uncertainty Lower","Fin Cant Angle Uncertainty Upper","Launch Altitude Uncertainty Lower","Launch Altitude Uncertainty Upper","Calculator Step Size","Density Oxidiser","Radius Oxidiser","Length Oxidiser","Length Oxidiser Initial","COM Oxidiser","Time Burn Fuel","Number Stages","Stage Separation Time","Stage Separation Delay","Mass Stage Separated","COMx Stage Separated","COMy Stage Separated","COMz Stage Separated","MOIx Stage Separated","MOIy Stage Separated","MOIz Stage Separated","Nosecone Radius","Nosecone Length","Fin Root Chord","Fin Tip Chord","Fin Sweep","Fin Span","Fin Location","Fin Root Span","Fin Cant Angle","WGS Earth Model","Wind Turbulence","4-in-1 Simulation","Staging","Thrust Curve Fit","Roll Control","Monte Carlo UI Input","Stream Full Output","2nd Order Solver","4th Order Solver","8th Order Solver","Relative Tolerance","Absolute Tolerance","First Step Size","Maximum Step Size","Roll Rate Threshold Lower","Roll Rate Threshold Upper","Thrust Pulse Frequency","Thrust Force","OpenGL Graphic Scale","OpenGL Trajectory Resolution","Directory","Roll Control Time Initial","Roll Control Time Final","CD Drogue","Diameter Drogue","Drogue Deployment Delay","State","NoseCD","BoosterCD","CombinedCD","MCDetailed","CheckMonteCarloUI","Lug","ThrustHybrid","MaxTAOA"]
+        CheckSegmented=float(entry210.get())
+        SolverDescentMethod=entry211.get().strip()
+        SolverDescentRelative=float(entry212.get())
+        SolverDescentAbsolute=float(entry213.get())
+        SolverDescentTimeSizeMax=float(entry214.get())
+        SaveColumns=["Maximum Simulation Time","Time Step Size","Launch Latitude","Launch Longitude","Launch Altitude","Launch Elevation","Launch Azimuth","Rocket Body Radius","Rocket Body Length","Launch Rail Length","Nozzle Exit Area","Thrust Polynomial Degree","MissileDATCOM Cards","SolidWorks Mass","SolidWorks COMx","SolidWorks COMy","SolidWorks COMz","SolidWorks MOIx","SolidWorks MOIy","SolidWorks MOIz","Time Burn","Density Fuel","Radius Fuel","Thickness Fuel","Thickness Fuel Initial","COM Fuel","Length Fuel","CD Parachute","Diameter Parachute","Parachute Deployment Delay","Mass Nose Separated","COMx Nose Separated","COMy Nose Separated","COMz Nose Separated","MOIx Nose Separated","MOIy Nose Separated","MOIz Nose Separated","Mass Booster Separated","COMx Booster Separated","COMy Booster Separated","COMz Booster Separated","MOIx Booster Separated","MOIy Booster Separated","MOIz Booster Separated","Number Runs","Launch Elevation Uncertainty Lower","Launch Elevation Uncertainty Upper","Launch Azimuth Uncertainty Lower","Launch Azimuth Uncertainty Upper","Thrust Misalignment (Yaw) Uncertainty Lower","Thrust Misalignment (Yaw) Uncertainty Upper","Thrust Misalignment (Pitch) Uncertainty Lower","Thrust Misalignment (Pitch) Uncertainty Upper","Thrust Magnitude Lower","Thrust Magnitude Upper","Burn Time Uncertainty Lower","Burn Time Uncertainty Upper","Wind Magnitude Uncertainty Lower","Wind Magnitude Uncertainty Upper","Wind Direction Uncertainty Lower","Wind Direction Uncertainty Upper","Aerodynamic Drag Uncertainty Lower","Aerodynamic Drag Uncertainty Upper","Aerodynamic Lift Uncertainty Lower","Aerodynamic Lift Uncertainty Upper","Aerodynamic Moment Uncertainty Lower","Aerodynamic Moment Uncertainty Upper","Centre of Pressure Uncertainty Lower","Centre of Pressure Uncertainty Upper","Fin Cant Angle Uncertainty Lower","Fin Cant Angle Uncertainty Upper","Launch Altitude Uncertainty Lower","Launch Altitude Uncertainty Upper","Calculator Step Size","Density Oxidiser","Radius Oxidiser","Length Oxidiser","Length Oxidiser Initial","COM Oxidiser","Time Burn Fuel","Number Stages","Stage Separation Time","Stage Separation Delay","Mass Stage Separated","COMx Stage Separated","COMy Stage Separated","COMz Stage Separated","MOIx Stage Separated","MOIy Stage Separated","MOIz Stage Separated","Nosecone Radius","Nosecone Length","Fin Root Chord","Fin Tip Chord","Fin Sweep","Fin Span","Fin Location","Fin Root Span","Fin Cant Angle","WGS Earth Model","Wind Turbulence","4-in-1 Simulation","Staging","Thrust Curve Fit","Roll Control","Monte Carlo UI Input","Stream Full Output","2nd Order Solver","4th Order Solver","8th Order Solver","Relative Tolerance","Absolute Tolerance","First Step Size","Maximum Step Size","Roll Rate Threshold Lower","Roll Rate Threshold Upper","Thrust Pulse Frequency","Thrust Force","OpenGL Graphic Scale","OpenGL Trajectory Resolution","Directory","Roll Control Time Initial","Roll Control Time Final","CD Drogue","Diameter Drogue","Drogue Deployment Delay","State","NoseCD","BoosterCD","CombinedCD","MCDetailed","CheckMonteCarloUI","Lug","ThrustHybrid","MaxTAOA","Segment Descent at Apogee","Descent Solver","Descent Relative Tolerance","Descent Absolute Tolerance","Descent Max Step Size"]
         SaveInputs=pd.DataFrame(columns=SaveColumns)
-        SaveInputs.loc[1]=TimeMax,TimeSize,LaunchLatitude,LaunchLongitude,LaunchAltitude,LaunchElevation,LaunchAzimuth,RocketBodyRadius,RocketBodyLength,LaunchRailLength,NozzleExitArea,ThrustPolynomialDegree,MissileDATCOMCards,SolidWorksMass,SolidWorksCOMx,SolidWorksCOMy,SolidWorksCOMz,SolidWorksMOIx,SolidWorksMOIy,SolidWorksMOIz,TimeBurn,FuelDensity,FuelRadius,FuelThickness,FuelThicknessInitial,FuelCOM,FuelLength,ParachuteCD,ParachuteDiameter,ParachuteDelay,NoseMass,NoseCOMx,NoseCOMy,NoseCOMz,NoseMOIx,NoseMOIy,NoseMOIz,BoosterMass,BoosterCOMx,BoosterCOMy,BoosterCOMz,BoosterMOIx,BoosterMOIy,BoosterMOIz,NumberRuns,LaunchElevationLower,LaunchElevationUpper,LaunchAzimuthLower,LaunchAzimuthUpper,ThrustMisalignmentYawLower,ThrustMisalignmentYawUpper,ThrustMisalignmentPitchLower,ThrustMisalignmentPitchUpper,ThrustMagnitudeLower,ThrustMagnitudeUpper,TimeBurnLower,TimeBurnUpper,WindMagnitudeLower,WindMagnitudeUpper,WindDirectionLower,WindDirectionUpper,AerodynamicDragLower,AerodynamicDragUpper,AerodynamicLiftLower,AerodynamicLiftUpper,AerodynamicMomentLower,AerodynamicMomentUpper,CentreOfPressureLower,CentreOfPressuerUpper,FinCantAngleLower,FinCantAngleUpper,LaunchAltitudeLower,LaunchAltitudeUpper,CalculatorTimeSize,OxidiserDensity,OxidiserRadius,OxidiserLength,OxidiserLengthInitial,OxidiserCOM,TimeBurnFuel,NumberStages,StageTime,StageDelay,StageMass,StageCOMx,StageCOMy,StageCOMz,StageMOIx,StageMOIy,StageMOIz,NoseRadius,NoseLength,FinRootChord,FinTipChord,FinSweep,FinSpan,FinLocation,FinSpanRoot,FinCantAngle,CheckEarthModelWGS,CheckTurbulence,Check4in1,CheckStaging,CheckThrust,CheckRollControl,CheckMonteCarloUI,CheckStream,CheckOrder2,CheckOrder4,CheckOrder8,SolverRelative,SolverAbsolute,SolverTimeSizeFirst,SolverTimeSizeMax,RollControlLower,RollControlUpper,RollControlFrequency,RollControlForce,GraphicScale,TrajectoryResolution,Directory,RollControlTimeInitial,RollControlTimeFinal,DrogueCD,DrogueDiameter,DrogueDelay,State,NoseCD,BoosterCD,CombinedCD,MCDetailed,CheckMonteCarloUI,Lug,ThrustHybrid,MaxTAOA
+        SaveInputs.loc[1]=TimeMax,TimeSize,LaunchLatitude,LaunchLongitude,LaunchAltitude,LaunchElevation,LaunchAzimuth,RocketBodyRadius,RocketBodyLength,LaunchRailLength,NozzleExitArea,ThrustPolynomialDegree,MissileDATCOMCards,SolidWorksMass,SolidWorksCOMx,SolidWorksCOMy,SolidWorksCOMz,SolidWorksMOIx,SolidWorksMOIy,SolidWorksMOIz,TimeBurn,FuelDensity,FuelRadius,FuelThickness,FuelThicknessInitial,FuelCOM,FuelLength,ParachuteCD,ParachuteDiameter,ParachuteDelay,NoseMass,NoseCOMx,NoseCOMy,NoseCOMz,NoseMOIx,NoseMOIy,NoseMOIz,BoosterMass,BoosterCOMx,BoosterCOMy,BoosterCOMz,BoosterMOIx,BoosterMOIy,BoosterMOIz,NumberRuns,LaunchElevationLower,LaunchElevationUpper,LaunchAzimuthLower,LaunchAzimuthUpper,ThrustMisalignmentYawLower,ThrustMisalignmentYawUpper,ThrustMisalignmentPitchLower,ThrustMisalignmentPitchUpper,ThrustMagnitudeLower,ThrustMagnitudeUpper,TimeBurnLower,TimeBurnUpper,WindMagnitudeLower,WindMagnitudeUpper,WindDirectionLower,WindDirectionUpper,AerodynamicDragLower,AerodynamicDragUpper,AerodynamicLiftLower,AerodynamicLiftUpper,AerodynamicMomentLower,AerodynamicMomentUpper,CentreOfPressureLower,CentreOfPressuerUpper,FinCantAngleLower,FinCantAngleUpper,LaunchAltitudeLower,LaunchAltitudeUpper,CalculatorTimeSize,OxidiserDensity,OxidiserRadius,OxidiserLength,OxidiserLengthInitial,OxidiserCOM,TimeBurnFuel,NumberStages,StageTime,StageDelay,StageMass,StageCOMx,StageCOMy,StageCOMz,StageMOIx,StageMOIy,StageMOIz,NoseRadius,NoseLength,FinRootChord,FinTipChord,FinSweep,FinSpan,FinLocation,FinSpanRoot,FinCantAngle,CheckEarthModelWGS,CheckTurbulence,Check4in1,CheckStaging,CheckThrust,CheckRollControl,CheckMonteCarloUI,CheckStream,CheckOrder2,CheckOrder4,CheckOrder8,SolverRelative,SolverAbsolute,SolverTimeSizeFirst,SolverTimeSizeMax,RollControlLower,RollControlUpper,RollControlFrequency,RollControlForce,GraphicScale,TrajectoryResolution,Directory,RollControlTimeInitial,RollControlTimeFinal,DrogueCD,DrogueDiameter,DrogueDelay,State,NoseCD,BoosterCD,CombinedCD,MCDetailed,CheckMonteCarloUI,Lug,ThrustHybrid,MaxTAOA,CheckSegmented,SolverDescentMethod,SolverDescentRelative,SolverDescentAbsolute,SolverDescentTimeSizeMax
         with open(r"Path.txt") as file:
             directory=file.read()
         SaveInputs.to_excel(r'{}\Inputs\Settings.xlsx'.format(directory),columns=SaveColumns,index=False)
@@ -1637,14 +1695,20 @@ def Start():
         Wind.to_excel(r'{}\Inputs\wind.xlsx'.format(Directory),index=False)
         print("PyROPS wind file created.")
 
+    def ExportExcelOutputs():
+        """Excel copies of the Arrow/Parquet output tables (PYROPS_OUTPUT=excel writes workbooks directly):"""
+        bulk.Writer.flush()
+        Workbooks=bulk.ExportOutputs(entry120.get())
+        print("{} output tables exported to Excel in {}\\Outputs.".format(len(Workbooks),entry120.get()))
+
     def Simulate():
         def Directory(**kwargs):
             return kwargs
 
-        Inputs=Directory(TimeMax=float(entry1.get()),TimeSize=float(entry2.get()),LaunchLatitude=float(entry3.get()),LaunchLongitude=float(entry4.get()),LaunchAltitude=float(entry5.get()),LaunchElevation=float(entry6.get()),LaunchAzimuth=float(entry7.get()),RocketBodyRadius=float(entry8.get()),RocketBodyLength=float(entry9.get()),LaunchRailLength=float(entry10.get()),NozzleExitArea=float(entry11.get()),ThrustPolynomialDegree=float(entry12.get()),MissileDATCOMCards=float(entry13.get()),SolidWorksMass=float(entry14.get()),SolidWorksCOMx=float(entry15.get()),SolidWorksCOMy=float(entry16.get()),SolidWorksCOMz=float(entry17.get()),SolidWorksMOIx=float(entry18.get()),SolidWorksMOIy=float(entry19.get()),SolidWorksMOIz=float(entry20.get()),TimeBurn=float(entry21.get()),FuelDensity=float(entry22.get()),FuelRadius=float(entry23.get()),FuelThickness=float(entry24.get()),FuelThicknessInitial=float(entry25.get()),FuelCOM=float(entry26.get()),FuelLength=float(entry27.get()),ParachuteCD=float(entry28.get()),ParachuteDiameter=float(entry29.get()),ParachuteDelay=float(entry30.get()),NoseMass=float(entry31.get()),NoseCOMx=float(entry32.get()),NoseCOMy=float(entry33.get()),NoseCOMz=float(entry34.get()),NoseMOIx=float(entry35.get()),NoseMOIy=float(entry36.get()),NoseMOIz=float(entry37.get()),BoosterMass=float(entry38.get()),BoosterCOMx=float(entry39.get()),BoosterCOMy=float(entry40.get()),BoosterCOMz=float(entry41.get()),BoosterMOIx=float(entry42.get()),BoosterMOIy=float(entry43.get()),BoosterMOIz=float(entry44.get()),NumberRuns=float(entry45.get()),LaunchElevationLower=float(entry46.get()),LaunchElevationUpper=float(entry47.get()),LaunchAzimuthLower=float(entry48.get()),LaunchAzimuthUpper=float(entry49.get()),ThrustMisalignmentYawLower=float(entry50.get()),ThrustMisalignmentYawUpper=float(entry51.get()),ThrustMisalignmentPitchLower=float(entry52.get()),ThrustMisalignmentPitchUpper=float(entry53.get()),ThrustMagnitudeLower=float(entry54.get()),ThrustMagnitudeUpper=float(entry55.get()),TimeBurnLower=float(entry56.get()),TimeBurnUpper=float(entry57.get()),WindMagnitudeLower=float(entry58.get()),WindMagnitudeUpper=float(entry59.get()),WindDirectionLower=float(entry60.get()),WindDirectionUpper=float(entry61.get()),AerodynamicDragLower=float(entry62.get()),AerodynamicDragUpper=float(entry63.get()),AerodynamicLiftLower=float(entry64.get()),AerodynamicLiftUpper=float(entry65.get()),AerodynamicMomentLower=float(entry66.get()),AerodynamicMomentUpper=float(entry67.get()),CentreOfPressureLower=float(entry68.get()),CentreOfPressuerUpper=float(entry69.get()),FinCantAngleLower=float(entry70.get()),FinCantAngleUpper=float(entry71.get()),LaunchAltitudeLower=float(entry72.get()),LaunchAltitudeUpper=float(entry73.get()),CalculatorTimeSize=float(entry74.get()),OxidiserDensity=float(entry75.get()),OxidiserRadius=float(entry76.get()),OxidiserLength=float(entry77.get()),OxidiserLengthInitial=float(entry78.get()),OxidiserCOM=float(entry79.get()),TimeBurnFuel=float(entry80.get()),NumberStages=float(entry81.get()),StageTime=float(entry82.get()),StageDelay=float(entry83.get()),StageMass=float(entry84.get()),StageCOMx=float(entry85.get()),StageCOMy=float(entry86.get()),StageCOMz=float(entry87.get()),StageMOIx=float(entry88.get()),StageMOIy=float(entry89.get()),StageMOIz=float(entry90.get()),NoseRadius=float(entry91.get()),NoseLength=float(entry92.get()),FinRootChord=float(entry93.get()),FinTipChord=float(entry94.get()),FinSweep=float(entry95.get()),FinSpan=float(entry96.get()),FinLocation=float(entry97.get()),FinSpanRoot=float(entry98.get()),FinCantAngle=float(entry99.get()),CheckEarthModelWGS=float(entry205.get()),CheckTurbulence=float(entry100.get()),Check4in1=float(entry101.get()),CheckStaging=float(entry102.get()),CheckThrust=float(entry103.get()),CheckRollControl=float(entry104.get()),CheckMonteCarloUI=float(entry200.get()),CheckStream=float(entry106.get()),CheckOrder2=float(entry107.get()),CheckOrder4=float(entry108.get()),CheckOrder8=float(entry109.get()),SolverRelative=float(entry110.get()),SolverAbsolute=float(entry111.get()),SolverTimeSizeFirst=float(entry112.get()),SolverTimeSizeMax=float(entry113.get()),RollControlLower=float(entry114.get()),RollControlUpper=float(entry115.get()),RollControlFrequency=float(entry116.get()),RollControlForce=float(entry117.get()),GraphicScale=float(entry118.get()),TrajectoryResolution=float(entry119.get()),Directory=entry120.get(),RollControlTimeInitial=float(entry121.get()),RollControlTimeFinal=float(entry122.get()),DrogueCD=float(entry123.get()),DrogueDiameter=float(entry124.get()),DrogueDelay=float(entry125.get()),NoseCD=float(entry202.get()),BoosterCD=float(entry203.get()),CombinedCD=float(entry206.get()),MCDetailed=float(entry207.get()),Lug=float(entry204.get()),ThrustHybrid=float(entry208.get()),MaxTAOA=float(entry209.get()))
+        Inputs=Directory(TimeMax=float(entry1.get()),TimeSize=float(entry2.get()),LaunchLatitude=float(entry3.get()),LaunchLongitude=float(entry4.get()),LaunchAltitude=float(entry5.get()),LaunchElevation=float(entry6.get()),LaunchAzimuth=float(entry7.get()),RocketBodyRadius=float(entry8.get()),RocketBodyLength=float(entry9.get()),LaunchRailLength=float(entry10.get()),NozzleExitArea=float(entry11.get()),ThrustPolynomialDegree=float(entry12.get()),MissileDATCOMCards=float(entry13.get()),SolidWorksMass=float(entry14.get()),SolidWorksCOMx=float(entry15.get()),SolidWorksCOMy=float(entry16.get()),SolidWorksCOMz=float(entry17.get()),SolidWorksMOIx=float(entry18.get()),SolidWorksMOIy=float(entry19.get()),SolidWorksMOIz=float(entry20.get()),TimeBurn=float(entry21.get()),FuelDensity=float(entry22.get()),FuelRadius=float(entry23.get()),FuelThickness=float(entry24.get()),FuelThicknessInitial=float(entry25.get()),FuelCOM=float(entry26.get()),FuelLength=float(entry27.get()),ParachuteCD=float(entry28.get()),ParachuteDiameter=float(entry29.get()),ParachuteDelay=float(entry30.get()),NoseMass=float(entry31.get()),NoseCOMx=float(entry32.get()),NoseCOMy=float(entry33.get()),NoseCOMz=float(entry34.get()),NoseMOIx=float(entry35.get()),NoseMOIy=float(entry36.get()),NoseMOIz=float(entry37.get()),BoosterMass=float(entry38.get()),BoosterCOMx=float(entry39.get()),BoosterCOMy=float(entry40.get()),BoosterCOMz=float(entry41.get()),BoosterMOIx=float(entry42.get()),BoosterMOIy=float(entry43.get()),BoosterMOIz=float(entry44.get()),NumberRuns=float(entry45.get()),LaunchElevationLower=float(entry46.get()),LaunchElevationUpper=float(entry47.get()),LaunchAzimuthLower=float(entry48.get()),LaunchAzimuthUpper=float(entry49.get()),ThrustMisalignmentYawLower=float(entry50.get()),ThrustMisalignmentYawUpper=float(entry51.get()),ThrustMisalignmentPitchLower=float(entry52.get()),ThrustMisalignmentPitchUpper=float(entry53.get()),ThrustMagnitudeLower=float(entry54.get()),ThrustMagnitudeUpper=float(entry55.get()),TimeBurnLower=float(entry56.get()),TimeBurnUpper=float(entry57.get()),WindMagnitudeLower=float(entry58.get()),WindMagnitudeUpper=float(entry59.get()),WindDirectionLower=float(entry60.get()),WindDirectionUpper=float(entry61.get()),AerodynamicDragLower=float(entry62.get()),AerodynamicDragUpper=float(entry63.get()),AerodynamicLiftLower=float(entry64.get()),AerodynamicLiftUpper=float(entry65.get()),AerodynamicMomentLower=float(entry66.get()),AerodynamicMomentUpper=float(entry67.get()),CentreOfPressureLower=float(entry68.get()),CentreOfPressuerUpper=float(entry69.get()),FinCantAngleLower=float(entry70.get()),FinCantAngleUpper=float(entry71.get()),LaunchAltitudeLower=float(entry72.get()),LaunchAltitudeUpper=float(entry73.get()),CalculatorTimeSize=float(entry74.get()),OxidiserDensity=float(entry75.get()),OxidiserRadius=float(entry76.get()),OxidiserLength=float(entry77.get()),OxidiserLengthInitial=float(entry78.get()),OxidiserCOM=float(entry79.get()),TimeBurnFuel=float(entry80.get()),NumberStages=float(entry81.get()),StageTime=float(entry82.get()),StageDelay=float(entry83.get()),StageMass=float(entry84.get()),StageCOMx=float(entry85.get()),StageCOMy=float(entry86.get()),StageCOMz=float(entry87.get()),StageMOIx=float(entry88.get()),StageMOIy=float(entry89.get()),StageMOIz=float(entry90.get()),NoseRadius=float(entry91.get()),NoseLength=float(entry92.get()),FinRootChord=float(entry93.get()),FinTipChord=float(entry94.get()),FinSweep=float(entry95.get()),FinSpan=float(entry96.get()),FinLocation=float(entry97.get()),FinSpanRoot=float(entry98.get()),FinCantAngle=float(entry99.get()),CheckEarthModelWGS=float(entry205.get()),CheckTurbulence=float(entry100.get()),Check4in1=float(entry101.get()),CheckStaging=float(entry102.get()),CheckThrust=float(entry103.get()),CheckRollControl=float(entry104.get()),CheckMonteCarloUI=float(entry200.get()),CheckStream=float(entry106.get()),CheckOrder2=float(entry107.get()),CheckOrder4=float(entry108.get()),CheckOrder8=float(entry109.get()),SolverRelative=float(entry110.get()),SolverAbsolute=float(entry111.get()),SolverTimeSizeFirst=float(entry112.get()),SolverTimeSizeMax=float(entry113.get()),RollControlLower=float(entry114.get()),RollControlUpper=float(entry115.get()),RollControlFrequency=float(entry116.get()),RollControlForce=float(entry117.get()),GraphicScale=float(entry118.get()),TrajectoryResolution=float(entry119.get()),Directory=entry120.get(),RollControlTimeInitial=float(entry121.get()),RollControlTimeFinal=float(entry122.get()),DrogueCD=float(entry123.get()),DrogueDiameter=float(entry124.get()),DrogueDelay=float(entry125.get()),NoseCD=float(entry202.get()),BoosterCD=float(entry203.get()),CombinedCD=float(entry206.get()),MCDetailed=float(entry207.get()),Lug=float(entry204.get()),ThrustHybrid=float(entry208.get()),MaxTAOA=float(entry209.get()),CheckSegmented=float(entry210.get()),SolverDescentMethod=entry211.get().strip(),SolverDescentRelative=float(entry212.get()),SolverDescentAbsolute=float(entry213.get()),SolverDescentTimeSizeMax=float(entry214.get()))
         CheckMonteCarloUI=float(entry200.get())
         if CheckMonteCarloUI==0:
-            Inputs=Directory(TimeMax=float(entry1.get()),TimeSize=float(entry2.get()),LaunchLatitude=float(entry3.get()),LaunchLongitude=float(entry4.get()),LaunchAltitude=float(entry5.get()),LaunchElevation=float(entry6.get()),LaunchAzimuth=float(entry7.get()),RocketBodyRadius=float(entry8.get()),RocketBodyLength=float(entry9.get()),LaunchRailLength=float(entry10.get()),NozzleExitArea=float(entry11.get()),ThrustPolynomialDegree=float(entry12.get()),MissileDATCOMCards=float(entry13.get()),SolidWorksMass=float(entry14.get()),SolidWorksCOMx=float(entry15.get()),SolidWorksCOMy=float(entry16.get()),SolidWorksCOMz=float(entry17.get()),SolidWorksMOIx=float(entry18.get()),SolidWorksMOIy=float(entry19.get()),SolidWorksMOIz=float(entry20.get()),TimeBurn=float(entry21.get()),FuelDensity=float(entry22.get()),FuelRadius=float(entry23.get()),FuelThickness=float(entry24.get()),FuelThicknessInitial=float(entry25.get()),FuelCOM=float(entry26.get()),FuelLength=float(entry27.get()),ParachuteCD=float(entry28.get()),ParachuteDiameter=float(entry29.get()),ParachuteDelay=float(entry30.get()),NoseMass=float(entry31.get()),NoseCOMx=float(entry32.get()),NoseCOMy=float(entry33.get()),NoseCOMz=float(entry34.get()),NoseMOIx=float(entry35.get()),NoseMOIy=float(entry36.get()),NoseMOIz=float(entry37.get()),BoosterMass=float(entry38.get()),BoosterCOMx=float(entry39.get()),BoosterCOMy=float(entry40.get()),BoosterCOMz=float(entry41.get()),BoosterMOIx=float(entry42.get()),BoosterMOIy=float(entry43.get()),BoosterMOIz=float(entry44.get()),NumberRuns=float(1),LaunchElevationLower=float(entry46.get()),LaunchElevationUpper=float(entry47.get()),LaunchAzimuthLower=float(entry48.get()),LaunchAzimuthUpper=float(entry49.get()),ThrustMisalignmentYawLower=float(entry50.get()),ThrustMisalignmentYawUpper=float(entry51.get()),ThrustMisalignmentPitchLower=float(entry52.get()),ThrustMisalignmentPitchUpper=float(entry53.get()),ThrustMagnitudeLower=float(entry54.get()),ThrustMagnitudeUpper=float(entry55.get()),TimeBurnLower=float(entry56.get()),TimeBurnUpper=float(entry57.get()),WindMagnitudeLower=float(entry58.get()),WindMagnitudeUpper=float(entry59.get()),WindDirectionLower=float(entry60.get()),WindDirectionUpper=float(entry61.get()),AerodynamicDragLower=float(entry62.get()),AerodynamicDragUpper=float(entry63.get()),AerodynamicLiftLower=float(entry64.get()),AerodynamicLiftUpper=float(entry65.get()),AerodynamicMomentLower=float(entry66.get()),AerodynamicMomentUpper=float(entry67.get()),CentreOfPressureLower=float(entry68.get()),CentreOfPressuerUpper=float(entry69.get()),FinCantAngleLower=float(entry70.get()),FinCantAngleUpper=float(entry71.get()),LaunchAltitudeLower=float(entry72.get()),LaunchAltitudeUpper=float(entry73.get()),CalculatorTimeSize=float(entry74.get()),OxidiserDensity=float(entry75.get()),OxidiserRadius=float(entry76.get()),OxidiserLength=float(entry77.get()),OxidiserLengthInitial=float(entry78.get()),OxidiserCOM=float(entry79.get()),TimeBurnFuel=float(entry80.get()),NumberStages=float(entry81.get()),StageTime=float(entry82.get()),StageDelay=float(entry83.get()),StageMass=float(entry84.get()),StageCOMx=float(entry85.get()),StageCOMy=float(entry86.get()),StageCOMz=float(entry87.get()),StageMOIx=float(entry88.get()),StageMOIy=float(entry89.get()),StageMOIz=float(entry90.get()),NoseRadius=float(entry91.get()),NoseLength=float(entry92.get()),FinRootChord=float(entry93.get()),FinTipChord=float(entry94.get()),FinSweep=float(entry95.get()),FinSpan=float(entry96.get()),FinLocation=float(entry97.get()),FinSpanRoot=float(entry98.get()),FinCantAngle=float(entry99.get()),CheckEarthModelWGS=float(entry205.get()),CheckTurbulence=float(entry100.get()),Check4in1=float(entry101.get()),CheckStaging=float(entry102.get()),CheckThrust=float(entry103.get()),CheckRollControl=float(entry104.get()),CheckMonteCarloUI=float(entry200.get()),CheckStream=float(entry106.get()),CheckOrder2=float(entry107.get()),CheckOrder4=float(entry108.get()),CheckOrder8=float(entry109.get()),SolverRelative=float(entry110.get()),SolverAbsolute=float(entry111.get()),SolverTimeSizeFirst=float(entry112.get()),SolverTimeSizeMax=float(entry113.get()),RollControlLower=float(entry114.get()),RollControlUpper=float(entry115.get()),RollControlFrequency=float(entry116.get()),RollControlForce=float(entry117.get()),GraphicScale=float(entry118.get()),TrajectoryResolution=float(entry119.get()),Directory=entry120.get(),RollControlTimeInitial=float(entry121.get()),RollControlTimeFinal=float(entry122.get()),DrogueCD=float(entry123.get()),DrogueDiameter=float(entry124.get()),DrogueDelay=float(entry125.get()),NoseCD=float(entry202.get()),BoosterCD=float(entry203.get()),CombinedCD=float(entry206.get()),MCDetailed=float(entry207.get()),Lug=float(entry204.get()),ThrustHybrid=float(entry208.get()),MaxTAOA=float(entry209.get()))
+            Inputs=Directory(TimeMax=float(entry1.get()),TimeSize=float(entry2.get()),LaunchLatitude=float(entry3.get()),LaunchLongitude=float(entry4.get()),LaunchAltitude=float(entry5.get()),LaunchElevation=float(entry6.get()),LaunchAzimuth=float(entry7.get()),RocketBodyRadius=float(entry8.get()),RocketBodyLength=float(entry9.get()),LaunchRailLength=float(entry10.get()),NozzleExitArea=float(entry11.get()),ThrustPolynomialDegree=float(entry12.get()),MissileDATCOMCards=float(entry13.get()),SolidWorksMass=float(entry14.get()),SolidWorksCOMx=float(entry15.get()),SolidWorksCOMy=float(entry16.get()),SolidWorksCOMz=float(entry17.get()),SolidWorksMOIx=float(entry18.get()),SolidWorksMOIy=float(entry19.get()),SolidWorksMOIz=float(entry20.get()),TimeBurn=float(entry21.get()),FuelDensity=float(entry22.get()),FuelRadius=float(entry23.get()),FuelThickness=float(entry24.get()),FuelThicknessInitial=float(entry25.get()),FuelCOM=float(entry26.get()),FuelLength=float(entry27.get()),ParachuteCD=float(entry28.get()),ParachuteDiameter=float(entry29.get()),ParachuteDelay=float(entry30.get()),NoseMass=float(entry31.get()),NoseCOMx=float(entry32.get()),NoseCOMy=float(entry33.get()),NoseCOMz=float(entry34.get()),NoseMOIx=float(entry35.get()),NoseMOIy=float(entry36.get()),NoseMOIz=float(entry37.get()),BoosterMass=float(entry38.get()),BoosterCOMx=float(entry39.get()),BoosterCOMy=float(entry40.get()),BoosterCOMz=float(entry41.get()),BoosterMOIx=float(entry42.get()),BoosterMOIy=float(entry43.get()),BoosterMOIz=float(entry44.get()),NumberRuns=float(1),LaunchElevationLower=float(entry46.get()),LaunchElevationUpper=float(entry47.get()),LaunchAzimuthLower=float(entry48.get()),LaunchAzimuthUpper=float(entry49.get()),ThrustMisalignmentYawLower=float(entry50.get()),ThrustMisalignmentYawUpper=float(entry51.get()),ThrustMisalignmentPitchLower=float(entry52.get()),ThrustMisalignmentPitchUpper=float(entry53.get()),ThrustMagnitudeLower=float(entry54.get()),ThrustMagnitudeUpper=float(entry55.get()),TimeBurnLower=float(entry56.get()),TimeBurnUpper=float(entry57.get()),WindMagnitudeLower=float(entry58.get()),WindMagnitudeUpper=float(entry59.get()),WindDirectionLower=float(entry60.get()),WindDirectionUpper=float(entry61.get()),AerodynamicDragLower=float(entry62.get()),AerodynamicDragUpper=float(entry63.get()),AerodynamicLiftLower=float(entry64.get()),AerodynamicLiftUpper=float(entry65.get()),AerodynamicMomentLower=float(entry66.get()),AerodynamicMomentUpper=float(entry67.get()),CentreOfPressureLower=float(entry68.get()),CentreOfPressuerUpper=float(entry69.get()),FinCantAngleLower=float(entry70.get()),FinCantAngleUpper=float(entry71.get()),LaunchAltitudeLower=float(entry72.get()),LaunchAltitudeUpper=float(entry73.get()),CalculatorTimeSize=float(entry74.get()),OxidiserDensity=float(entry75.get()),OxidiserRadius=float(entry76.get()),OxidiserLength=float(entry77.get()),OxidiserLengthInitial=float(entry78.get()),OxidiserCOM=float(entry79.get()),TimeBurnFuel=float(entry80.get()),NumberStages=float(entry81.get()),StageTime=float(entry82.get()),StageDelay=float(entry83.get()),StageMass=float(entry84.get()),StageCOMx=float(entry85.get()),StageCOMy=float(entry86.get()),StageCOMz=float(entry87.get()),StageMOIx=float(entry88.get()),StageMOIy=float(entry89.get()),StageMOIz=float(entry90.get()),NoseRadius=float(entry91.get()),NoseLength=float(entry92.get()),FinRootChord=float(entry93.get()),FinTipChord=float(entry94.get()),FinSweep=float(entry95.get()),FinSpan=float(entry96.get()),FinLocation=float(entry97.get()),FinSpanRoot=float(entry98.get()),FinCantAngle=float(entry99.get()),CheckEarthModelWGS=float(entry205.get()),CheckTurbulence=float(entry100.get()),Check4in1=float(entry101.get()),CheckStaging=float(entry102.get()),CheckThrust=float(entry103.get()),CheckRollControl=float(entry104.get()),CheckMonteCarloUI=float(entry200.get()),CheckStream=float(entry106.get()),CheckOrder2=float(entry107.get()),CheckOrder4=float(entry108.get()),CheckOrder8=float(entry109.get()),SolverRelative=float(entry110.get()),SolverAbsolute=float(entry111.get()),SolverTimeSizeFirst=float(entry112.get()),SolverTimeSizeMax=float(entry113.get()),RollControlLower=float(entry114.get()),RollControlUpper=float(entry115.get()),RollControlFrequency=float(entry116.get()),RollControlForce=float(entry117.get()),GraphicScale=float(entry118.get()),TrajectoryResolution=float(entry119.get()),Directory=entry120.get(),RollControlTimeInitial=float(entry121.get()),RollControlTimeFinal=float(entry122.get()),DrogueCD=float(entry123.get()),DrogueDiameter=float(entry124.get()),DrogueDelay=float(entry125.get()),NoseCD=float(entry202.get()),BoosterCD=float(entry203.get()),CombinedCD=float(entry206.get()),MCDetailed=float(entry207.get()),Lug=float(entry204.get()),ThrustHybrid=float(entry208.get()),MaxTAOA=float(entry209.get()),CheckSegmented=float(entry210.get()),SolverDescentMethod=entry211.get().strip(),SolverDescentRelative=float(entry212.get()),SolverDescentAbsolute=float(entry213.get()),SolverDescentTimeSizeMax=float(entry214.get()))
         MonteCarloInputs=Directory(LaunchElevationLower=float(entry46.get()),LaunchElevationUpper=float(entry47.get()),LaunchAzimuthLower=float(entry48.get()),LaunchAzimuthUpper=float(entry49.get()),ThrustMisalignmentYawLower=float(entry50.get()),ThrustMisalignmentYawUpper=float(entry51.get()),ThrustMisalignmentPitchLower=float(entry52.get()),ThrustMisalignmentPitchUpper=float(entry53.get()),ThrustMagnitudeLower=float(entry54.get()),ThrustMagnitudeUpper=float(entry55.get()),TimeBurnLower=float(entry56.get()),TimeBurnUpper=float(entry57.get()),WindMagnitudeLower=float(entry58.get()),WindMagnitudeUpper=float(entry59.get()),WindDirectionLower=float(entry60.get()),WindDirectionUpper=float(entry61.get()),AerodynamicDragLower=float(entry62.get()),AerodynamicDragUpper=float(entry63.get()),AerodynamicLiftLower=float(entry64.get()),AerodynamicLiftUpper=float(entry65.get()),AerodynamicMomentLower=float(entry66.get()),AerodynamicMomentUpper=float(entry67.get()),CentreOfPressureLower=float(entry68.get()),CentreOfPressureUpper=float(entry69.get()),FinCantAngleLower=float(entry70.get()),FinCantAngleUpper=float(entry71.get()),LaunchAltitudeLower=float(entry72.get()),LaunchAltitudeUpper=float(entry73.get()))
         AerodynamicBallistic=bulk.aerodynamic_tables(r'{}\Inputs\RasAeroII.xlsx'.format(entry120.get()),r'{}\Inputs\RasAeroII15.xlsx'.format(entry120.get()))
         AerodynamicNose=bulk.aerodynamic_tables(r'{}\Inputs\RasAeroIINose.xlsx'.format(entry120.get()),r'{}\Inputs\RasAeroIINose15.xlsx'.format(entry120.get()))
@@ -1669,86 +1733,53 @@ def Start():
         else:
             FourInOneSimulation=False
 
-        RunNumber=1
         NumberRuns=float(entry45.get())
         if CheckMonteCarloUI==0:
             NumberRuns=1
 
-        """If a previous Monte Carlo output file exists, delete it."""
-        MonteCarloFile=os.path.isfile(r'{}\Outputs\Monte Carlo.xlsx'.format(Directory))
-        if MonteCarloFile==True:
-            os.remove(r'{}\Outputs\Monte Carlo.xlsx'.format(Directory))
-        
+        """Start a new hot path profile (only recorded when PYROPS_PROFILE is set):"""
+        bulk.HotPath.reset()
+
+        """Body state of the first run; only the fixed step four-in-one campaign cycles through the states:"""
+        State=round(float(entry201.get()),0)
         if (Inputs["CheckOrder2"]==False) and (Inputs["CheckOrder4"]==False) and (Inputs["CheckOrder8"]==False):
-            print("Run Number:",RunNumber)
-            """State=1"""
-            State=round(float(entry201.get()),0)
-            Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(Directory),MonteCarloExcelInput)
-            Simulation=bulk.fixed_step_solver(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
-            Simulation.run(Inputs["TimeMax"],Inputs["TimeSize"],Inputs,State)
-            RunNumber+=1
-            while RunNumber<=NumberRuns:
-                if FourInOneSimulation==True:
-                    if State<4:
-                        print("Run number:",RunNumber)
-                        State+=1
-                        Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(Directory),MonteCarloExcelInput)
-                        Simulation=bulk.fixed_step_solver(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
-                        Simulation.run(Inputs["TimeMax"],Inputs["TimeSize"],Inputs,State)
-                        MonteCarloPlotRun()
-                        RunNumber+=1
-                    elif State==4:
-                        print("Run number:",RunNumber)
-                        State=1
-                        Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(Directory),MonteCarloExcelInput)
-                        Simulation=bulk.fixed_step_solver(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
-                        Simulation.run(Inputs["TimeMax"],Inputs["TimeSize"],Inputs,State)
-                        MonteCarloPlotRun()
-                        RunNumber+=1
-                else:
-                    print("Run number:",RunNumber)
-                    Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(Directory),MonteCarloExcelInput)
-                    Simulation=bulk.fixed_step_solver(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
-                    Simulation.run(Inputs["TimeMax"],Inputs["TimeSize"],Inputs,State)
-                    MonteCarloPlotRun()
-                    RunNumber+=1
-            print("Simulation Completed")
+            Solver="fixed_step_solver"
+        else:
+            Solver="main"
 
+        """Outputs are written on a background thread; a new Simulate starts from what is on disk:"""
+        bulk.Writer.reset()
+        r"""Monte Carlo campaigns are checkpointed in Outputs\Campaign and resume at the first unfinished run:"""
+        Campaign=bulk.campaign(entry120.get(),Inputs,MonteCarloInputs,NumberRuns,State,FourInOneSimulation==True and Solver=="fixed_step_solver",Solver)
+        if CheckMonteCarloUI==1:
+            if Campaign.open()==False:
+                return
         else:
-            print("Run Number:",RunNumber)
-            """State=1"""
-            State=round(float(entry201.get()),0)
-            Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(Directory),MonteCarloExcelInput)
-            Simulation=bulk.main(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
-            Simulation.run(Inputs,TimeMax,State)
-            
-            RunNumber+=1
-            while RunNumber<=NumberRuns:
-                if FourInOneSimulation==True:
-                    if State<4:
-                        print("Run number:",RunNumber)
-                        #State+=1
-                        Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(Directory),MonteCarloExcelInput)
-                        Simulation=bulk.main(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
-                        Simulation.run(Inputs,TimeMax,State)
-                        MonteCarloPlotRun()
-                        RunNumber+=1
-                    elif State==4:
-                        print("Run number:",RunNumber)
-                        #State=1
-                        Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(Directory),MonteCarloExcelInput)
-                        Simulation=bulk.main(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
-                        Simulation.run(Inputs,TimeMax,State)
-                        MonteCarloPlotRun()
-                        RunNumber+=1
-                else:
-                    print("Run number:",RunNumber)
-                    Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(Directory),MonteCarloExcelInput)
-                    Simulation=bulk.main(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
-                    Simulation.run(Inputs,TimeMax,State)
-                    MonteCarloPlotRun()
-                    RunNumber+=1
-            print("Simulation Completed")
+            """Solver statistics are collected per Simulate (one campaign):"""
+            SolverStatisticsFile=os.path.isfile(r'{}\Outputs\Solver Statistics.csv'.format(entry120.get()))
+            if SolverStatisticsFile==True:
+                os.remove(r'{}\Outputs\Solver Statistics.csv'.format(entry120.get()))
+
+        def Run(State):
+            Dispersion=bulk.monte_carlo.random(MonteCarloInputs,r'{}\Inputs\monte_carlo.xlsx'.format(entry120.get()),MonteCarloExcelInput)
+            if Solver=="fixed_step_solver":
+                Simulation=bulk.fixed_step_solver(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
+                Simulation.run(Inputs["TimeMax"],Inputs["TimeSize"],Inputs,State)
+            else:
+                Simulation=bulk.main(AerodynamicBallistic,TransformFrame,ThrustFit,Dispersion,WindInput,AerodynamicNose,AerodynamicBooster)
+                Simulation.run(Inputs,TimeMax,State)
+
+        for RunNumber in Campaign.pending():
+            print("Run number:",RunNumber)
+            Inputs["MonteCarloRun"]=RunNumber
+            Campaign.run(RunNumber,Run)
+            if RunNumber>1:
+                MonteCarloPlotRun()
+        bulk.Writer.flush()
+        bulk.HotPath.write(entry120.get())
+        print("Simulation Completed")
+        if bulk.OutputFormat()!="excel":
+            print("Output tables are stored as {} files; press Export Excel for workbooks, or set PYROPS_OUTPUT=excel.".format(bulk.OutputFormat()))
 
     def MonteCarloPlotRun():
         """Monte Carlo Map:"""
@@ -1765,7 +1796,8 @@ def Start():
     button=Button(launch,text="Thrust Curve Fit",width=28,height=2,bg='lightgray',fg='black',command=lambda:ThrustCurveFit()).place(x=1130,y=30+7*45)
     button=Button(launch,text="Missile DATCOM",width=28,height=2,bg='lightgray',fg='black',command=lambda:MissileDATCOM()).place(x=1130,y=30+8*45)
     button=Button(launch,text="Create Wind File",width=28,height=2,bg='lightgray',fg='black',command=lambda:CreateWindFile()).place(x=1130,y=30+9*45)
-    button=Button(launch,text="Quit",width=28,height=2,bg='lightgray',fg='black',command=lambda:Exit()).place(x=1130,y=30+10*45)
+    button=Button(launch,text="Export Excel",width=28,height=2,bg='lightgray',fg='black',command=lambda:ExportExcelOutputs()).place(x=1130,y=30+10*45)
+    button=Button(launch,text="Quit",width=28,height=2,bg='lightgray',fg='black',command=lambda:Exit()).place(x=1130,y=30+11*45)
     launch.mainloop
 
 menu = Menu(root)
@@ -0,0 +1,73 @@
+"""Resumable Monte Carlo campaigns"""
+
+import importlib.machinery
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+BODY_DIR = Path(__file__).parent.parent / "body"
+
+
+def load(name):
+    """One body/*.pyw module, imported as body.<name> (the body package itself pulls in the GUI)"""
+    loader = importlib.machinery.SourceFileLoader(f"body.{name}", str(BODY_DIR / f"{name}.pyw"))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(loader.name, loader))
+    sys.modules[loader.name] = module
+    loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def body(monkeypatch):
+    package = types.ModuleType("body")
+    package.__path__ = []
+    monkeypatch.setitem(sys.modules, "body", package)
+    for name in ("output_tables", "output_writer", "trajectory_store", "solver_statistics", "campaign"):
+        monkeypatch.setitem(sys.modules, f"body.{name}", None)
+        setattr(package, name, load(name))
+    package.solver_statistics.Campaigns.clear()
+    return package
+
+
+def statistics(body):
+    monitor = body.solver_statistics.solver_monitor()
+    monitor.book(0.0, 1, 0.5)
+    return monitor.statistics("RK45", [0.0, 1.0, 2.0], 20, 0, 2, 0, "")
+
+
+def campaign(body, directory, inputs):
+    return body.campaign.campaign(directory, inputs, {"ThrustMagnitudeLower": -1.0}, 4, 1, False, "main")
+
+
+def test_resume_prunes_the_interrupted_runs_solver_statistics(body, tmp_path):
+    directory = str(tmp_path / "deck")
+    inputs = {"TimeMax": 60.0, "Deck": Path("Inputs"), "Seed": np.int64(3)}
+    first = campaign(body, directory, inputs)
+    assert first.open()
+
+    def simulate(run):
+        body.solver_statistics.SolverCampaign(statistics(body), directory, 1, run, False)
+
+    for run in (1, 2):
+        first.run(run, lambda state: simulate(run))
+    """Run 3 wrote its statistics, then the process died before its completion record:"""
+    simulate(3)
+    body.output_writer.Writer.flush()
+
+    resumed = campaign(body, directory, dict(inputs))
+    assert resumed.fingerprint == first.fingerprint
+    assert resumed.open()
+    assert resumed.pending() == [3, 4]
+    path = directory + r"\Outputs\Solver Statistics.csv"
+    assert pd.read_csv(path)["Run"].tolist() == [1, 2]
+
+    for run in resumed.pending():
+        resumed.run(run, lambda state: simulate(run))
+    body.output_writer.Writer.flush()
+    assert pd.read_csv(path)["Run"].tolist() == [1, 2, 3, 4]
+    assert body.solver_statistics.Campaigns[path].summary()["runs"] == 4
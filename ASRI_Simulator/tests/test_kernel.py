@@ -0,0 +1,183 @@
+"""Stateless right hand side shared by main and the fixed step solver"""
+
+import importlib.machinery
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy.integrate import RK45, solve_ivp
+
+BODY_DIR = Path(__file__).parent.parent / "body"
+
+
+def load(name):
+    """One body/*.pyw module, imported as body.<name> (the body package itself pulls in the GUI)"""
+    loader = importlib.machinery.SourceFileLoader(f"body.{name}", str(BODY_DIR / f"{name}.pyw"))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(loader.name, loader))
+    sys.modules[loader.name] = module
+    loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def body(monkeypatch):
+    package = types.ModuleType("body")
+    package.__path__ = []
+    monkeypatch.setitem(sys.modules, "body", package)
+    for name in ("constants", "fins", "sidedamping", "gravitation_WGS84", "profiler", "kernel"):
+        monkeypatch.setitem(sys.modules, f"body.{name}", None)
+        setattr(package, name, load(name))
+    return package
+
+
+class aerodynamics:
+    """Lookup tables of a finned rocket: CA, CN and the centre of pressure from the tip of the body"""
+
+    def lookup(self, mach, alpha):
+        return [0.45 + 0.1 * mach, 12.0 * alpha, 1.6]
+
+    lookup15 = lookup
+
+
+def inputs(**changes):
+    values = {
+        "TimeMax": 60.0, "TimeSize": 0.01, "Directory": ".", "LaunchLatitude": -34.6, "LaunchLongitude": 20.3,
+        "LaunchAltitude": 20.0, "LaunchElevation": 80.0, "LaunchAzimuth": 150.0, "LaunchRailLength": 6.0, "Lug": 0.5,
+        "RocketBodyRadius": 0.05, "RocketBodyLength": 2.5, "NozzleExitArea": 0.002, "TimeBurn": 3.0,
+        "ThrustHybrid": 1.0, "CheckThrust": 0.0, "CheckStaging": 0.0, "StageTime": 0.0, "StageDelay": 1.0,
+        "CheckTurbulence": 0.0, "CheckMonteCarloUI": 0.0, "Check4in1": 1.0, "CheckEarthModelWGS": 1.0,
+        "CheckRollControl": 0.0, "RollControlTimeInitial": 0.0, "RollControlTimeFinal": 0.0, "RollControlFrequency": 0.0,
+        "RollControlLower": 0.0, "RollControlUpper": 0.0, "RollControlForce": 0.0, "MaxTAOA": 60.0,
+        "SolidWorksCOMy": 0.0, "SolidWorksCOMz": 0.0, "NoseRadius": 0.05, "NoseLength": 0.4,
+        "NoseMass": 2.0, "NoseCOMx": 0.25, "NoseMOIx": 0.01, "NoseMOIy": 0.05, "NoseMOIz": 0.05, "NoseCD": 0.5,
+        "BoosterMass": 8.0, "BoosterCOMx": 1.2, "BoosterMOIx": 0.02, "BoosterMOIy": 2.0, "BoosterMOIz": 2.0,
+        "BoosterCD": 0.8, "CombinedCD": 0.9, "ParachuteCD": 1.5, "ParachuteDiameter": 1.5, "ParachuteDelay": 300.0,
+        "DrogueCD": 1.2, "DrogueDiameter": 0.5, "DrogueDelay": 1.0, "FinRootChord": 0.2, "FinTipChord": 0.1,
+        "FinSweep": 0.05, "FinSpan": 0.1, "FinLocation": 2.3, "FinSpanRoot": 0.05, "FinCantAngle": 0.0,
+    }
+    values.update(changes)
+    return values
+
+
+def tables(body, values, thrust=1500.0):
+    """Input tables of a run, built in memory instead of read from the inputs\\*.xlsx files"""
+    altitude = np.linspace(0.0, 30000.0, 31)
+    temperature = 288.15 - 0.0065 * np.minimum(altitude, 11000.0)
+    pressure = 101325.0 * (temperature / 288.15) ** 5.256
+    density = pressure / (287.0 * temperature)
+    time = np.array([0.0, values["TimeBurn"], 1000.0])
+    return {
+        "Aerodynamics": aerodynamics(), "Nose": aerodynamics(), "Booster": aerodynamics(),
+        "Atmosphere": (altitude, temperature, pressure, density),
+        "Mass": (time, np.array([12.0, 9.0, 9.0]), np.array([0.02, 0.015, 0.015]),
+                 np.array([4.0, 3.5, 3.5]), np.array([4.0, 3.5, 3.5]), np.array([1.4, 1.3, 1.3])),
+        "Hybrid": (time, np.array([thrust, thrust, 0.0]), np.full(3, 101325.0)),
+        "Liquid": (np.array([0.0, 101325.0]), np.array([thrust, thrust])),
+        "SideDamping": [0.05] * 8 + [0.3] * 8,
+        "Wind": (altitude, np.full(31, 3.0), np.full(31, -2.0)),
+        "Gravity": body.gravitation_WGS84.ellipse_gravity(values["LaunchLatitude"] * np.pi / 180, tolerance=np.inf),
+        "Thrust": None, "Staging": None,
+    }
+
+
+def run(body, values, thrust, BodyState=1):
+    kernel = body.kernel
+    params = kernel.Parameters(values, BodyState, np.zeros(20))
+    return params, tables(body, values, thrust), kernel.Phase()
+
+
+def test_derivatives_is_a_function_of_its_arguments(body):
+    kernel = body.kernel
+    params, table, phase = run(body, inputs(), 1500.0)
+    y = kernel.InitialState(params)
+    y[0:3] = [20.0, -10.0, -80.0]
+    y[12:15] = [5.0, -3.0, -30.0]
+    first = kernel.derivatives(1.0, y, params, table, phase)
+    """Evaluations at other times, as an adaptive solver makes them, do not change the value at t=1:"""
+    for t in (1.7, 0.2, 1.0 + 1e-9):
+        kernel.derivatives(t, y, params, table, phase)
+    assert np.array_equal(kernel.derivatives(1.0, y, params, table, phase), first)
+
+
+def test_two_parameter_sets_integrate_independently_in_one_process(body):
+    kernel = body.kernel
+    runs = [run(body, inputs(), 1500.0), run(body, inputs(LaunchElevation=70.0, TimeBurn=2.0), 2500.0)]
+
+    def alone(params, table, phase):
+        solution = solve_ivp(lambda t, y: kernel.derivatives(t, y, params, table, phase), (0.5, 4.0),
+                             kernel.InitialState(params), method="RK45", rtol=1e-6, atol=1e-6)
+        return solution.y[:, -1]
+
+    expected = [alone(*flight) for flight in runs]
+
+    """Both runs stepped in turn, step by step:"""
+    solvers = [RK45(lambda t, y, flight=flight: kernel.derivatives(t, y, *flight), 0.5, kernel.InitialState(flight[0]), 4.0,
+                    rtol=1e-6, atol=1e-6) for flight in runs]
+    while any(solver.status == "running" for solver in solvers):
+        for solver in solvers:
+            if solver.status == "running":
+                solver.step()
+
+    for solver, final in zip(solvers, expected):
+        assert np.array_equal(solver.y, final)
+    """The runs differ, so neither one read the other's parameters:"""
+    assert not np.allclose(expected[0], expected[1])
+    assert -expected[1][14] > 0 and -expected[0][14] > 0
+
+
+def test_interleaved_flights_land_where_they_land_alone(body):
+    kernel = body.kernel
+    Ascent = ("RK45", {"first_step": 0.01, "max_step": 1.0, "rtol": 1e-6, "atol": 1e-6})
+
+    def flight(BodyState):
+        params, table, phase = run(body, inputs(TimeMax=400.0), 1500.0, BodyState)
+        return kernel.Segments(lambda t, y: kernel.derivatives(t, y, params, table, phase), params, table, phase, Ascent), phase
+
+    def landing(segments):
+        solutions = [solution for method, solution in segments]
+        return solutions[-1].t[-1], solutions[-1].y[:, -1]
+
+    expected = [landing(flight(BodyState)[0]) for BodyState in (1, 2)]
+
+    """The ballistic and the parachute flight advanced segment by segment, in turn:"""
+    flights = [flight(BodyState) for BodyState in (1, 2)]
+    last = [None, None]
+    while any(segments is not None for segments, phase in flights):
+        for index, (segments, phase) in enumerate(flights):
+            if segments is not None:
+                try:
+                    last[index] = next(segments)[1]
+                except StopIteration:
+                    flights[index] = (None, phase)
+
+    for solution, (t, y) in zip(last, expected):
+        assert solution.t[-1] == t
+        assert np.array_equal(solution.y[:, -1], y)
+    """Both reached the ground, the parachute much later:"""
+    assert all(phase["Completed"] for segments, phase in flights)
+    assert expected[1][0] > 2 * expected[0][0]
+
+
+def test_descent_segment_takes_far_fewer_evaluations_under_parachute(body):
+    kernel = body.kernel
+    """DOP853 held to short steps, as with the launcher defaults, against LSODA with its own tolerances and steps from apogee:"""
+    Ascent = ("DOP853", {"first_step": 0.02, "max_step": 0.02, "rtol": 1e-6, "atol": 1e-6})
+    Descent = ("LSODA", {"max_step": 1.0, "rtol": 1e-3, "atol": 1e-3})
+
+    def descent(Descent):
+        params, table, phase = run(body, inputs(TimeMax=30.0), 800.0, 2)
+        evaluations = 0
+        for method, solution in kernel.Segments(lambda t, y: kernel.derivatives(t, y, params, table, phase),
+                                                params, table, phase, Ascent, Descent):
+            if solution.t[0] >= phase["Apogee"]:
+                evaluations += solution.nfev
+        return evaluations, solution.y[:, -1]
+
+    single, position = descent(None)
+    segmented, segmented_position = descent(Descent)
+    assert segmented * 5 < single
+    """Same position after 12 s under the parachute, to a few metres:"""
+    assert np.linalg.norm(segmented_position[12:15] - position[12:15]) < 5.0
@@ -0,0 +1,62 @@
+"""Binned FFT density against scipy's gaussian_kde"""
+
+import importlib.machinery
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy import stats
+
+BODY_DIR = Path(__file__).parent.parent / "body"
+
+
+def load(name):
+    """Import one body/*.pyw module on its own (the body package pulls in the GUI)"""
+    loader = importlib.machinery.SourceFileLoader(name, str(BODY_DIR / f"{name}.pyw"))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    loader.exec_module(module)
+    return module
+
+
+density = load("monte_carlo_density")
+
+
+def cell_area(xgrid, ygrid):
+    return (xgrid[1] - xgrid[0]) * (ygrid[1] - ygrid[0])
+
+
+@pytest.mark.parametrize("runs", [1000, 100000])
+def test_matches_gaussian_kde(runs):
+    # At 100k runs Scott's kernel (~45 m) is narrower than the 512-node spacing of the old plot-extent grid
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(0, 300, runs), rng.normal(0, 300, runs)
+    xgrid, ygrid, grid = density.BinnedDensity(x, y)
+    points = np.vstack([x[:2000], y[:2000]])
+    reference = stats.gaussian_kde(np.vstack([x, y]))(points)
+    estimate = density.PointDensity(points[0], points[1], xgrid, ygrid, grid)
+    assert np.max(np.abs(estimate - reference) / reference) < 0.02
+    assert grid.sum() * cell_area(xgrid, ygrid) == pytest.approx(1, abs=1e-3)
+
+
+def test_zero_outside_grid():
+    rng = np.random.default_rng(1)
+    xgrid, ygrid, grid = density.BinnedDensity(rng.normal(0, 300, 500), rng.normal(0, 300, 500))
+    assert np.all(density.PointDensity([18000, -18000], [0, 5000], xgrid, ygrid, grid) == 0)
+
+
+@pytest.mark.parametrize("x, y", [
+    ([5.0], [7.0]),                        # one run: covariance is NaN
+    ([3.0, 3.0, 3.0], [1.0, 1.0, 1.0]),    # identical landings: zero covariance
+    ([0.0, 1.0, 2.0], [0.0, 2.0, 4.0]),    # landings on a line: singular covariance
+])
+def test_degenerate_campaigns(x, y):
+    xgrid, ygrid, grid = density.BinnedDensity(x, y)
+    assert np.all(np.isfinite(grid))
+    assert grid.sum() * cell_area(xgrid, ygrid) == pytest.approx(1, abs=1e-3)
+    assert np.all(density.PointDensity(x, y, xgrid, ygrid, grid) > 0)
+
+
+def test_no_runs():
+    with pytest.raises(ValueError):
+        density.BinnedDensity([], [])
@@ -0,0 +1,52 @@
+"""Hot path profiler: opt-in and Profile.json writes"""
+
+import importlib.machinery
+import importlib.util
+import json
+from pathlib import Path
+
+BODY_DIR = Path(__file__).parent.parent / "body"
+
+
+def load(name):
+    """Import one body/*.pyw module on its own (the body package pulls in the GUI)"""
+    loader = importlib.machinery.SourceFileLoader(name, str(BODY_DIR / f"{name}.pyw"))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    loader.exec_module(module)
+    return module
+
+
+profiler = load("profiler").profiler
+
+
+def flight(hot_path, directory, calls=5):
+    hot_path.begin("test")
+    for _ in range(calls):
+        hot_path.start()
+        hot_path.lap("aerodynamics")
+    return hot_path.end(directory)
+
+
+def test_disabled_profiler_does_nothing(tmp_path):
+    hot_path = profiler(enabled=False)
+    assert hot_path.start == hot_path.skip and hot_path.lap == hot_path.skip
+    assert flight(hot_path, str(tmp_path / "deck")) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_is_written_once_per_interval_and_at_the_end(tmp_path, monkeypatch):
+    directory = str(tmp_path / "deck")
+    path = Path(directory + r"\Outputs\Profile.json")
+    hot_path = profiler(enabled=True)
+    writes = []
+    write = hot_path.write
+    monkeypatch.setattr(hot_path, "write", lambda directory: writes.append(directory) or write(directory))
+
+    for _ in range(4):
+        flight(hot_path, directory)
+    assert len(writes) == 1
+    assert json.loads(path.read_text())["campaign"]["runs"] == 1
+
+    hot_path.write(directory)
+    assert json.loads(path.read_text())["campaign"]["runs"] == 4
+    assert json.loads(path.read_text())["campaign"]["rhs_calls"] == 20
@@ -0,0 +1,92 @@
+"""Campaign solver statistics: running summary against the csv"""
+
+import importlib.machinery
+import importlib.util
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+BODY_DIR = Path(__file__).parent.parent / "body"
+
+
+def load(name):
+    """Import one body/*.pyw module on its own (the body package pulls in the GUI)"""
+    loader = importlib.machinery.SourceFileLoader(name, str(BODY_DIR / f"{name}.pyw"))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    loader.exec_module(module)
+    return module
+
+
+solver_statistics = load("solver_statistics")
+
+
+def statistics(wall, nfev, status=0):
+    monitor = solver_statistics.solver_monitor()
+    monitor.book(0.0, 1, wall / 2)
+    monitor.book(3.0, 2, wall / 2)
+    result = monitor.statistics("RK45", [0.0, 1.0, 3.0, 10.0], nfev, 0, 5, status, "")
+    result["wall_s"] = wall
+    return result
+
+
+def reference(path):
+    """The summary as the csv says it should be"""
+    runs = pd.read_csv(path)
+    median = runs["wall_s"].median()
+    return {
+        "runs": len(runs),
+        "nfev_total": int(runs["nfev"].sum()),
+        "nfev": {"median": runs["nfev"].median(), "p95": runs["nfev"].quantile(0.95), "max": runs["nfev"].max()},
+        "wall_s": {"total": runs["wall_s"].sum(), "median": median, "p95": runs["wall_s"].quantile(0.95), "max": runs["wall_s"].max()},
+        "rejected_fraction": runs["rejected"].sum() / (runs["rejected"].sum() + runs["steps"].sum()),
+        "min_step": runs["min_step"].min(),
+        "failed_runs": int((runs["status"] < 0).sum()),
+        "phase_wall_s": {name: runs[name + "_wall_s"].sum() for name in solver_statistics.solver_monitor.Phases},
+        "outliers": [int(run) for run in runs.loc[runs["wall_s"] > solver_statistics.OutlierFactor * median, "Run"]],
+    }
+
+
+@pytest.fixture
+def directory(tmp_path):
+    """Windows-style paths land as oddly named files inside tmp_path elsewhere"""
+    solver_statistics.Campaigns.clear()
+    return str(tmp_path / "deck")
+
+
+def campaign(directory, runs):
+    rng = np.random.default_rng(4)
+    summary = None
+    for run in runs:
+        wall = 100.0 if run == 17 else float(rng.uniform(1.0, 2.0))
+        summary = solver_statistics.SolverCampaign(statistics(wall, int(rng.integers(100, 900)), -1 if run == 5 else 0), directory, 1 + run % 4, run, False)
+    return summary
+
+
+def test_running_summary_matches_the_csv(directory):
+    summary = campaign(directory, range(3, 41))
+    expected = reference(directory + r"\Outputs\Solver Statistics.csv")
+    assert [outlier["run"] for outlier in summary.pop("outliers")] == expected.pop("outliers") == [17]
+    assert summary.keys() == expected.keys()
+    for key, value in expected.items():
+        assert summary[key] == pytest.approx(value), key
+
+
+def test_csv_changed_under_the_campaign_is_read_back(directory):
+    path = directory + r"\Outputs\Solver Statistics.csv"
+    campaign(directory, range(1, 21))
+    """A resume prunes the interrupted runs; a new campaign removes the csv:"""
+    pd.read_csv(path).query("Run <= 10").to_csv(path, index=False)
+    summary = campaign(directory, range(11, 16))
+    assert summary["runs"] == 15
+    assert summary["nfev_total"] == reference(path)["nfev_total"]
+    os.remove(path)
+    assert campaign(directory, [1])["runs"] == 1
+
+
+def test_step_history_is_shared():
+    assert solver_statistics.StepHistory({"CheckMonteCarloUI": 0, "MCDetailed": 0})
+    assert solver_statistics.StepHistory({"CheckMonteCarloUI": 1, "MCDetailed": 1})
+    assert not solver_statistics.StepHistory({"CheckMonteCarloUI": 1, "MCDetailed": 0})
@@ -0,0 +1,92 @@
+"""Campaign trajectory store: cached index and envelope"""
+
+import importlib.machinery
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+BODY_DIR = Path(__file__).parent.parent / "body"
+
+
+def load(name):
+    """Import one body/*.pyw module on its own (the body package pulls in the GUI)"""
+    loader = importlib.machinery.SourceFileLoader(name, str(BODY_DIR / f"{name}.pyw"))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    loader.exec_module(module)
+    return module
+
+
+trajectory_store = load("trajectory_store").trajectory_store
+
+
+def flight(apogee, duration, rows=50):
+    time = np.linspace(0.0, duration, rows)
+    return pd.DataFrame({"time (s)": time, "altitude (m)": apogee * np.sin(np.pi * time / duration)})
+
+
+def at_reference(store, name, time):
+    """Per-run interpolation the store used before samples() was vectorised"""
+    result = []
+    for run in store.runs():
+        frame = store.run(run)
+        times = frame["time (s)"].to_numpy()
+        if time < times[0] or time > times[-1]:
+            result.append(np.nan)
+        else:
+            result.append(np.interp(time, times, frame[name].to_numpy()))
+    return np.array(result)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Windows-style paths land in one oddly named folder inside tmp_path elsewhere"""
+    store = trajectory_store(str(tmp_path / "deck"))
+    for run in range(1, 9):
+        store.append(run, 0, flight(1000.0 + 100 * run, 40.0 + 5 * run))
+    return store
+
+
+def test_last_record_of_a_run_wins(store):
+    store.append(3, 0, flight(5.0, 10.0))
+    assert store.runs() == list(range(1, 9))
+    assert store.column("altitude (m)", 3).max() == pytest.approx(5.0, rel=1e-2)
+    assert store.maximum("altitude (m)")[4] == pytest.approx(1400.0, rel=1e-2)
+    with pytest.raises(KeyError):
+        store.record(42)
+
+
+def test_index_is_read_once(store, monkeypatch):
+    store.index()
+    monkeypatch.setattr(np, "fromfile", lambda *args, **kwargs: pytest.fail("index.bin re-read"))
+    for run in store.runs():
+        store.run(run)
+
+
+def test_sees_runs_appended_by_another_instance(store):
+    store.index()
+    trajectory_store(store.folder.split("\\")[0]).append(20, 1, flight(300.0, 20.0))
+    assert store.runs()[-1] == 20
+    assert store.record(20)["state"] == 1
+
+
+def test_envelope_matches_per_time_interpolation(store):
+    times = np.linspace(-5.0, 90.0, 97)
+    envelope = store.envelope("altitude (m)", times)
+    for row, time in zip(envelope.itertuples(), times):
+        reference = at_reference(store, "altitude (m)", time)
+        if np.isnan(reference).all():
+            assert np.isnan(row.median)
+            continue
+        assert row.minimum == pytest.approx(np.nanmin(reference))
+        assert row.median == pytest.approx(np.nanmedian(reference))
+        assert row.maximum == pytest.approx(np.nanmax(reference))
+    np.testing.assert_allclose(store.at("altitude (m)", 20.0).to_numpy(), at_reference(store, "altitude (m)", 20.0))
+
+
+def test_repeated_times_stay_a_step(tmp_path):
+    store = trajectory_store(str(tmp_path / "deck"))
+    store.append(1, 0, pd.DataFrame({"time (s)": [0.0, 1.0, 1.0, 2.0], "altitude (m)": [0.0, 10.0, 20.0, 30.0]}))
+    np.testing.assert_allclose(store.samples("altitude (m)", [0.5, 1.0, 1.5])[0], [5.0, 10.0, 25.0])
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness
+Runs BM-xxx cases through the legacy PyROPS solvers and the RocketPy path,
+records performance and accuracy, and checks for speed regressions
+
+Every BM-NNN folder with a case.json is a case. Each engine run happens
+in a fresh process and records wall time, RHS evaluations, solver steps, peak
+memory and the apogee / landing-point error against the case reference.
+Results are appended to benchmark_history.json. The run fails (exit code 1)
+when an engine is slower than the median of its previous runs on the same
+host by more than the threshold.
+
+Usage:
+    python run_benchmarks.py                       # every case, every engine
+    python run_benchmarks.py BM-001 --engines rocketpy --repeat 5
+    python run_benchmarks.py --pyrops-dir "C:\\PyROPS"  # enable the legacy engines
+
+The legacy engines need a PyROPS directory (the folder named in Path.txt, with
+Inputs/) and Windows, because body/ builds its file paths with backslashes.
+The case's Settings.xlsx supplies the launcher inputs. Each legacy run gets a
+temporary directory whose Inputs/ is the case deck (the "legacy_inputs"
+mapping in case.json) laid over a copy of --pyrops-dir/Inputs. The deck must
+supply the aerodynamics, motor, mass, atmosphere and wind tables; only the
+tables a case does not exercise come from --pyrops-dir. The run also uses the
+temporary directory as its working directory, because the solvers read
+body/Limitations.xlsx and write the viewer files (body/OpenGL*.xlsx, .npz)
+relative to it; the user's own viewer files are left alone.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import runpy
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Absolute, as legacy runs change the working directory
+BENCHMARK_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCHMARK_DIR.parent.parent
+PYROPS_DIR = REPO_DIR / "ASRI_Simulator"
+HISTORY_FILE = BENCHMARK_DIR / "benchmark_history.json"
+
+# Legacy engines: solver class and the CheckOrder flag that selects its method
+LEGACY_ENGINES = {
+    'legacy-rk23': ('main', 'CheckOrder2'),
+    'legacy-rk45': ('main', 'CheckOrder4'),
+    'legacy-dop853': ('main', 'CheckOrder8'),
+    'legacy-fixed': ('fixed_step_solver', None),
+}
+ENGINES = list(LEGACY_ENGINES) + ['rocketpy']
+
+# Legacy Inputs/ tables every case deck must supply (thrust_curve.xlsx is the
+# fixed-step solver's motor and the thrust fit's source). The other tables the
+# legacy solvers open (15 deg fin cant, nose and booster aerodynamics, liquid
+# motor, dispersion bounds) are copied from --pyrops-dir
+LEGACY_CASE_INPUTS = ('RasAeroII.xlsx', 'thrust_curve_hybrid.xlsx', 'thrust_curve.xlsx', 'mass_properties.xlsx',
+                      'atmosphere_data.xlsx', 'wind.xlsx')
+
+# Previous runs compared against in the regression check
+HISTORY_WINDOW = 5
+
+
+# =============================================================================
+# CASES
+# =============================================================================
+
+def load_cases(selected=()):
+    """case.json of every BM-xxx folder, optionally filtered by id"""
+    cases = []
+    for path in sorted(BENCHMARK_DIR.glob("BM-*/case.json")):
+        with open(path, 'r') as f:
+            case = json.load(f)
+        case['folder'] = str(path.parent)
+        if not selected or case['id'] in selected:
+            cases.append(case)
+    return cases
+
+
+def load_reference(case):
+    """Reference apogee and landing point, or None while the case has none"""
+    path = Path(case['folder']) / case.get('reference', '')
+    if not path.is_file():
+        return None
+    with open(path, 'r') as f:
+        reference = json.load(f)
+    return {
+        'apogee_m': reference['apogee_m'],
+        'landing_north_m': reference['landing_north_m'],
+        'landing_east_m': reference['landing_east_m'],
+    }
+
+
+def legacy_inputs(case):
+    """Case deck files keyed by the Inputs/ name the legacy solvers open"""
+    folder = Path(case['folder'])
+    return {name: folder / deck for name, deck in case.get('legacy_inputs', {}).items()}
+
+
+def missing_legacy_inputs(case):
+    """Required legacy tables the case deck does not supply"""
+    deck = legacy_inputs(case)
+    missing = [name for name in LEGACY_CASE_INPUTS if name not in deck]
+    return missing + [f"{name} ({path.name} not found)" for name, path in deck.items() if not path.is_file()]
+
+
+def legacy_directory(case, pyrops_dir, directory):
+    """PyROPS directory for one legacy run: the case deck over a copy of pyrops_dir/Inputs,
+    empty Outputs/, and a body/ holding the files the solvers open relative to the working directory"""
+    missing = missing_legacy_inputs(case)
+    if missing:
+        raise FileNotFoundError(f"{case['id']} deck lacks legacy inputs: {', '.join(missing)}")
+    inputs = Path(directory) / 'Inputs'
+    shutil.copytree(Path(pyrops_dir) / 'Inputs', inputs)
+    for name, path in legacy_inputs(case).items():
+        shutil.copyfile(path, inputs / name)
+    (Path(directory) / 'Outputs').mkdir()
+    (Path(directory) / 'body').mkdir()
+    shutil.copyfile(PYROPS_DIR / 'body' / 'Limitations.xlsx', Path(directory) / 'body' / 'Limitations.xlsx')
+    return str(directory)
+
+
+def launcher_call(source, name):
+    """Keyword -> entry number pairs of a Directory(...) call in Simulate()"""
+    simulate = source[source.index('def Simulate():'):]
+    call = simulate[simulate.index('{}=Directory('.format(name)):]
+    call = call[:call.index('\n')]
+    return re.findall(r'(\w+)=(?:float\()?entry(\d+)\.get\(\)', call)
+
+
+def launcher_inputs(settings_file):
+    """Launcher inputs and Monte Carlo bound keys from a saved Settings.xlsx
+
+    The label -> key mapping is read from launcher.pyw itself (LoadInputs
+    fills entryN from a Settings column, Simulate reads entryN into a key),
+    so it stays in step with the launcher.
+    """
+    source = (PYROPS_DIR / "launcher.pyw").read_text(encoding='utf-8-sig')
+    labels = dict(re.findall(
+        r'entry(\d+)\.insert\(0,\s*"[^"]*"\.format\(LoadInputs\.at\[0,"([^"]+)"\]\)\)', source))
+
+    settings = pd.read_excel(settings_file, header=0)
+    inputs = {}
+    for key, entry in launcher_call(source, 'Inputs'):
+        if entry in labels and labels[entry] in settings.columns:
+            value = settings.at[0, labels[entry]]
+            inputs[key] = value if isinstance(value, str) else float(value)
+    bounds = [key for key, _ in launcher_call(source, 'MonteCarloInputs')]
+    return inputs, bounds
+
+
+# =============================================================================
+# ENGINES (each call runs in its own worker process)
+# =============================================================================
+
+def peak_memory_mb():
+    """Peak resident memory of this process"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1024 ** 2
+    except (ImportError, AttributeError):
+        return None
+
+
+def run_rocketpy(case):
+    """Run the case's RocketPy script with the result cache disabled"""
+    os.environ['ROCKETPY_RESULT_CACHE'] = 'off'
+    script = (Path(case['folder']) / case['rocketpy_script']).resolve()
+    sys.path.insert(0, str(script.parent))
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        flight = runpy.run_path(str(script), run_name='__main__')['flight']
+    wall = time.perf_counter() - start
+
+    evaluations = getattr(flight, 'function_evaluations', None)
+    return {
+        'wall_s': wall,
+        'rhs_evaluations': int(sum(evaluations)) if evaluations else None,
+        'steps': len(flight.solution) if hasattr(flight, 'solution') else None,
+        'apogee_m': float(flight.apogee),
+        'landing_north_m': float(flight.y_impact),
+        'landing_east_m': float(flight.x_impact),
+        'peak_memory_mb': peak_memory_mb(),
+    }
+
+
+def run_legacy(case, engine, pyrops_dir):
+    """Run one legacy solver on the case's launcher settings and input deck"""
+    with tempfile.TemporaryDirectory(prefix=f"{case['id']}_") as directory:
+        directory = legacy_directory(case, pyrops_dir, directory)
+        # Each run has its own process, so changing its working directory is safe;
+        # it is restored before the directory is deleted (Windows refuses otherwise)
+        previous = os.getcwd()
+        os.chdir(directory)
+        try:
+            return run_legacy_in(case, engine, directory)
+        finally:
+            os.chdir(previous)
+
+
+def run_legacy_in(case, engine, directory):
+    sys.path.insert(0, str(PYROPS_DIR))
+    import body as bulk
+
+    solver, order = LEGACY_ENGINES[engine]
+    inputs, bound_keys = launcher_inputs(Path(case['folder']) / case['legacy_settings'])
+    inputs.update(Directory=directory, NumberRuns=1.0, CheckMonteCarloUI=0.0, Check4in1=0.0,
+                  CheckOrder2=0.0, CheckOrder4=0.0, CheckOrder8=0.0)
+    if order:
+        inputs[order] = 1.0
+
+    # Zero-width dispersion bounds, so the nominal run is deterministic
+    bounds = {key: 0.0 for key in bound_keys}
+
+    # Inputs as built by the launcher's Simulate()
+    tables = [bulk.aerodynamic_tables(r'{}\Inputs\{}.xlsx'.format(directory, name), r'{}\Inputs\{}15.xlsx'.format(directory, name))
+              for name in ('RasAeroII', 'RasAeroIINose', 'RasAeroIIBooster')]
+    transform = bulk.transform_frame(np.array([0, 0, 0], dtype=float))
+    thrust = bulk.thrust_curve(10, directory)
+    wind = bulk.wind_vector.read_excel(directory)
+    dispersion = bulk.monte_carlo.random(bounds, r'{}\Inputs\monte_carlo.xlsx'.format(directory), False)
+    state = case.get('legacy_state', 1)
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        if solver == 'main':
+            simulation = bulk.main(tables[0], transform, thrust, dispersion, wind, tables[1], tables[2])
+            stats = simulation.run(inputs, inputs['TimeMax'], state)
+        else:
+            simulation = bulk.fixed_step_solver(tables[0], transform, thrust, dispersion, wind, tables[1], tables[2])
+            stats = simulation.run(inputs['TimeMax'], inputs['TimeSize'], inputs, state)
+    wall = time.perf_counter() - start
+
+    output = bulk.ReadTable(r'{}\Outputs\Simulation.xlsx'.format(directory))
+    stats = stats if isinstance(stats, dict) else {}
+    return {
+        'wall_s': wall,
+        'rhs_evaluations': stats.get('nfev'),
+        'steps': stats.get('steps', len(output)),
+        'apogee_m': float(output['altitude (m)'].max()),
+        'landing_north_m': float(output['position_kinematic_North (m)'].iloc[-1]),
+        'landing_east_m': float(output['position_kinematic_East (m)'].iloc[-1]),
+        'peak_memory_mb': peak_memory_mb(),
+    }
+
+
+def run_engine(case, engine, pyrops_dir):
+    if engine == 'rocketpy':
+        return run_rocketpy(case)
+    return run_legacy(case, engine, pyrops_dir)
+
+
+def measure(case, engine, pyrops_dir, repeat):
+    """Best of `repeat` runs, each in a fresh spawned process"""
+    runs = []
+    for _ in range(repeat):
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+            runs.append(pool.submit(run_engine, case, engine, pyrops_dir).result())
+
+    best = min(runs, key=lambda run: run['wall_s'])
+    best['wall_s_all'] = [round(run['wall_s'], 4) for run in runs]
+    best['peak_memory_mb'] = max((run['peak_memory_mb'] or 0) for run in runs) or None
+    return best
+
+
+def skip_reason(case, engine, pyrops_dir):
+    """Why an engine cannot run here, or None"""
+    if engine == 'rocketpy':
+        if 'rocketpy_script' not in case:
+            return "case has no rocketpy_script"
+        try:
+            import rocketpy  # noqa: F401
+        except ImportError:
+            return "rocketpy is not installed"
+        return None
+    if 'legacy_settings' not in case:
+        return "case has no legacy_settings"
+    if pyrops_dir is None:
+        return "no --pyrops-dir given"
+    if os.name != 'nt':
+        return "legacy solvers use Windows paths"
+    if not (Path(pyrops_dir) / 'Inputs').is_dir():
+        return f"{pyrops_dir} has no Inputs/ folder"
+    missing = missing_legacy_inputs(case)
+    if missing:
+        return f"case deck lacks {', '.join(missing)} (legacy_inputs in case.json)"
+    return None
+
+
+# =============================================================================
+# ACCURACY, HISTORY AND REGRESSION CHECK
+# =============================================================================
+
+def add_errors(result, reference):
+    if reference is None:
+        result['apogee_error_m'] = result['landing_error_m'] = None
+        return
+    result['apogee_error_m'] = result['apogee_m'] - reference['apogee_m']
+    result['landing_error_m'] = float(np.hypot(
+        result['landing_north_m'] - reference['landing_north_m'],
+        result['landing_east_m'] - reference['landing_east_m']
+    ))
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history():
+    if not HISTORY_FILE.exists():
+        return []
+    with open(HISTORY_FILE, 'r') as f:
+        return json.load(f)
+
+
+def check_regressions(history, records, threshold):
+    """Records slower than the median of their recent same-host history by more than threshold"""
+    regressions = []
+    for record in records:
+        previous = [entry['wall_s'] for entry in history
+                    if entry['case'] == record['case'] and entry['engine'] == record['engine']
+                    and entry['host'] == record['host'] and entry.get('wall_s') is not None]
+        previous = previous[-HISTORY_WINDOW:]
+        if not previous:
+            continue
+        baseline = statistics.median(previous)
+        if record['wall_s'] > baseline * (1 + threshold):
+            regressions.append((record, baseline))
+    return regressions
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the BM-xxx performance benchmarks")
+    parser.add_argument('cases', nargs='*', help="case ids (default: all)")
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=ENGINES)
+    parser.add_argument('--repeat', type=int, default=3, help="runs per engine; the fastest is kept")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="allowed slow-down against the recent median (0.2 = 20%%)")
+    parser.add_argument('--pyrops-dir', type=Path, default=None,
+                        help="PyROPS directory with Inputs/ and Outputs/ for the legacy engines")
+    parser.add_argument('--no-save', action='store_true', help="do not append to the history")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("BENCHMARKS")
+    print("=" * 80)
+
+    history = load_history()
+    stamp = datetime.now().isoformat(timespec='seconds')
+    commit = git_commit()
+    host = platform.node()
+    records = []
+
+    for case in load_cases(args.cases):
+        reference = load_reference(case)
+        print(f"\n{case['id']}: {case.get('name', '')}")
+        if reference is None:
+            print("   (no reference results yet; accuracy not scored)")
+
+        for engine in args.engines:
+            reason = skip_reason(case, engine, args.pyrops_dir)
+            if reason:
+                print(f"   - {engine:<14} skipped: {reason}")
+                continue
+
+            result = measure(case, engine, args.pyrops_dir, args.repeat)
+            add_errors(result, reference)
+            record = {'timestamp': stamp, 'commit': commit, 'host': host,
+                      'python': platform.python_version(), 'case': case['id'], 'engine': engine, **result}
+            records.append(record)
+
+            error = "" if result['apogee_error_m'] is None else (
+                f" | apogee error {result['apogee_error_m']:+.1f} m, landing error {result['landing_error_m']:.1f} m")
+            print(f"   ✓ {engine:<14} {result['wall_s']:8.2f} s | "
+                  f"RHS {result['rhs_evaluations'] or '-'} | steps {result['steps'] or '-'} | "
+                  f"peak {result['peak_memory_mb'] or 0:.0f} MB{error}")
+
+    regressions = check_regressions(history, records, args.threshold)
+
+    if records and not args.no_save:
+        # Keep the history file even if an earlier copy is damaged
+        if HISTORY_FILE.exists():
+            shutil.copyfile(HISTORY_FILE, HISTORY_FILE.with_suffix('.json.bak'))
+        with open(HISTORY_FILE, 'w') as f:
+            json.dump(history + records, f, indent=2)
+        print(f"\n✓ History updated: {HISTORY_FILE.name} ({len(history) + len(records)} records)")
+
+    print("\n" + "=" * 80)
+    if regressions:
+        print("PERFORMANCE REGRESSION")
+        print("=" * 80)
+        for record, baseline in regressions:
+            print(f"   ✗ {record['case']} {record['engine']}: {record['wall_s']:.2f} s "
+                  f"vs median {baseline:.2f} s (+{record['wall_s'] / baseline - 1:.0%})")
+        return 1
+
+    print("NO REGRESSIONS")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Work Queue Scaling Benchmark
+Throughput of the distributed Monte Carlo queue against the number of workers,
+with independent worker processes on this machine standing in for nodes
+
+For each worker count a fresh queue is published and that many separate
+`work_queue.py worker` processes drain it. Throughput is runs per second from
+the first worker starting to the last one exiting (so it includes process
+start-up and queue contention); efficiency is throughput / (workers x
+single-worker throughput). Scaling stops being linear once the worker count
+passes the number of cores.
+
+Usage:
+    python run_queue_scaling.py                          # 1, 2, 4, ... cores workers, ballistic engine
+    python run_queue_scaling.py --workers 1 2 4 8 --runs 400 --engine rocketpy
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).parent
+SRC_DIR = BENCHMARK_DIR.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from work_queue import ENGINES, WorkQueue, campaign_tasks  # noqa: E402
+
+
+def default_workers():
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def drain(workers, runs, engine, seed, directory):
+    """Wall time for `workers` separate processes to finish a fresh campaign"""
+    path = Path(directory) / f"scaling_{workers}.sqlite"
+    manifest, payloads = campaign_tasks(engine, runs, seed, {})
+    with WorkQueue(path) as queue:
+        queue.publish(manifest, payloads)
+
+    start = time.perf_counter()
+    processes = [subprocess.Popen([sys.executable, str(SRC_DIR / "work_queue.py"), 'worker', str(path),
+                                   '--name', f"node{index}"], stdout=subprocess.DEVNULL)
+                 for index in range(workers)]
+    for process in processes:
+        process.wait()
+    wall = time.perf_counter() - start
+
+    with WorkQueue(path) as queue:
+        counts = queue.counts()
+    if counts['done'] != runs:
+        raise RuntimeError(f"{workers} workers finished {counts['done']} of {runs} runs: {counts}")
+    return wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark work queue throughput against worker count")
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers())
+    parser.add_argument('--runs', type=int, default=200)
+    parser.add_argument('--engine', choices=ENGINES, default='ballistic')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', type=Path, default=None, help="also write the results here")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"WORK QUEUE SCALING ({args.engine}, {args.runs} runs, {os.cpu_count()} cores)")
+    print("=" * 80)
+
+    records = []
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in sorted(set(args.workers)):
+            wall = drain(workers, args.runs, args.engine, args.seed, directory)
+            throughput = args.runs / wall
+            base = records[0]['runs_per_s'] / records[0]['workers'] if records else throughput / workers
+            records.append({'workers': workers, 'wall_s': round(wall, 3), 'runs_per_s': round(throughput, 3),
+                            'efficiency': round(throughput / (workers * base), 3)})
+            print(f"   {workers:>3} workers {wall:8.2f} s | {throughput:8.2f} runs/s | "
+                  f"efficiency {records[-1]['efficiency']:.0%}")
+
+    if args.json:
+        args.json.write_text(json.dumps(records, indent=2))
+        print(f"\n✓ Results written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Aerodynamic Surface
+RASAero coefficients on a regular Mach x alpha grid with bilinear evaluation
+
+The CSV is parsed and gridded once; the prepared grid is saved next to it as
+an .npz tagged with the CSV's digest, so later flight set-ups load it
+directly until the CSV changes.
+"""
+
+import bisect
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from result_cache import file_digest
+from shared_tables import attach as attach_tables
+
+RASAERO_FILE = Path(__file__).parent.parent / "data" / "aerodynamics" / "rasaero_data.csv"
+
+# Coefficients gridded from the RASAero export (CP as exported, from the nose tip)
+COEFFICIENTS = ('CD', 'CD Power-Off', 'CD Power-On', 'CL', 'CN', 'CP')
+
+
+class AeroSurface:
+    """Coefficient tables on a regular grid of Mach (rows) by alpha in degrees (columns)"""
+
+    def __init__(self, mach, alpha, tables):
+        self.mach = np.asarray(mach, dtype=float)
+        self.alpha = np.asarray(alpha, dtype=float)
+        self.tables = {name: np.asarray(table, dtype=float) for name, table in tables.items()}
+
+        # Plain lists for the scalar path, which RocketPy calls once per evaluation
+        self._mach_list = self.mach.tolist()
+        self._alpha_list = self.alpha.tolist()
+        self._table_lists = {name: table.tolist() for name, table in self.tables.items()}
+
+    # =========================================================================
+    # CONSTRUCTION AND SERIALISATION
+    # =========================================================================
+
+    @classmethod
+    def from_csv(cls, path=RASAERO_FILE, coefficients=COEFFICIENTS):
+        """Grid a RASAero export; every (Mach, Alpha) pair must be present"""
+        df = pd.read_csv(path)
+        tables = {}
+        for name in coefficients:
+            grid = df.pivot_table(index='Mach', columns='Alpha', values=name, aggfunc='mean')
+            if grid.isna().any().any():
+                raise ValueError(f"{Path(path).name}: '{name}' is not defined on a full Mach x Alpha grid")
+            tables[name] = grid.to_numpy()
+        return cls(grid.index.to_numpy(), grid.columns.to_numpy(), tables)
+
+    def save(self, path, source_digest=''):
+        """Write the prepared grid as an .npz"""
+        names = list(self.tables)
+        np.savez(
+            path,
+            mach=self.mach,
+            alpha=self.alpha,
+            names=np.array(names),
+            tables=np.stack([self.tables[name] for name in names]),
+            source_digest=np.array(source_digest)
+        )
+
+    @classmethod
+    def load(cls, path=RASAERO_FILE):
+        """Surface for a RASAero CSV, from its saved grid when that is up to date"""
+        path = Path(path)
+        grid_path = path.with_suffix('.grid.npz')
+        digest = file_digest(path)
+
+        if grid_path.exists():
+            with np.load(grid_path) as grid:
+                if str(grid['source_digest']) == digest:
+                    return cls(grid['mach'], grid['alpha'], dict(zip(grid['names'].tolist(), grid['tables'])))
+
+        surface = cls.from_csv(path)
+        surface.save(grid_path, digest)
+        return surface
+
+    def publish(self, registry, prefix='aero'):
+        """Place the grid in a TableRegistry so worker processes can attach to it"""
+        registry.publish(f'{prefix}.mach', self.mach)
+        registry.publish(f'{prefix}.alpha', self.alpha)
+        for name, table in self.tables.items():
+            registry.publish(f'{prefix}.table.{name}', table)
+        return registry
+
+    @classmethod
+    def attach(cls, manifest, prefix='aero'):
+        """Surface over a grid published by another process, sharing its memory"""
+        tables = attach_tables(manifest)
+        start = f'{prefix}.table.'
+        return cls(tables[f'{prefix}.mach'], tables[f'{prefix}.alpha'],
+                   {name[len(start):]: table for name, table in tables.items() if name.startswith(start)})
+
+    # =========================================================================
+    # EVALUATION
+    # =========================================================================
+
+    @staticmethod
+    def _cell(axis, value):
+        # Lower grid index and weight, clamped to the table edges
+        if value <= axis[0]:
+            return 0, 0.0
+        if value >= axis[-1]:
+            return len(axis) - 2, 1.0
+        i = bisect.bisect_right(axis, value) - 1
+        return i, (value - axis[i]) / (axis[i + 1] - axis[i])
+
+    def evaluate(self, name, mach, alpha=0.0):
+        """Bilinear value of a coefficient; scalars in, scalar out, arrays broadcast"""
+        if np.ndim(mach) == 0 and np.ndim(alpha) == 0:
+            table = self._table_lists[name]
+            i, u = self._cell(self._mach_list, float(mach))
+            if len(self._alpha_list) == 1:
+                return table[i][0] * (1 - u) + table[i + 1][0] * u
+            j, v = self._cell(self._alpha_list, abs(float(alpha)))
+            return ((table[i][j] * (1 - v) + table[i][j + 1] * v) * (1 - u)
+                    + (table[i + 1][j] * (1 - v) + table[i + 1][j + 1] * v) * u)
+
+        table = self.tables[name]
+        mach, alpha = np.broadcast_arrays(np.asarray(mach, dtype=float), np.abs(np.asarray(alpha, dtype=float)))
+        i, u = self._cells(self.mach, mach)
+        if len(self.alpha) == 1:
+            return table[i, 0] * (1 - u) + table[i + 1, 0] * u
+        j, v = self._cells(self.alpha, alpha)
+        return ((table[i, j] * (1 - v) + table[i, j + 1] * v) * (1 - u)
+                + (table[i + 1, j] * (1 - v) + table[i + 1, j + 1] * v) * u)
+
+    @staticmethod
+    def _cells(axis, values):
+        # Vectorised _cell
+        values = np.clip(values, axis[0], axis[-1])
+        i = np.clip(np.searchsorted(axis, values, side='right') - 1, 0, len(axis) - 2)
+        return i, (values - axis[i]) / (axis[i + 1] - axis[i])
+
+    def cd(self, mach, alpha=0.0, power_on=False):
+        """Drag coefficient"""
+        return self.evaluate('CD Power-On' if power_on else 'CD', mach, alpha)
+
+    def cn(self, mach, alpha=0.0):
+        """Normal force coefficient"""
+        return self.evaluate('CN', mach, alpha)
+
+    def cp(self, mach, alpha=0.0):
+        """Centre of pressure, in the RASAero export's units from the nose tip"""
+        return self.evaluate('CP', mach, alpha)
+
+    def callable(self, name):
+        """f(mach, alpha) closure for use as a user-defined coefficient"""
+        return lambda mach, alpha=0.0: self.evaluate(name, mach, alpha)
+
+    def drag_function(self, name='CD', alpha=0.0):
+        """RocketPy Function of Mach at a fixed angle of attack, on the table's Mach points"""
+        from rocketpy import Function
+
+        return Function(
+            np.column_stack([self.mach, self.evaluate(name, self.mach, alpha)]),
+            inputs='Mach',
+            outputs='Drag Coefficient',
+            interpolation='linear'
+        )
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Background Job Queue for Simulations
+In-process job table on a bounded thread pool, shared by every Streamlit session,
+and the prototype objects (environments, rockets) its jobs copy from
+"""
+
+import copy
+import itertools
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Job:
+    """One submitted simulation and its progress"""
+
+    def __init__(self, job_id, key):
+        self.id = job_id
+        self.key = key
+        self.status = 'queued'  # queued -> running -> done | failed
+        self.stage = "Waiting for a worker..."
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+
+    @property
+    def active(self):
+        return self.status in ('queued', 'running')
+
+
+class JobQueue:
+    """Runs jobs on at most max_workers threads
+
+    Jobs are identified by a caller-supplied key (a hash of their inputs);
+    submitting a key that is already queued or running returns the existing
+    job instead of starting a duplicate. Finished jobs are kept for polling
+    until more than `keep` have accumulated.
+    """
+
+    def __init__(self, max_workers=2, keep=64):
+        self.max_workers = max_workers
+        self.keep = keep
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='simulation')
+        self._jobs = OrderedDict()
+        self._active = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args, **kwargs):
+        """Queue fn(report, *args, **kwargs) and return its job id
+
+        report(stage, progress) may be called by fn to publish progress.
+        """
+        with self._lock:
+            if key in self._active:
+                return self._active[key].id
+
+            job = Job(next(self._ids), key)
+            self._jobs[job.id] = job
+            self._active[key] = job
+            self._evict()
+
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job.id
+
+    def get(self, job_id):
+        """Job by id, or None once it has been evicted"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def pending(self):
+        """Number of queued and running jobs"""
+        with self._lock:
+            return len(self._active)
+
+    def _run(self, job, fn, args, kwargs):
+        def report(stage, progress):
+            job.stage = stage
+            job.progress = progress
+
+        job.status = 'running'
+        job.started = time.time()
+        try:
+            job.result = fn(report, *args, **kwargs)
+            job.status = 'done'
+        except Exception as e:
+            job.error = f"{e}\n\n{traceback.format_exc()}"
+            job.status = 'failed'
+        finally:
+            job.finished = time.time()
+            with self._lock:
+                self._active.pop(job.key, None)
+                self._evict()
+
+    def _evict(self):
+        # Drop the oldest finished jobs beyond the retention limit
+        finished = [job_id for job_id, job in self._jobs.items() if not job.active]
+        for job_id in finished[:max(len(finished) - self.keep, 0)]:
+            del self._jobs[job_id]
+
+
+class Prototypes:
+    """Built objects shared by jobs, handed out as private deep copies
+
+    A RocketPy Rocket or Environment carries mutable state through a flight
+    (parachute triggers, for one), so two jobs must never fly the same
+    instance. Each key is built once, by the first job that needs it, while
+    any other job wanting that key waits on its lock; every caller then gets
+    its own copy. At most max_entries prototypes are kept (least recently
+    used dropped first).
+    """
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """Private copy of the prototype for key, calling build() on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {'lock': threading.Lock(), 'value': None}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        with entry['lock']:
+            if entry['value'] is None:
+                entry['value'] = build()
+            return copy.deepcopy(entry['value'])
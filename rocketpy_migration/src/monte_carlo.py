@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Dispersion Sampling for RocketPy
+Samples the legacy PyROPS uncertainty set and runs dispersed flights in worker processes
+"""
+
+from scipy import stats
+
+from shared_tables import attach
+
+# Uncertainties supported by the legacy monte_carlo class:
+# key -> (label, default lower, default upper)
+UNCERTAINTIES = {
+    'elevation': ("Launch Elevation (°)", -1.0, 1.0),
+    'azimuth': ("Launch Azimuth (°)", -2.0, 2.0),
+    'thrust_yaw': ("Thrust Misalignment Yaw (°)", -0.1, 0.1),
+    'thrust_pitch': ("Thrust Misalignment Pitch (°)", -0.1, 0.1),
+    'thrust_magnitude': ("Thrust Magnitude (%)", -5.0, 5.0),
+    'wind_magnitude': ("Wind Magnitude (%)", -20.0, 20.0),
+    'wind_direction': ("Wind Direction (°)", -15.0, 15.0),
+    'drag': ("Drag Coefficient (%)", -10.0, 10.0),
+    'altitude': ("Launch Altitude (m)", 0.0, 0.0),
+}
+
+
+def sample_dispersions(bounds, runs, seed=None):
+    """Per-run variations between each lower and upper bound
+
+    Uses the same truncated normal draw as monte_carlo.random in the legacy
+    simulator: scale 1.1 truncated to [0, 1] of the lower-to-upper range.
+    """
+    normalised = stats.truncnorm.rvs(0, 1 / 1.1, loc=0, scale=1.1,
+                                     size=(runs, len(UNCERTAINTIES)), random_state=seed)
+    samples = []
+    for run, row in enumerate(normalised):
+        sample = {'run': run}
+        for value, key in zip(row, UNCERTAINTIES):
+            lower, upper = bounds[key]
+            sample[key] = float(lower + value * (upper - lower))
+        samples.append(sample)
+    return samples
+
+
+def simulate_dispersed(nominal, dispersion, tables=None):
+    """Run one dispersed flight; executed in a worker process
+
+    nominal holds the sidebar configuration and dispersion one sample from
+    sample_dispersions. tables is an optional TableRegistry manifest from
+    pipeline.publish_motor_data; workers then attach to the parent's copy of
+    the motor tables instead of parsing the CSVs for every run. Returns the
+    sample merged with the flight summary, or with an 'error' entry if
+    RocketPy failed.
+    """
+    # Imported here so sampling works without RocketPy (queue coordinators)
+    from pipeline import (
+        THRUST_FILE, load_motor_data, build_environment, build_motor, build_rocket,
+        run_flight, flight_summary
+    )
+
+    result = dict(dispersion)
+    try:
+        shared = attach(tables) if tables else None
+        df_thrust, propellant_mass = load_motor_data(tables=shared)
+
+        env = build_environment(
+            nominal['latitude'], nominal['longitude'],
+            nominal['elevation_m'] + dispersion['altitude'],
+            nominal['wind_speed'] * (1 + dispersion['wind_magnitude'] / 100),
+            nominal['wind_direction'] + dispersion['wind_direction']
+        )
+        motor = build_motor(
+            df_thrust, propellant_mass,
+            nominal['use_custom_thrust'], nominal['avg_thrust'], nominal['burn_time'],
+            thrust_scale=1 + dispersion['thrust_magnitude'] / 100,
+            thrust_file=None if shared else THRUST_FILE
+        )
+        rocket = build_rocket(
+            motor, nominal['parachute_cd'], nominal['parachute_diameter'],
+            drag_scale=1 + dispersion['drag'] / 100,
+            misalignment_yaw=dispersion['thrust_yaw'],
+            misalignment_pitch=dispersion['thrust_pitch']
+        )
+        flight = run_flight(
+            rocket, env, nominal['rail_length'],
+            min(nominal['inclination'] + dispersion['elevation'], 90.0),
+            (nominal['heading'] + dispersion['azimuth']) % 360
+        )
+        result.update(flight_summary(flight))
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    return result
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Shared RocketPy Simulation Pipeline
+Environment, motor and rocket builders for the Streamlit app and worker processes
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from rocketpy import Environment, GenericMotor, Rocket, Flight
+
+from shared_tables import frame
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+THRUST_FILE = DATA_DIR / "motors" / "hybrid_thrust_curve.csv"
+MASS_FILE = DATA_DIR / "mass_properties" / "time_varying_mass.csv"
+
+# Distance from the nozzle to the dry centre of mass (m); converts a thrust
+# misalignment angle into the equivalent thrust eccentricity
+NOZZLE_LEVER_ARM = 0.9
+
+
+# =============================================================================
+# INPUT DATA
+# =============================================================================
+
+def load_motor_data(thrust_file=THRUST_FILE, mass_file=MASS_FILE, tables=None):
+    """Thrust curve table and propellant mass from the converted PyROPS data
+
+    tables, the attached manifest of a registry filled by publish_motor_data,
+    replaces reading the CSVs; the thrust frame then views shared memory.
+    """
+    if tables is not None:
+        mass = tables['mass.mass']
+        return frame(tables, 'thrust'), float(mass[0] - mass[-1])
+
+    df_thrust = pd.read_csv(thrust_file)
+    df_mass = pd.read_csv(mass_file)
+    propellant_mass = df_mass.iloc[0]['mass'] - df_mass.iloc[-1]['mass']
+    return df_thrust, float(propellant_mass)
+
+
+def publish_motor_data(registry, thrust_file=THRUST_FILE, mass_file=MASS_FILE):
+    """Place the thrust and mass tables in a TableRegistry for worker processes"""
+    registry.publish_frame('thrust', pd.read_csv(thrust_file))
+    registry.publish_frame('mass', pd.read_csv(mass_file))
+    return registry
+
+
+# =============================================================================
+# BUILDERS
+# =============================================================================
+
+def build_environment(latitude, longitude, elevation_m, wind_speed, wind_direction):
+    """Standard atmosphere with a constant wind"""
+    env = Environment(latitude=latitude, longitude=longitude, elevation=elevation_m)
+    env.set_date((2025, 10, 19, 12))
+
+    # Wind components
+    wind_direction_rad = np.radians(wind_direction)
+    wind_u = wind_speed * np.sin(wind_direction_rad)
+    wind_v = wind_speed * np.cos(wind_direction_rad)
+    env.set_atmospheric_model(type='standard_atmosphere', wind_u=wind_u, wind_v=wind_v)
+    return env
+
+
+def build_motor(df_thrust, propellant_mass, use_custom_thrust=True, avg_thrust=None,
+                burn_time=None, thrust_scale=1.0, thrust_file=THRUST_FILE):
+    """Hybrid motor from the PyROPS thrust curve, or a constant-thrust motor
+
+    With thrust_file=None the curve is always taken from df_thrust, so a
+    worker using shared tables never re-reads the CSV.
+    """
+    if use_custom_thrust:
+        if thrust_scale == 1.0 and thrust_file is not None:
+            thrust_source = str(thrust_file)
+        else:
+            thrust_source = np.column_stack([df_thrust['time'], df_thrust['thrust'] * thrust_scale])
+        burn_time = df_thrust['time'].max()
+    else:
+        thrust_source = avg_thrust * thrust_scale
+
+    return GenericMotor(
+        thrust_source=thrust_source,
+        burn_time=burn_time,
+        dry_mass=5.0,
+        dry_inertia=(0.1, 0.1, 0.01),
+        nozzle_radius=0.047,
+        center_of_dry_mass_position=1.8,
+        nozzle_position=0.0,
+        chamber_radius=0.075,
+        chamber_height=0.5,
+        chamber_position=1.5,
+        propellant_initial_mass=propellant_mass,
+        interpolation_method='linear',
+        coordinate_system_orientation='nozzle_to_combustion_chamber'
+    )
+
+
+def build_rocket(motor, parachute_cd, parachute_diameter, drag_scale=1.0,
+                 misalignment_yaw=0.0, misalignment_pitch=0.0):
+    """Airframe with motor, nose, fins, parachute and rail buttons
+
+    drag_scale multiplies both drag curves; misalignment angles (deg) are
+    applied as an equivalent thrust eccentricity at the nozzle.
+    """
+    rocket = Rocket(
+        radius=0.087,
+        mass=32.8,
+        inertia=(1, 100, 100),
+        power_off_drag=0.45 * drag_scale,
+        power_on_drag=0.48 * drag_scale,
+        center_of_mass_without_motor=2.4,
+        coordinate_system_orientation='tail_to_nose'
+    )
+
+    rocket.add_motor(motor, position=1.5)
+
+    rocket.add_nose(length=0.55, kind='ogive', position=4.92)
+
+    rocket.add_trapezoidal_fins(
+        n=4, root_chord=0.4, tip_chord=0.2, span=0.2,
+        position=0.8, cant_angle=0
+    )
+
+    rocket.add_parachute(
+        name='Main',
+        cd_s=parachute_cd * np.pi * (parachute_diameter / 2) ** 2,
+        trigger='apogee',
+        sampling_rate=105,
+        lag=0,
+        noise=(0, 0, 0)
+    )
+
+    rocket.set_rail_buttons(
+        upper_button_position=6.5,
+        lower_button_position=0.5,
+        angular_position=45
+    )
+
+    if misalignment_yaw or misalignment_pitch:
+        rocket.add_thrust_eccentricity(
+            x=NOZZLE_LEVER_ARM * np.sin(np.radians(misalignment_pitch)),
+            y=NOZZLE_LEVER_ARM * np.sin(np.radians(misalignment_yaw))
+        )
+    return rocket
+
+
+def run_flight(rocket, env, rail_length, inclination, heading):
+    """Full flight to impact"""
+    return Flight(
+        rocket=rocket,
+        environment=env,
+        rail_length=rail_length,
+        inclination=inclination,
+        heading=heading,
+        max_time=3600,  # 1 hour - plenty of time for descent
+        max_time_step=0.5,
+        terminate_on_apogee=False,
+        verbose=False
+    )
+
+
+def flight_summary(flight):
+    """Scalar results of a flight, small enough to send between processes"""
+    return {
+        'apogee': float(flight.apogee),
+        'apogee_time': float(flight.apogee_time),
+        'max_speed': float(flight.max_speed),
+        'max_mach': float(flight.max_mach_number),
+        'x_impact': float(flight.x_impact),
+        'y_impact': float(flight.y_impact),
+        'impact_velocity': float(flight.impact_velocity),
+        'flight_time': float(flight.t_final),
+    }
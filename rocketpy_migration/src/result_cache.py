@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Result Cache
+On-disk store of flight summaries and compact trajectories, keyed by a hash of
+every input value and the contents of every input file
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).parent.parent / "outputs" / "cache"
+
+# Set ROCKETPY_RESULT_CACHE=off to always recompute (the benchmark harness does)
+CACHE_ENABLED = os.environ.get('ROCKETPY_RESULT_CACHE', 'on').lower() not in ('0', 'off', 'false', 'no')
+
+# Flight attributes kept as scalars, and Function attributes kept as (time, value) arrays
+SUMMARY_ATTRIBUTES = (
+    'apogee', 'apogee_time', 'apogee_x', 'apogee_y',
+    'max_speed', 'max_mach_number', 'max_acceleration',
+    'out_of_rail_time', 'out_of_rail_velocity',
+    't_final', 'impact_velocity', 'x_impact', 'y_impact',
+)
+TRAJECTORY_SERIES = ('z', 'speed', 'acceleration', 'x', 'y')
+
+# (path, size, mtime) -> sha256, so unchanged files are hashed once per process
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents, memoised on its size and modification time"""
+    path = Path(path).resolve()
+    stat = path.stat()
+    signature = (str(path), stat.st_size, stat.st_mtime_ns)
+
+    with _digests_lock:
+        if signature in _digests:
+            return _digests[signature]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+
+    with _digests_lock:
+        _digests[signature] = digest.hexdigest()
+    return _digests[signature]
+
+
+def input_key(inputs, files=()):
+    """Canonical hash of the input values plus the digest of each referenced file
+
+    Editing any file changes its digest and so the key, which makes entries
+    computed from the old contents unreachable (they age out through eviction).
+    """
+    canonical = json.dumps({
+        'inputs': inputs,
+        'files': sorted((Path(path).name, file_digest(path)) for path in files),
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def trajectory_arrays(flight):
+    """Trajectory columns sliced from the flight's Function sources"""
+    source = np.asarray(flight.z.source)
+    arrays = {'time': source[:, 0]}
+    for name in TRAJECTORY_SERIES:
+        arrays[name] = np.asarray(getattr(flight, name).source)[:, 1]
+    return arrays
+
+
+class CachedFlight:
+    """Stand-in for a RocketPy Flight rebuilt from a cache entry
+
+    Exposes the scalar results and the .source arrays of the trajectory
+    series, which is everything the scripts and the Streamlit views read.
+    """
+
+    def __init__(self, summary, arrays):
+        for name, value in summary.items():
+            setattr(self, name, value)
+        for name in TRAJECTORY_SERIES:
+            setattr(self, name, SimpleNamespace(source=np.column_stack([arrays['time'], arrays[name]])))
+
+
+class ResultCache:
+    """Size-bounded LRU of flight results under one directory
+
+    Each entry is a compressed .npz named by its key. Reads refresh the
+    file's modification time, and writes evict the least recently used
+    entries once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=256 * 1024 ** 2):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key):
+        return self.directory / f"{key}.npz"
+
+    def load(self, key):
+        """CachedFlight for key, or None on a miss"""
+        if not CACHE_ENABLED:
+            return None
+
+        path = self._path(key)
+        try:
+            with np.load(path) as entry:
+                summary = json.loads(str(entry['summary']))
+                arrays = {name: entry[name] for name in ('time',) + TRAJECTORY_SERIES}
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            return None
+
+        # Another process may evict the entry between the read and the touch
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return CachedFlight(summary, arrays)
+
+    def store(self, key, flight):
+        """Save a flight's summary and trajectory under key"""
+        if not CACHE_ENABLED:
+            return
+
+        summary = {name: float(getattr(flight, name)) for name in SUMMARY_ATTRIBUTES}
+        arrays = trajectory_arrays(flight)
+
+        # Write beside the target and rename, so readers never see a partial file. The
+        # temporary does not end in .npz, so another process's evict() cannot delete it
+        temporary = self.directory / f"{key}.{os.getpid()}.{threading.get_ident()}.npz.tmp"
+        with open(temporary, 'wb') as file:
+            np.savez_compressed(file, summary=np.array(json.dumps(summary)), **arrays)
+        os.replace(temporary, self._path(key))
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes
+
+        Only finished entries (*.npz) are candidates; in-flight *.npz.tmp files
+        of other writers are left alone.
+        """
+        entries = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
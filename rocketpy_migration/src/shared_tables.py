@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Shared Read-Only Tables
+Input arrays placed once in named shared memory (or memory-mapped .npy files)
+so worker processes attach to them zero-copy instead of each parsing its own
+copy of the CSVs
+"""
+
+import atexit
+import os
+import shutil
+import sys
+import uuid
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+TABLES_DIR = Path(__file__).parent.parent / "outputs" / "tables"
+
+BACKENDS = ('shm', 'npy')
+
+# location -> (shared memory block or None, read-only view); attached once per process
+_attached = {}
+
+
+class TableRegistry:
+    """Owner of a set of named read-only arrays
+
+    The parent publishes each array once and hands registry.manifest (a small
+    picklable dict) to its workers, which call attach(manifest) to get views
+    onto the same memory. The arrays live until close(); use the registry as a
+    context manager around the worker pool.
+
+    backend='shm' uses POSIX/Windows named shared memory; backend='npy' writes
+    .npy files under TABLES_DIR that workers memory-map read-only, which also
+    works for workers started outside this process tree.
+    """
+
+    def __init__(self, backend='shm', directory=TABLES_DIR):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown table backend '{backend}', expected one of {BACKENDS}")
+        self.backend = backend
+        self.prefix = f"pyrops_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        self.directory = Path(directory) / self.prefix
+        self.manifest = {}
+        self._blocks = []
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def publish(self, name, array):
+        """Copy one array into the registry under name"""
+        if name in self.manifest:
+            raise KeyError(f"Table '{name}' is already published")
+        array = np.ascontiguousarray(array)
+        if array.dtype.hasobject:
+            raise TypeError(f"Table '{name}' has dtype {array.dtype}; only numeric arrays can be shared")
+
+        if self.backend == 'shm':
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1),
+                                               name=f"{self.prefix}_{len(self._blocks)}")
+            np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+            self._blocks.append(block)
+            location = block.name
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            location = str(self.directory / f"{len(self.manifest)}.npy")
+            np.save(location, array)
+
+        self.manifest[name] = {
+            'backend': self.backend,
+            'location': location,
+            'shape': array.shape,
+            'dtype': array.dtype.str,
+        }
+        return self
+
+    def publish_frame(self, prefix, df):
+        """Publish each numeric column of a DataFrame as '<prefix>.<column>'"""
+        for column in df.columns:
+            self.publish(f"{prefix}.{column}", df[column].to_numpy())
+        return self
+
+    def close(self):
+        """Release the shared blocks (or delete the .npy files); safe to call twice"""
+        for block in self._blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+        if self.backend == 'npy':
+            shutil.rmtree(self.directory, ignore_errors=True)
+        self.manifest = {}
+        atexit.unregister(self.close)
+
+
+def _open_block(name):
+    """Attach to an existing block; only the publishing registry unlinks it
+
+    Before Python 3.13 attaching always registers the block with the resource
+    tracker. Workers spawned or forked by the publisher share its tracker, so
+    that is the same entry the registry removes on unlink. Unrelated processes
+    should use the 'npy' backend instead.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def attach(manifest):
+    """Read-only views of every table in a registry manifest, keyed by name
+
+    Attaching is memoised per process, so a worker that runs many flights maps
+    each table once.
+    """
+    tables = {}
+    for name, entry in manifest.items():
+        location = entry['location']
+        if location not in _attached:
+            if entry['backend'] == 'shm':
+                block = _open_block(location)
+                array = np.ndarray(tuple(entry['shape']), np.dtype(entry['dtype']), buffer=block.buf)
+            else:
+                block = None
+                array = np.load(location, mmap_mode='r')
+            array.flags.writeable = False
+            _attached[location] = (block, array)
+        tables[name] = _attached[location][1]
+    return tables
+
+
+def frame(tables, prefix):
+    """DataFrame over the '<prefix>.<column>' tables of an attached manifest, without copying"""
+    columns = {name[len(prefix) + 1:]: array for name, array in tables.items()
+               if name.startswith(prefix + '.')}
+    if not columns:
+        raise KeyError(f"No tables published under '{prefix}'")
+    return pd.DataFrame(columns, copy=False)
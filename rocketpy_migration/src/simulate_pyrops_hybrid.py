@@ -13,6 +13,9 @@ import numpy as np
 from rocketpy import Environment, SolidMotor, Rocket, Flight
 from rocketpy import Function
 
+from result_cache import ResultCache, input_key, trajectory_arrays
+from aero_surface import AeroSurface
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -240,27 +243,16 @@ rocket.add_parachute(
 # Load custom drag curve from RASAero data
 print("\nLoading custom aerodynamics from RASAero...")
 aero_file = data_dir / config['aerodynamics']['file']
-df_aero = pd.read_csv(aero_file)
-
-# For now, use a simplified drag coefficient (CD at alpha=0)
-# TODO: Implement full 2D interpolation for CD(Mach, Alpha)
-df_cd_alpha0 = df_aero[df_aero['Alpha'] == 0.0][['Mach', 'CD']].values
-rocket.power_off_drag = Function(
-    df_cd_alpha0,
-    inputs='Mach',
-    outputs='Drag Coefficient',
-    interpolation='linear'
-)
 
-df_cd_poweron = df_aero[df_aero['Alpha'] == 0.0][['Mach', 'CD Power-On']].values
-rocket.power_on_drag = Function(
-    df_cd_poweron,
-    inputs='Mach',
-    outputs='Drag Coefficient',
-    interpolation='linear'
-)
+# Mach x alpha grid, loaded from its saved .grid.npz unless the CSV changed.
+# RocketPy drag is a function of Mach only, so take the alpha = 0 section;
+# aero.cd/cn/cp(mach, alpha) give the full bilinear surface.
+aero = AeroSurface.load(aero_file)
+rocket.power_off_drag = aero.drag_function('CD', alpha=0.0)
+rocket.power_on_drag = aero.drag_function('CD Power-On', alpha=0.0)
 
 print(f"   ✓ Aerodynamics loaded from {aero_file.name}")
+print(f"   - Grid: {len(aero.mach)} Mach x {len(aero.alpha)} alpha points")
 print(f"   - Mach range: {config['aerodynamics']['mach_range'][0]:.3f} to {config['aerodynamics']['mach_range'][1]:.3f}")
 
 # Set rail configuration
@@ -280,18 +272,30 @@ print("\n" + "=" * 80)
 print("4. RUNNING FLIGHT SIMULATION")
 print("=" * 80)
 
-# Create flight
-flight = Flight(
-    rocket=rocket,
-    environment=env,
-    rail_length=config['launch_conditions']['rail_length_m'],
-    inclination=config['launch_conditions']['elevation_deg'],
-    heading=config['launch_conditions']['azimuth_deg'],
-    max_time=1200,  # Maximum simulation time (20 minutes)
-    max_time_step=0.1,
-    terminate_on_apogee=False,
-    verbose=True
+# Reuse a stored flight when the launch date, this script and every data file are unchanged
+cache = ResultCache()
+cache_key = input_key(
+    {'simulation_type': 'pyrops_hybrid', 'launch_date': [tomorrow.year, tomorrow.month, tomorrow.day]},
+    [__file__, data_dir / "conversion_summary.json", atm_file, wind_file, thrust_file, aero_file]
 )
+flight = cache.load(cache_key)
+
+if flight is not None:
+    print("\nLoaded from result cache")
+else:
+    # Create flight
+    flight = Flight(
+        rocket=rocket,
+        environment=env,
+        rail_length=config['launch_conditions']['rail_length_m'],
+        inclination=config['launch_conditions']['elevation_deg'],
+        heading=config['launch_conditions']['azimuth_deg'],
+        max_time=1200,  # Maximum simulation time (20 minutes)
+        max_time_step=0.1,
+        terminate_on_apogee=False,
+        verbose=True
+    )
+    cache.store(cache_key, flight)
 
 print("\nFlight simulation complete!")
 print("=" * 80)
@@ -371,9 +375,10 @@ print(f"Landing Distance:     {np.sqrt(flight.x_impact**2 + flight.y_impact**2):
 print(f"Out of Rail Velocity: {flight.out_of_rail_velocity:>10.2f} m/s")
 print("-" * 80)
 
-# Print detailed flight info
-print("\nDetailed flight information:")
-flight.info()
+# Print detailed flight info (only available for a freshly computed flight)
+if hasattr(flight, 'info'):
+    print("\nDetailed flight information:")
+    flight.info()
 
 # =============================================================================
 # 6. SAVE TRAJECTORY DATA
@@ -383,15 +388,15 @@ print("6. SAVING TRAJECTORY DATA")
 print("=" * 80)
 
 # Export trajectory to CSV
-# RocketPy stores trajectory in flight object
-# Access the solution arrays
+# Slice the (time, value) source arrays of the flight's Function objects
+arrays = trajectory_arrays(flight)
 trajectory_data = {
-    'time': flight.time,
-    'altitude': flight.z,
-    'velocity': flight.speed,
-    'acceleration': flight.acceleration,
-    'x_position': flight.x,
-    'y_position': flight.y,
+    'time': arrays['time'],
+    'altitude': arrays['z'],
+    'velocity': arrays['speed'],
+    'acceleration': arrays['acceleration'],
+    'x_position': arrays['x'],
+    'y_position': arrays['y'],
 }
 
 df_trajectory = pd.DataFrame(trajectory_data)
@@ -12,6 +12,8 @@ import numpy as np
 
 from rocketpy import Environment, GenericMotor, Rocket, Flight
 
+from result_cache import ResultCache, input_key
+
 # =============================================================================
 # SIMPLIFIED CONFIGURATION
 # =============================================================================
@@ -162,17 +164,26 @@ print("4. RUNNING SIMULATION")
 print("=" * 80)
 
 try:
-    flight = Flight(
-        rocket=rocket,
-        environment=env,
-        rail_length=7.0,
-        inclination=80,  # degrees from horizontal
-        heading=260,  # -100° in PyROPS convention
-        max_time=3600,  # 1 hour - enough time for full descent
-        max_time_step=0.5,
-        terminate_on_apogee=False,
-        verbose=False  # Disable verbose to avoid stuck output
-    )
+    # Every setting above lives in this script, so its own digest keys the inputs
+    cache = ResultCache()
+    cache_key = input_key({'simulation_type': 'simplified'}, [__file__, thrust_file, mass_file])
+    flight = cache.load(cache_key)
+
+    if flight is not None:
+        print("\n✓ Loaded from result cache")
+    else:
+        flight = Flight(
+            rocket=rocket,
+            environment=env,
+            rail_length=7.0,
+            inclination=80,  # degrees from horizontal
+            heading=260,  # -100° in PyROPS convention
+            max_time=3600,  # 1 hour - enough time for full descent
+            max_time_step=0.5,
+            terminate_on_apogee=False,
+            verbose=False  # Disable verbose to avoid stuck output
+        )
+        cache.store(cache_key, flight)
 
     print("\n✓ SIMULATION COMPLETE!")
 
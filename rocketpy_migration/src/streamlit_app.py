@@ -7,13 +7,25 @@ Interactive web app for engineers to run and visualize rocket simulations
 import streamlit as st
 import pandas as pd
 import numpy as np
+import io
+import gzip
 import json
+import hashlib
+import time
+import os
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 
-from rocketpy import Environment, GenericMotor, Rocket, Flight
+import pipeline
+from monte_carlo import UNCERTAINTIES, sample_dispersions, simulate_dispersed
+from jobs import JobQueue, Prototypes
+from result_cache import ResultCache, input_key
+from shared_tables import TableRegistry
 import folium
 from streamlit_folium import st_folium
 
@@ -37,6 +49,8 @@ st.sidebar.header("Simulation Parameters")
 # =============================================================================
 
 with st.sidebar:
+    mode = st.radio("Mode", ["Single Flight", "Monte Carlo"], horizontal=True)
+
     st.subheader("📍 Launch Site")
     latitude = st.number_input("Latitude (°)", value=-34.6, format="%.4f")
     longitude = st.number_input("Longitude (°)", value=20.3, format="%.4f")
@@ -57,134 +71,408 @@ with st.sidebar:
     if not use_custom_thrust:
         avg_thrust = st.number_input("Average Thrust (N)", value=4000.0, min_value=100.0)
         burn_time = st.number_input("Burn Time (s)", value=12.8, min_value=0.1)
+    else:
+        # Constant-thrust inputs are hidden and must not split the caches
+        avg_thrust, burn_time = None, None
 
     st.subheader("🪂 Recovery")
     parachute_cd = st.number_input("Parachute CD", value=2.2, min_value=0.5, max_value=3.0)
     parachute_diameter = st.number_input("Parachute Diameter (m)", value=1.22, min_value=0.1)
 
+    if mode == "Monte Carlo":
+        st.subheader("🎲 Monte Carlo")
+        mc_runs = st.number_input("Runs", value=500, min_value=1, step=50)
+        mc_workers = st.number_input("Worker Processes", value=os.cpu_count() or 1,
+                                     min_value=1, max_value=max(os.cpu_count() or 1, 1) * 2)
+        mc_seed = st.number_input("Random Seed (0 = random)", value=0, min_value=0)
+
+        mc_bounds = {}
+        with st.expander("Uncertainty Bounds", expanded=False):
+            for key, (label, lower, upper) in UNCERTAINTIES.items():
+                bound_col1, bound_col2 = st.columns(2)
+                mc_bounds[key] = (
+                    bound_col1.number_input(f"{label} lower", value=lower, key=f"mc_{key}_lower"),
+                    bound_col2.number_input(f"{label} upper", value=upper, key=f"mc_{key}_upper"),
+                )
+
 # =============================================================================
-# SIMULATION BUTTON
+# CACHED PIPELINE
 # =============================================================================
+# Every widget change reruns this script, so the expensive stages are cached and
+# keyed only on the parameters that affect them. Data files are keyed on their
+# modification time so an edited CSV is picked up without restarting the app.
 
-if st.sidebar.button("🚀 Run Simulation", type="primary"):
+THRUST_FILE = pipeline.THRUST_FILE
+MASS_FILE = pipeline.MASS_FILE
 
-    # Progress indicator
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+# Completed flights kept per browser session (least recently used dropped first)
+FLIGHT_CACHE_SIZE = 16
 
-    try:
-        # Load data
-        data_dir = Path(__file__).parent.parent / "data"
-
-        status_text.text("Loading thrust curve...")
-        progress_bar.progress(10)
-
-        thrust_file = data_dir / "motors" / "hybrid_thrust_curve.csv"
-        df_thrust = pd.read_csv(thrust_file)
-
-        mass_file = data_dir / "mass_properties" / "time_varying_mass.csv"
-        df_mass = pd.read_csv(mass_file)
-        propellant_mass = df_mass.iloc[0]['mass'] - df_mass.iloc[-1]['mass']
-
-        # Environment
-        status_text.text("Setting up environment...")
-        progress_bar.progress(25)
-
-        env = Environment(latitude=latitude, longitude=longitude, elevation=elevation_m)
-        env.set_date((2025, 10, 19, 12))
-        env.set_atmospheric_model(type='standard_atmosphere')
-
-        # Wind components
-        wind_direction_rad = np.radians(wind_direction)
-        wind_u = wind_speed * np.sin(wind_direction_rad)
-        wind_v = wind_speed * np.cos(wind_direction_rad)
-        env.set_atmospheric_model(type='standard_atmosphere', wind_u=wind_u, wind_v=wind_v)
-
-        # Motor
-        status_text.text("Configuring motor...")
-        progress_bar.progress(40)
-
-        motor = GenericMotor(
-            thrust_source=str(thrust_file) if use_custom_thrust else avg_thrust,
-            burn_time=df_thrust['time'].max() if use_custom_thrust else burn_time,
-            dry_mass=5.0,
-            dry_inertia=(0.1, 0.1, 0.01),
-            nozzle_radius=0.047,
-            center_of_dry_mass_position=1.8,
-            nozzle_position=0.0,
-            chamber_radius=0.075,
-            chamber_height=0.5,
-            chamber_position=1.5,
-            propellant_initial_mass=propellant_mass,
-            interpolation_method='linear',
-            coordinate_system_orientation='nozzle_to_combustion_chamber'
-        )
+# Points sent to each Plotly trace; roughly one per screen pixel column
+PLOT_POINTS = 2000
 
-        # Rocket
-        status_text.text("Building rocket...")
-        progress_bar.progress(55)
-
-        rocket = Rocket(
-            radius=0.087,
-            mass=32.8,
-            inertia=(1, 100, 100),
-            power_off_drag=0.45,
-            power_on_drag=0.48,
-            center_of_mass_without_motor=2.4,
-            coordinate_system_orientation='tail_to_nose'
-        )
+# Seconds between live chart refreshes during a Monte Carlo campaign
+MC_REFRESH = 0.5
 
-        rocket.add_motor(motor, position=1.5)
+# Flights simulated concurrently across all sessions, and the job poll interval (s)
+MAX_JOBS = int(os.environ.get('ROCKETPY_MAX_JOBS', 2))
+JOB_POLL = 0.5
 
-        rocket.add_nose(length=0.55, kind='ogive', position=4.92)
 
-        rocket.add_trapezoidal_fins(
-            n=4, root_chord=0.4, tip_chord=0.2, span=0.2,
-            position=0.8, cant_angle=0
-        )
+def file_version(path):
+    """Modification time used to invalidate caches when a data file changes"""
+    return Path(path).stat().st_mtime_ns
 
-        rocket.add_parachute(
-            name='Main',
-            cd_s=parachute_cd * np.pi * (parachute_diameter / 2) ** 2,
-            trigger='apogee',
-            sampling_rate=105,
-            lag=0,
-            noise=(0, 0, 0)
-        )
 
-        rocket.set_rail_buttons(
-            upper_button_position=6.5,
-            lower_button_position=0.5,
-            angular_position=45
-        )
+# Inputs that define the environment and the rocket; the data file versions are
+# part of the rocket key, so an edited CSV builds a new rocket
+ENVIRONMENT_INPUTS = ('latitude', 'longitude', 'elevation_m', 'wind_speed', 'wind_direction')
+ROCKET_INPUTS = ('use_custom_thrust', 'avg_thrust', 'burn_time', 'thrust_version', 'mass_version',
+                 'parachute_cd', 'parachute_diameter')
+
+
+@st.cache_resource
+def environments():
+    """Environments shared by every session; each flight gets its own copy"""
+    return Prototypes(max_entries=32)
+
+
+@st.cache_resource
+def rockets():
+    """Rockets shared by every session; each flight gets its own copy"""
+    return Prototypes(max_entries=16)
+
+
+def build_rocket(use_custom_thrust, avg_thrust, burn_time, thrust_version, mass_version,
+                 parachute_cd, parachute_diameter):
+    """Airframe with motor, nose, fins, parachute and rail buttons"""
+    df_thrust, propellant_mass = pipeline.load_motor_data(THRUST_FILE, MASS_FILE)
+    motor = pipeline.build_motor(df_thrust, propellant_mass, use_custom_thrust, avg_thrust, burn_time)
+    return pipeline.build_rocket(motor, parachute_cd, parachute_diameter)
+
+
+def input_digest(inputs):
+    """Stable hash of every input that affects the flight"""
+    encoded = json.dumps(inputs, sort_keys=True, default=float).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def flight_cache():
+    """Per-session LRU of completed flights, so sessions never evict each other"""
+    if 'flight_cache' not in st.session_state:
+        st.session_state['flight_cache'] = OrderedDict()
+    return st.session_state['flight_cache']
+
+
+def lttb_indices(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling: indices of the points that best preserve the curve shape"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Interior split into threshold-2 buckets; first and last points always kept
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+
+        # Pick the point forming the largest triangle with the last pick and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def downsample(df, x, columns, threshold=PLOT_POINTS):
+    """Rows kept by LTTB on each of the columns against x, merged so every feature survives"""
+    keep = np.unique(np.concatenate([
+        lttb_indices(df[x].to_numpy(), df[column].to_numpy(), threshold) for column in columns
+    ]))
+    return df.iloc[keep]
 
-        # Flight simulation
-        status_text.text("Running simulation...")
-        progress_bar.progress(70)
-
-        flight = Flight(
-            rocket=rocket,
-            environment=env,
-            rail_length=rail_length,
-            inclination=inclination,
-            heading=heading,
-            max_time=3600,  # 1 hour - plenty of time for descent
-            max_time_step=0.5,
-            terminate_on_apogee=False,
-            verbose=False
+
+@st.cache_data(show_spinner=False, max_entries=FLIGHT_CACHE_SIZE)
+def export_csv(key, _trajectory_df):
+    """Full-resolution trajectory as gzip-compressed CSV, built once per flight"""
+    return gzip.compress(_trajectory_df.to_csv(index=False).encode('utf-8'))
+
+
+@st.cache_data(show_spinner=False, max_entries=FLIGHT_CACHE_SIZE)
+def export_parquet(key, _trajectory_df):
+    """Full-resolution trajectory as Parquet, or None when no Parquet engine is installed"""
+    buffer = io.BytesIO()
+    try:
+        _trajectory_df.to_parquet(buffer, index=False)
+    except ImportError:
+        return None
+    return buffer.getvalue()
+
+
+# =============================================================================
+# MONTE CARLO MODE
+# =============================================================================
+
+def render_dispersion(results, landing_slot, apogee_slot):
+    """Landing scatter and apogee histogram of the successful runs so far"""
+    df = pd.DataFrame([result for result in results if 'error' not in result])
+    if df.empty:
+        return
+
+    fig_landing = go.Figure()
+    fig_landing.add_trace(go.Scattergl(
+        x=df['x_impact'],
+        y=df['y_impact'],
+        mode='markers',
+        name='Landing',
+        marker=dict(
+            size=5,
+            color=df['apogee'],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title="Apogee (m)")
+        ),
+        customdata=df['run'],
+        hovertemplate="Run %{customdata}<br>East %{x:.0f} m<br>North %{y:.0f} m<extra></extra>"
+    ))
+    fig_landing.add_trace(go.Scatter(
+        x=[0],
+        y=[0],
+        mode='markers',
+        name='Launch',
+        marker=dict(size=15, color='green', symbol='circle')
+    ))
+    fig_landing.update_layout(
+        title=f"Landing Dispersion ({len(df)} runs)",
+        xaxis_title="East (m)",
+        yaxis_title="North (m)",
+        hovermode='closest',
+        height=500,
+        yaxis=dict(scaleanchor="x", scaleratio=1)  # Equal aspect ratio
+    )
+    landing_slot.plotly_chart(fig_landing, use_container_width=True)
+
+    fig_apogee = px.histogram(df, x='apogee', nbins=40, labels={'apogee': "Apogee (m)"})
+    fig_apogee.update_layout(title="Apogee Distribution", height=500)
+    apogee_slot.plotly_chart(fig_apogee, use_container_width=True)
+
+
+if mode == "Monte Carlo":
+    st.header("🎲 Monte Carlo Dispersion")
+
+    metrics_slot = st.empty()
+    chart_col1, chart_col2 = st.columns(2)
+    landing_slot = chart_col1.empty()
+    apogee_slot = chart_col2.empty()
+
+    if st.sidebar.button("🎲 Run Monte Carlo", type="primary"):
+        nominal = {
+            'latitude': latitude, 'longitude': longitude, 'elevation_m': elevation_m,
+            'rail_length': rail_length, 'inclination': inclination, 'heading': heading,
+            'wind_speed': wind_speed, 'wind_direction': wind_direction,
+            'use_custom_thrust': use_custom_thrust, 'avg_thrust': avg_thrust, 'burn_time': burn_time,
+            'parachute_cd': parachute_cd, 'parachute_diameter': parachute_diameter,
+        }
+        samples = sample_dispersions(mc_bounds, int(mc_runs), seed=int(mc_seed) or None)
+
+        progress_bar = st.progress(0)
+        results = []
+        start = time.perf_counter()
+        refreshed = start
+
+        # Spawned workers import pipeline fresh instead of forking the server;
+        # the motor tables are read once here and shared with every worker
+        context = multiprocessing.get_context('spawn')
+        with TableRegistry() as tables:
+            pipeline.publish_motor_data(tables)
+            pool = ProcessPoolExecutor(max_workers=int(mc_workers), mp_context=context)
+            try:
+                futures = [pool.submit(simulate_dispersed, nominal, sample, tables.manifest) for sample in samples]
+
+                for future in as_completed(futures):
+                    results.append(future.result())
+
+                    now = time.perf_counter()
+                    if now - refreshed >= MC_REFRESH or len(results) == len(samples):
+                        refreshed = now
+                        rate = len(results) / (now - start)
+                        progress_bar.progress(len(results) / len(samples))
+                        metrics_slot.caption(
+                            f"{len(results)} / {len(samples)} runs | {rate:.2f} runs/s | "
+                            f"~{(len(samples) - len(results)) / rate:.0f} s remaining"
+                        )
+                        render_dispersion(results, landing_slot, apogee_slot)
+            finally:
+                # A widget interaction (or closing the tab) stops the script by raising
+                # in this loop; drop the queued runs rather than waiting for them all
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        st.session_state['mc_results'] = sorted(results, key=lambda result: result['run'])
+        st.session_state['mc_elapsed'] = time.perf_counter() - start
+
+    if 'mc_results' in st.session_state:
+        results = st.session_state['mc_results']
+        failed = [result for result in results if 'error' in result]
+        mc_df = pd.DataFrame(results)
+
+        metrics_slot.caption(
+            f"{len(results)} runs in {st.session_state['mc_elapsed']:.1f} s "
+            f"({len(results) / st.session_state['mc_elapsed']:.2f} runs/s)"
+        )
+        render_dispersion(results, landing_slot, apogee_slot)
+
+        if failed:
+            st.warning(f"⚠️ {len(failed)} runs failed; see the 'error' column of the results")
+
+        if len(failed) < len(results):
+            ok_df = pd.DataFrame([result for result in results if 'error' not in result])
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Mean Apogee", f"{ok_df['apogee'].mean():,.1f} m",
+                          f"σ {ok_df['apogee'].std():,.1f} m", delta_color="off")
+            with col2:
+                st.metric("Mean Landing East", f"{ok_df['x_impact'].mean():,.0f} m",
+                          f"σ {ok_df['x_impact'].std():,.0f} m", delta_color="off")
+            with col3:
+                st.metric("Mean Landing North", f"{ok_df['y_impact'].mean():,.0f} m",
+                          f"σ {ok_df['y_impact'].std():,.0f} m", delta_color="off")
+
+        st.dataframe(mc_df, use_container_width=True, height=300)
+        st.download_button(
+            label="📥 Download Monte Carlo Results",
+            data=mc_df.to_csv(index=False),
+            file_name=f"monte_carlo_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
         )
+    else:
+        st.info("👈 Set the uncertainty bounds in the sidebar and click **Run Monte Carlo** to begin")
 
-        progress_bar.progress(100)
-        status_text.text("✅ Simulation complete!")
+    # Footer
+    st.markdown("---")
+    st.caption("Built with RocketPy • Migrated from PyROPS • Powered by Streamlit")
+    st.stop()
 
-        # Store results in session state
-        st.session_state['flight'] = flight
-        st.session_state['simulation_time'] = datetime.now()
+# =============================================================================
+# SIMULATION BUTTON
+# =============================================================================
 
-    except Exception as e:
-        st.error(f"❌ Simulation failed: {e}")
-        import traceback
-        st.code(traceback.format_exc())
+@st.cache_resource
+def result_cache():
+    """On-disk flight results shared with the command-line scripts"""
+    return ResultCache()
+
+
+@st.cache_resource
+def job_queue():
+    """Job queue shared by every session; its worker cap bounds concurrent flights"""
+    return JobQueue(max_workers=MAX_JOBS)
+
+
+def simulate_single(report, inputs, cache, environments, rockets):
+    """Nominal flight; runs on a job queue worker thread
+
+    The result cache and the prototype stores come from Streamlit's resource
+    cache on the script thread that submitted the job, so the worker never
+    calls st.cache_* itself. The environment and rocket are private copies.
+    """
+    # Keyed on file contents (and the rocket definition) rather than mtimes
+    values = {name: value for name, value in inputs.items() if not name.endswith('_version')}
+    disk_key = input_key(values, [THRUST_FILE, MASS_FILE, pipeline.__file__])
+
+    report("Checking result cache...", 0.1)
+    flight = cache.load(disk_key)
+    if flight is not None:
+        return flight
+
+    report("Setting up environment...", 0.25)
+    environment = [inputs[name] for name in ENVIRONMENT_INPUTS]
+    env = environments.get(tuple(environment), lambda: pipeline.build_environment(*environment))
+
+    # Motor and rocket
+    report("Building rocket...", 0.5)
+    rocket_inputs = [inputs[name] for name in ROCKET_INPUTS]
+    rocket = rockets.get(tuple(rocket_inputs), lambda: build_rocket(*rocket_inputs))
+
+    # Flight simulation
+    report("Running simulation...", 0.7)
+    flight = pipeline.run_flight(
+        rocket, env, inputs['rail_length'], inputs['inclination'], inputs['heading']
+    )
+    cache.store(disk_key, flight)
+    return flight
+
+
+def store_flight(key, flight):
+    """Make a flight the displayed result and remember it in the session cache"""
+    cache = flight_cache()
+    cache[key] = flight
+    cache.move_to_end(key)
+    while len(cache) > FLIGHT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    # Store results in session state
+    st.session_state['flight'] = flight
+    st.session_state['flight_key'] = key
+    st.session_state['simulation_time'] = datetime.now()
+
+
+@st.fragment(run_every=JOB_POLL)
+def job_status():
+    """Poll the submitted job without rerunning the whole page"""
+    job_id, key = st.session_state['job']
+    queue = job_queue()
+    job = queue.get(job_id)
+
+    if job is None:
+        del st.session_state['job']
+        st.warning("⚠️ The simulation job expired before its result was collected; please run it again")
+        return
+
+    if job.active:
+        st.progress(job.progress, text=job.stage)
+        st.caption(f"Job {job.id} | {queue.pending()} job(s) queued or running "
+                   f"on {queue.max_workers} worker(s)")
+        return
+
+    del st.session_state['job']
+    if job.status == 'failed':
+        st.session_state['job_error'] = job.error
+    else:
+        store_flight(key, job.result)
+    st.rerun()
+
+
+if st.sidebar.button("🚀 Run Simulation", type="primary"):
+    inputs = {
+        'latitude': latitude, 'longitude': longitude, 'elevation_m': elevation_m,
+        'rail_length': rail_length, 'inclination': inclination, 'heading': heading,
+        'wind_speed': wind_speed, 'wind_direction': wind_direction,
+        'use_custom_thrust': use_custom_thrust, 'avg_thrust': avg_thrust, 'burn_time': burn_time,
+        'parachute_cd': parachute_cd, 'parachute_diameter': parachute_diameter,
+        'thrust_version': file_version(THRUST_FILE), 'mass_version': file_version(MASS_FILE),
+    }
+    key = input_digest(inputs)
+
+    if key in flight_cache():
+        store_flight(key, flight_cache()[key])
+        st.toast("✅ Loaded from cache")
+    else:
+        # Identical in-flight jobs (from any session) share one job id
+        job_id = job_queue().submit(key, simulate_single, inputs, result_cache(), environments(), rockets())
+        st.session_state['job'] = (job_id, key)
+
+if 'job' in st.session_state:
+    job_status()
+
+if 'job_error' in st.session_state:
+    error = st.session_state.pop('job_error')
+    st.error(f"❌ Simulation failed: {error.splitlines()[0]}")
+    st.code(error)
 
 # =============================================================================
 # RESULTS DISPLAY
@@ -229,23 +517,19 @@ if 'flight' in st.session_state:
     st.header("📈 Flight Trajectory")
 
     # Create trajectory dataframe
-    # RocketPy stores data as Function objects with source arrays
-    import numpy as np
-
-    # Extract the actual data arrays from RocketPy Function objects
-    # These are stored in the .source attribute as (x, y) pairs
+    # RocketPy stores data as Function objects whose .source is an (n, 2) array
+    # of (time, value) rows, so slice columns directly instead of iterating
     try:
-        # Try to get data from Function objects (RocketPy's internal structure)
         if hasattr(flight.z, 'source'):
-            # Data is stored as [[time, altitude], [time, altitude], ...]
-            time_data = np.array([point[0] for point in flight.z.source])
-            alt_data = np.array([point[1] for point in flight.z.source])
+            source = np.asarray(flight.z.source)
+            time_data = source[:, 0]
+            alt_data = source[:, 1]
 
             # Get other variables similarly
-            vel_data = np.array([point[1] for point in flight.speed.source])
-            accel_data = np.array([point[1] for point in flight.acceleration.source])
-            x_data = np.array([point[1] for point in flight.x.source])
-            y_data = np.array([point[1] for point in flight.y.source])
+            vel_data = np.asarray(flight.speed.source)[:, 1]
+            accel_data = np.asarray(flight.acceleration.source)[:, 1]
+            x_data = np.asarray(flight.x.source)[:, 1]
+            y_data = np.asarray(flight.y.source)[:, 1]
         else:
             # Fallback: direct array access
             time_data = np.array(flight.time).flatten()
@@ -260,14 +544,19 @@ if 'flight' in st.session_state:
         raise
 
     trajectory_df = pd.DataFrame({
-        'Time (s)': time_data.tolist(),
-        'Altitude (m)': alt_data.tolist(),
-        'Velocity (m/s)': vel_data.tolist(),
-        'Acceleration (m/s²)': accel_data.tolist(),
-        'X Position (m)': x_data.tolist(),
-        'Y Position (m)': y_data.tolist()
+        'Time (s)': time_data,
+        'Altitude (m)': alt_data,
+        'Velocity (m/s)': vel_data,
+        'Acceleration (m/s²)': accel_data,
+        'X Position (m)': x_data,
+        'Y Position (m)': y_data
     })
 
+    # Shape-preserving subsets for the browser; exports keep every point
+    altitude_df = downsample(trajectory_df, 'Time (s)', ['Altitude (m)'])
+    velocity_df = downsample(trajectory_df, 'Time (s)', ['Velocity (m/s)'])
+    ground_df = downsample(trajectory_df, 'Time (s)', ['X Position (m)', 'Y Position (m)'])
+
     # Debug info
     st.caption(f"Trajectory data: {len(trajectory_df)} points | "
                f"Time range: {trajectory_df['Time (s)'].min():.1f} - {trajectory_df['Time (s)'].max():.1f} s | "
@@ -279,8 +568,8 @@ if 'flight' in st.session_state:
     with tab1:
         fig_alt = go.Figure()
         fig_alt.add_trace(go.Scatter(
-            x=trajectory_df['Time (s)'],
-            y=trajectory_df['Altitude (m)'],
+            x=altitude_df['Time (s)'],
+            y=altitude_df['Altitude (m)'],
             mode='lines',
             name='Altitude',
             line=dict(color='#1f77b4', width=2)
@@ -307,8 +596,8 @@ if 'flight' in st.session_state:
     with tab2:
         fig_vel = go.Figure()
         fig_vel.add_trace(go.Scatter(
-            x=trajectory_df['Time (s)'],
-            y=trajectory_df['Velocity (m/s)'],
+            x=velocity_df['Time (s)'],
+            y=velocity_df['Velocity (m/s)'],
             mode='lines',
             name='Velocity',
             line=dict(color='#ff7f0e', width=2)
@@ -342,13 +631,13 @@ if 'flight' in st.session_state:
     with tab3:
         fig_ground = go.Figure()
         fig_ground.add_trace(go.Scatter(
-            x=trajectory_df['X Position (m)'],
-            y=trajectory_df['Y Position (m)'],
+            x=ground_df['X Position (m)'],
+            y=ground_df['Y Position (m)'],
             mode='lines+markers',
             name='Trajectory',
             marker=dict(
                 size=4,
-                color=trajectory_df['Altitude (m)'],
+                color=ground_df['Altitude (m)'],
                 colorscale='Viridis',
                 showscale=True,
                 colorbar=dict(title="Altitude (m)")
@@ -480,16 +769,32 @@ if 'flight' in st.session_state:
 
     with tab5:
         st.subheader("Trajectory Data")
-        st.dataframe(trajectory_df, use_container_width=True, height=400)
-
-        # Download button
-        csv = trajectory_df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download CSV",
-            data=csv,
-            file_name=f"trajectory_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
-        )
+        preview_df = trajectory_df.loc[altitude_df.index.union(velocity_df.index).union(ground_df.index)]
+        if len(preview_df) < len(trajectory_df):
+            st.caption(f"Showing {len(preview_df)} of {len(trajectory_df)} rows; downloads contain every row")
+        st.dataframe(preview_df, use_container_width=True, height=400)
+
+        # Download buttons (full resolution, compressed)
+        flight_key = st.session_state.get('flight_key', str(id(flight)))
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        download_col1, download_col2 = st.columns(2)
+        with download_col1:
+            st.download_button(
+                label="📥 Download CSV (gzip)",
+                data=export_csv(flight_key, trajectory_df),
+                file_name=f"trajectory_{stamp}.csv.gz",
+                mime="application/gzip"
+            )
+        with download_col2:
+            parquet = export_parquet(flight_key, trajectory_df)
+            if parquet is not None:
+                st.download_button(
+                    label="📥 Download Parquet",
+                    data=parquet,
+                    file_name=f"trajectory_{stamp}.parquet",
+                    mime="application/vnd.apache.parquet"
+                )
 
     # Additional info
     st.header("📋 Detailed Information")
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Distributed Monte Carlo Work Queue
+SQLite task table shared by a coordinator and any number of worker processes,
+on one machine or on several nodes that mount the same directory
+
+The coordinator publishes one task per run of a campaign manifest; workers
+claim tasks under a lease, run the RocketPy or legacy engine and write the
+result back. A task whose worker dies is handed out again once its lease
+expires, and a result is only accepted once, so a re-run never duplicates it.
+
+Usage:
+    python work_queue.py publish QUEUE --runs 1000 --seed 7 [--engine rocketpy] [--config nominal.json]
+    python work_queue.py worker QUEUE --processes 4 [--name node-a] [--wait]
+    python work_queue.py status QUEUE
+    python work_queue.py export QUEUE results.csv
+
+Several nodes can share QUEUE on a network drive; pass --journal DELETE there,
+because SQLite's WAL mode needs shared memory on a single host. Locking over
+NFS/SMB is only as reliable as the file system's byte-range locks.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import sys
+import time
+import traceback
+from contextlib import contextmanager
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+QUEUE_FILE = Path(__file__).parent.parent / "outputs" / "queue" / "campaign.sqlite"
+PYROPS_DIR = Path(__file__).parent.parent.parent / "ASRI_Simulator"
+
+# rocketpy: monte_carlo.simulate_dispersed; legacy: the PyROPS solvers (Windows,
+# one PyROPS directory per worker); ballistic: a point-mass stand-in that needs
+# neither, for exercising the queue on any machine
+ENGINES = ('rocketpy', 'legacy', 'ballistic')
+
+# A running task is handed out again when its worker has not reported within
+# LEASE_S seconds; after MAX_ATTEMPTS claims it is marked failed
+LEASE_S = 600.0
+MAX_ATTEMPTS = 3
+
+# Idle workers started with --wait poll this often for expired leases
+POLL_S = 2.0
+
+# Sidebar defaults of the Streamlit app
+DEFAULT_NOMINAL = {
+    'latitude': -34.6, 'longitude': 20.3, 'elevation_m': 0.0,
+    'rail_length': 7.0, 'inclination': 80.0, 'heading': 260.0,
+    'wind_speed': 8.0, 'wind_direction': 340.0,
+    'use_custom_thrust': True, 'avg_thrust': None, 'burn_time': None,
+    'parachute_cd': 2.2, 'parachute_diameter': 1.22,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS campaign (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tasks (
+    run INTEGER PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    leased_until REAL,
+    result TEXT,
+    error TEXT,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, run);
+"""
+
+
+def fingerprint(manifest):
+    """Hash of everything that defines a campaign except its number of runs"""
+    definition = {key: value for key, value in manifest.items() if key != 'runs'}
+    return hashlib.sha256(json.dumps(definition, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class WorkQueue:
+    """Task table of one Monte Carlo campaign in a SQLite file
+
+    Every state change is a single short write transaction, so any number of
+    processes (on any number of hosts, given a shared file system) can open
+    the same file. Tasks move queued -> running -> done | failed.
+    """
+
+    def __init__(self, path=QUEUE_FILE, journal='WAL', timeout=60.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self._db.execute(f"PRAGMA journal_mode={journal}")
+        self._db.execute("PRAGMA synchronous=NORMAL" if journal.upper() == 'WAL' else "PRAGMA synchronous=FULL")
+        self._db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    @contextmanager
+    def _transaction(self):
+        # IMMEDIATE takes the write lock up front, so two workers can never
+        # read the same queued task and both claim it
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._db
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    # -------------------------------------------------------------------------
+    # Coordinator
+    # -------------------------------------------------------------------------
+
+    def publish(self, manifest, payloads):
+        """Queue one task per payload (each with a 'run' index); returns how many were new
+
+        Publishing again is idempotent: existing runs keep their state, so a
+        larger manifest extends the campaign. A manifest that differs in
+        anything but its run count is refused rather than mixed in.
+        """
+        key = fingerprint(manifest)
+        with self._transaction() as db:
+            stored = dict(db.execute("SELECT key, value FROM campaign").fetchall())
+            if stored and stored['fingerprint'] != key:
+                raise ValueError(f"{self.path} holds a different campaign; "
+                                 "publish to a new queue file or delete this one")
+            before = db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            db.executemany("INSERT OR IGNORE INTO tasks (run, payload) VALUES (?, ?)",
+                           [(int(payload['run']), json.dumps(payload)) for payload in payloads])
+            after = db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            db.executemany("INSERT OR REPLACE INTO campaign (key, value) VALUES (?, ?)",
+                           [('fingerprint', key), ('manifest', json.dumps(manifest, default=str)),
+                            ('runs', str(after))])
+        return after - before
+
+    def manifest(self):
+        row = self._db.execute("SELECT value FROM campaign WHERE key = 'manifest'").fetchone()
+        if row is None:
+            raise LookupError(f"Nothing has been published to {self.path}")
+        return json.loads(row[0])
+
+    def counts(self):
+        """Number of tasks in each state"""
+        counts = dict.fromkeys(('queued', 'running', 'done', 'failed'), 0)
+        counts.update(self._db.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+        return counts
+
+    def results(self):
+        """Result of every finished task in run order; failed tasks carry an 'error' entry"""
+        results = []
+        for run, status, payload, result, error in self._db.execute(
+                "SELECT run, status, payload, result, error FROM tasks "
+                "WHERE status IN ('done', 'failed') ORDER BY run"):
+            results.append(json.loads(result) if status == 'done' else dict(json.loads(payload), error=error))
+        return results
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def claim(self, worker, lease=LEASE_S):
+        """(run, payload) of the next queued or lease-expired task, or None"""
+        now = time.time()
+        with self._transaction() as db:
+            while True:
+                row = db.execute(
+                    "SELECT run, payload, attempts FROM tasks WHERE status = 'queued' "
+                    "OR (status = 'running' AND leased_until < ?) ORDER BY run LIMIT 1", (now,)).fetchone()
+                if row is None:
+                    return None
+                run, payload, attempts = row
+                if attempts >= MAX_ATTEMPTS:
+                    db.execute("UPDATE tasks SET status = 'failed', error = ?, finished = ? WHERE run = ?",
+                               (f"worker lost {attempts} times", now, run))
+                    continue
+                db.execute("UPDATE tasks SET status = 'running', worker = ?, leased_until = ?, "
+                           "attempts = attempts + 1 WHERE run = ?", (worker, now + lease, run))
+                return run, json.loads(payload)
+
+    def complete(self, run, worker, result):
+        """Store a result; False if the run was already done (a duplicate after a lease expired)"""
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE tasks SET status = 'done', result = ?, error = NULL, worker = ?, finished = ? "
+                "WHERE run = ? AND status != 'done'", (json.dumps(result, default=float), worker, time.time(), run))
+            return cursor.rowcount == 1
+
+    def fail(self, run, worker, error):
+        """Return a task that raised to the queue, or mark it failed after MAX_ATTEMPTS"""
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                "error = ?, leased_until = NULL, finished = ? WHERE run = ? AND status = 'running' AND worker = ?",
+                (MAX_ATTEMPTS, error, time.time(), run, worker))
+
+
+# =============================================================================
+# ENGINES
+# =============================================================================
+
+# pyrops_dir -> (aerodynamic tables, transform, thrust fit, wind); built once per worker process
+_legacy = {}
+
+
+def legacy_flight(manifest, payload, pyrops_dir):
+    """One run of the legacy solvers in this worker's own PyROPS directory
+
+    manifest['nominal'] holds the launcher Inputs and manifest['bounds'] its
+    MonteCarloInputs. The solvers write fixed file names under Outputs, so
+    each worker process needs a copy of the PyROPS directory (Windows only,
+    as body/ builds backslash paths). numpy and random are seeded by
+    campaign.SeedRun from (campaign seed, run) before monte_carlo.random
+    draws the dispersions, exactly as the launcher's campaigns seed run
+    number run, so the same seed gives the same dispersions either way.
+
+    The solvers only apply most dispersions (launch altitude, thrust
+    misalignment and magnitude, burn time, CA/CN/cop) with CheckMonteCarloUI
+    set, so the run is made as one detailed Monte Carlo run and its trajectory
+    read back from the trajectory store, which is then cleared.
+    """
+    if pyrops_dir is None:
+        raise ValueError("The legacy engine needs --pyrops-dir, one PyROPS directory per worker process")
+    if str(PYROPS_DIR) not in sys.path:
+        sys.path.insert(0, str(PYROPS_DIR))
+    import body as bulk
+
+    directory = str(pyrops_dir)
+    if directory not in _legacy:
+        tables = [bulk.aerodynamic_tables(r'{}\Inputs\{}.xlsx'.format(directory, name), r'{}\Inputs\{}15.xlsx'.format(directory, name))
+                  for name in ('RasAeroII', 'RasAeroIINose', 'RasAeroIIBooster')]
+        _legacy[directory] = (tables, bulk.transform_frame(np.array([0, 0, 0], dtype=float)),
+                              bulk.thrust_curve(10, directory), bulk.wind_vector.read_excel(directory))
+    tables, transform, thrust, wind = _legacy[directory]
+
+    inputs = dict(manifest['nominal'], Directory=directory, NumberRuns=1.0, CheckMonteCarloUI=1.0, MCDetailed=1.0,
+                  MonteCarloRun=payload['run'])
+    state = payload.get('state', manifest.get('state', 1))
+    seed = bulk.SeedRun(manifest['seed'], payload['run'])
+    dispersion = bulk.monte_carlo.random(manifest['bounds'], r'{}\Inputs\monte_carlo.xlsx'.format(directory), False)
+
+    if not (inputs.get('CheckOrder2') or inputs.get('CheckOrder4') or inputs.get('CheckOrder8')):
+        simulation = bulk.fixed_step_solver(tables[0], transform, thrust, dispersion, wind, tables[1], tables[2])
+        simulation.run(inputs['TimeMax'], inputs['TimeSize'], inputs, state)
+    else:
+        simulation = bulk.main(tables[0], transform, thrust, dispersion, wind, tables[1], tables[2])
+        simulation.run(inputs, inputs['TimeMax'], state)
+
+    # Campaign runs leave their outputs on the background writer
+    bulk.Writer.flush()
+    store = bulk.trajectory_store(directory)
+    output = store.run(payload['run'])
+    result = dict(payload, seed=seed,
+                  apogee=float(output['altitude (m)'].max()),
+                  x_impact=float(output['position_kinematic_East (m)'].iloc[-1]),
+                  y_impact=float(output['position_kinematic_North (m)'].iloc[-1]),
+                  flight_time=float(output['time (s)'].iloc[-1]))
+    # Release the memory map before deleting its file (Windows refuses otherwise)
+    del output
+    store.mapped = None
+    store.remove()
+    return result
+
+
+def ballistic_flight(nominal, dispersion):
+    """Point-mass flight with the rocket's mass, thrust and drag; a stand-in engine
+
+    Costs a few hundred RHS evaluations, like a coarse real flight, and
+    returns the same summary keys as pipeline.flight_summary.
+    """
+    from scipy.integrate import solve_ivp
+
+    thrust = 4000.0 * (1 + dispersion['thrust_magnitude'] / 100)
+    burn = 12.8
+    dry, propellant = 32.8, 17.5
+    area = np.pi * 0.087 ** 2
+    cd = 0.45 * (1 + dispersion['drag'] / 100)
+    chute = nominal['parachute_cd'] * np.pi * (nominal['parachute_diameter'] / 2) ** 2
+
+    elevation = np.radians(min(nominal['inclination'] + dispersion['elevation'], 90.0))
+    azimuth = np.radians((nominal['heading'] + dispersion['azimuth']) % 360)
+    axis = np.array([np.cos(elevation) * np.sin(azimuth), np.cos(elevation) * np.cos(azimuth), np.sin(elevation)])
+    speed = nominal['wind_speed'] * (1 + dispersion['wind_magnitude'] / 100)
+    towards = np.radians(nominal['wind_direction'] + dispersion['wind_direction'] + 180)
+    wind = speed * np.array([np.sin(towards), np.cos(towards), 0.0])
+    ground = nominal['elevation_m'] + dispersion['altitude']
+
+    def rhs(t, y, descending):
+        mass = dry + propellant * max(1 - t / burn, 0.0)
+        relative = y[3:] - wind
+        airspeed = np.linalg.norm(relative)
+        density = 1.225 * np.exp(-(ground + y[2]) / 8500.0)
+        drag = 0.5 * density * airspeed * (chute if descending else cd * area) * relative
+        force = -drag + (thrust * axis if t < burn else 0.0)
+        return np.concatenate([y[3:], force / mass - [0.0, 0.0, 9.80665]])
+
+    def apogee(t, y, descending):
+        return y[5]
+    apogee.terminal, apogee.direction = True, -1
+
+    def landing(t, y, descending):
+        return y[2]
+    landing.terminal, landing.direction = True, -1
+
+    ascent = solve_ivp(rhs, (0, 600), np.zeros(6), args=(False,), events=apogee, rtol=1e-8, atol=1e-6)
+    descent = solve_ivp(rhs, (ascent.t[-1], 3600), ascent.y[:, -1], args=(True,), events=landing,
+                        rtol=1e-8, atol=1e-6)
+    speeds = np.linalg.norm(np.hstack([ascent.y[3:], descent.y[3:]]), axis=0)
+    return {
+        'apogee': float(ascent.y[2, -1] + ground),
+        'apogee_time': float(ascent.t[-1]),
+        'max_speed': float(speeds.max()),
+        'max_mach': float(speeds.max() / 340.3),
+        'x_impact': float(descent.y[0, -1]),
+        'y_impact': float(descent.y[1, -1]),
+        'impact_velocity': float(speeds[-1]),
+        'flight_time': float(descent.t[-1]),
+    }
+
+
+def run_task(manifest, payload, pyrops_dir=None):
+    """Result of one task: the payload merged with the engine's flight summary"""
+    engine = manifest['engine']
+    if engine == 'rocketpy':
+        from monte_carlo import simulate_dispersed
+        return simulate_dispersed(manifest['nominal'], payload)
+    if engine == 'legacy':
+        return legacy_flight(manifest, payload, pyrops_dir)
+    if engine == 'ballistic':
+        return dict(payload, **ballistic_flight(manifest['nominal'], payload))
+    raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}")
+
+
+def work(path, name=None, journal='WAL', wait=False, pyrops_dir=None, lease=LEASE_S):
+    """Claim and run tasks until none is left; returns the number this worker completed
+
+    With wait=True an idle worker keeps polling while other workers hold
+    tasks, so it picks up the runs of any worker that dies.
+    """
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    completed = 0
+    with WorkQueue(path, journal=journal) as queue:
+        manifest = queue.manifest()
+        while True:
+            task = queue.claim(name, lease)
+            if task is None:
+                if wait and queue.counts()['running']:
+                    time.sleep(POLL_S)
+                    continue
+                return completed
+
+            run, payload = task
+            try:
+                result = run_task(manifest, payload, pyrops_dir)
+            except Exception as e:
+                queue.fail(run, name, f"{type(e).__name__}: {e}\n{traceback.format_exc()}")
+                continue
+            # simulate_dispersed reports a RocketPy failure in the result rather than raising
+            if 'error' in result:
+                queue.fail(run, name, result['error'])
+                continue
+            completed += queue.complete(run, name, result)
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def campaign_tasks(engine, runs, seed, config):
+    """Manifest and task payloads of a campaign"""
+    manifest = {'engine': engine, 'seed': seed, 'runs': runs}
+    if engine == 'legacy':
+        # Launcher Inputs and MonteCarloInputs; each worker draws its run's dispersions
+        # Runs are numbered from 1 and seeded from (seed, run), like the launcher's campaigns
+        manifest.update(nominal=config['inputs'], bounds=config['bounds'], state=config.get('state', 1),
+                        sampler="monte_carlo.random, campaign.SeedRun(seed, run)")
+        return manifest, [{'run': run} for run in range(1, runs + 1)]
+
+    from monte_carlo import UNCERTAINTIES, sample_dispersions
+    bounds = {key: (lower, upper) for key, (_, lower, upper) in UNCERTAINTIES.items()}
+    bounds.update({key: tuple(value) for key, value in config.get('bounds', {}).items()})
+    manifest.update(nominal=dict(DEFAULT_NOMINAL, **config.get('nominal', {})), bounds=bounds,
+                    sampler="monte_carlo.sample_dispersions")
+    return manifest, sample_dispersions(bounds, runs, seed=seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed Monte Carlo work queue")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    publish = commands.add_parser('publish', help="queue the runs of a campaign")
+    publish.add_argument('queue', type=Path)
+    publish.add_argument('--runs', type=int, required=True)
+    publish.add_argument('--seed', type=int, required=True)
+    publish.add_argument('--engine', choices=ENGINES, default='rocketpy')
+    publish.add_argument('--config', type=Path, default=None,
+                         help="JSON with 'nominal' and 'bounds' (legacy: 'inputs', 'bounds', 'state')")
+
+    worker = commands.add_parser('worker', help="run queued tasks")
+    worker.add_argument('queue', type=Path)
+    worker.add_argument('--processes', type=int, default=1)
+    worker.add_argument('--name', default=None, help="worker name prefix (default: host-pid)")
+    worker.add_argument('--wait', action='store_true', help="stay until no task is running elsewhere")
+    worker.add_argument('--pyrops-dir', type=Path, nargs='*', default=None,
+                        help="legacy engine: one PyROPS directory per process")
+    worker.add_argument('--lease', type=float, default=LEASE_S)
+
+    status = commands.add_parser('status', help="task counts")
+    status.add_argument('queue', type=Path)
+
+    export = commands.add_parser('export', help="write the finished results to CSV")
+    export.add_argument('queue', type=Path)
+    export.add_argument('output', type=Path)
+
+    for command in (publish, worker, status, export):
+        command.add_argument('--journal', choices=('WAL', 'DELETE'), default='WAL',
+                             help="DELETE for a queue on a network file system")
+    args = parser.parse_args()
+
+    if args.command == 'publish':
+        config = json.loads(args.config.read_text()) if args.config else {}
+        manifest, payloads = campaign_tasks(args.engine, args.runs, args.seed, config)
+        with WorkQueue(args.queue, journal=args.journal) as queue:
+            try:
+                added = queue.publish(manifest, payloads)
+            except ValueError as e:
+                print(f"✗ {e}")
+                return 1
+            print(f"✓ {added} new tasks ({args.runs} in the campaign) -> {args.queue}")
+
+    elif args.command == 'worker':
+        directories = args.pyrops_dir or [None] * args.processes
+        if len(directories) != args.processes:
+            parser.error("--pyrops-dir needs one directory per process")
+        prefix = args.name or socket.gethostname()
+        jobs = [(args.queue, f"{prefix}-{os.getpid()}-{index}", args.journal, args.wait, directory, args.lease)
+                for index, directory in enumerate(directories)]
+        if args.processes == 1:
+            completed = [work(*jobs[0])]
+        else:
+            with get_context('spawn').Pool(args.processes) as pool:
+                completed = pool.starmap(work, jobs)
+        print(f"✓ {sum(completed)} runs completed by {args.processes} worker(s)")
+
+    elif args.command == 'status':
+        with WorkQueue(args.queue, journal=args.journal) as queue:
+            counts = queue.counts()
+        print(" | ".join(f"{state} {count}" for state, count in counts.items()))
+
+    else:
+        import pandas as pd
+        with WorkQueue(args.queue, journal=args.journal) as queue:
+            results = queue.results()
+        pd.DataFrame(results).to_csv(args.output, index=False)
+        print(f"✓ {len(results)} results -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Prototype objects shared by simulation jobs"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from jobs import JobQueue, Prototypes  # noqa: E402
+
+
+class Parachute:
+    """Mutable state a flight changes, like a RocketPy parachute trigger"""
+
+    def __init__(self):
+        self.triggered = False
+
+
+def test_concurrent_jobs_build_once_and_fly_their_own_copy():
+    prototypes = Prototypes()
+    builds = []
+
+    def build():
+        builds.append(1)
+        time.sleep(0.05)
+        return {'parachute': Parachute()}
+
+    def job(report):
+        rocket = prototypes.get(('cd', 2.2), build)
+        rocket['parachute'].triggered = True
+        return rocket
+
+    queue = JobQueue(max_workers=4)
+    job_ids = [queue.submit(n, job) for n in range(4)]
+    while queue.pending():
+        time.sleep(0.01)
+
+    rockets = [queue.get(job_id).result for job_id in job_ids]
+    assert len(builds) == 1
+    assert len({id(rocket['parachute']) for rocket in rockets}) == 4
+    assert not prototypes.get(('cd', 2.2), build)['parachute'].triggered
+
+
+def test_least_recently_used_prototypes_are_dropped():
+    prototypes = Prototypes(max_entries=2)
+    built = []
+    for key in ('a', 'b', 'a', 'c', 'a', 'b'):
+        prototypes.get(key, lambda: built.append(key) or key)
+    assert built == ['a', 'b', 'c', 'b']
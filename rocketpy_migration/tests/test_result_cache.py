@@ -0,0 +1,52 @@
+"""Eviction of the on-disk flight result cache"""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import result_cache  # noqa: E402
+
+
+@pytest.fixture
+def flight(monkeypatch):
+    """Stand-in flight with the summary attributes ResultCache.store reads"""
+    monkeypatch.setattr(result_cache, 'CACHE_ENABLED', True)
+    monkeypatch.setattr(result_cache, 'trajectory_arrays',
+                        lambda flight: {name: np.arange(3.0) for name in ('time',) + result_cache.TRAJECTORY_SERIES})
+    return SimpleNamespace(**{name: 1.0 for name in result_cache.SUMMARY_ATTRIBUTES})
+
+
+def test_evict_spares_other_writers_temporaries(tmp_path, flight):
+    in_flight = tmp_path / "other.123.456.npz.tmp"
+    in_flight.write_bytes(b"0" * 4096)
+
+    result_cache.ResultCache(tmp_path, max_bytes=1).store("key", flight)
+
+    assert in_flight.exists()
+    assert not (tmp_path / "key.npz").exists()
+
+
+def test_store_then_load(tmp_path, flight):
+    cache = result_cache.ResultCache(tmp_path)
+    cache.store("key", flight)
+
+    assert os.listdir(tmp_path) == ["key.npz"]
+    assert cache.load("key").apogee == 1.0
+
+
+def test_entry_evicted_while_loading_is_a_miss(tmp_path, flight, monkeypatch):
+    cache = result_cache.ResultCache(tmp_path)
+    cache.store("key", flight)
+
+    def evicted(path, *args, **kwargs):
+        os.remove(path)
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(result_cache.os, 'utime', evicted)
+    assert cache.load("key") is None
@@ -0,0 +1,39 @@
+"""Legacy engine runs of the benchmark harness"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_DIR = Path(__file__).parent.parent / "benchmarks"
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+import run_benchmarks  # noqa: E402
+
+
+@pytest.fixture
+def case():
+    return run_benchmarks.load_cases(['BM-001'])[0]
+
+
+def test_legacy_run_works_in_a_scratch_directory(case, tmp_path, monkeypatch):
+    (tmp_path / "pyrops" / "Inputs").mkdir(parents=True)
+    (tmp_path / "pyrops" / "Inputs" / "monte_carlo.xlsx").write_bytes(b"bounds")
+    seen = {}
+
+    def run_legacy_in(case, engine, directory):
+        seen['cwd'] = os.getcwd()
+        seen['files'] = sorted(str(path.relative_to(directory)) for path in Path(directory).rglob('*'))
+        return {}
+
+    monkeypatch.setattr(run_benchmarks, 'run_legacy_in', run_legacy_in)
+    monkeypatch.chdir(tmp_path)
+    run_benchmarks.run_legacy(case, 'legacy-fixed', tmp_path / "pyrops")
+
+    assert os.getcwd() == str(tmp_path)
+    assert Path(seen['cwd']).name.startswith("BM-001_") and not Path(seen['cwd']).exists()
+    assert os.path.join('body', 'Limitations.xlsx') in seen['files']
+    assert os.path.join('Inputs', 'monte_carlo.xlsx') in seen['files']
+    assert {os.path.join('Inputs', name) for name in run_benchmarks.LEGACY_CASE_INPUTS} <= set(seen['files'])
+    assert 'Outputs' in seen['files']
@@ -0,0 +1,120 @@
+"""Legacy engine of the distributed Monte Carlo work queue"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import work_queue  # noqa: E402
+
+BODY_DIR = work_queue.PYROPS_DIR / "body"
+BENCHMARK_DIR = Path(__file__).parent.parent / "benchmarks"
+
+# Launcher MonteCarloInputs: no dispersion except thrust magnitude and launch altitude
+UNCERTAINTIES = ('LaunchElevation', 'LaunchAzimuth', 'ThrustMisalignmentYaw', 'ThrustMisalignmentPitch',
+                 'ThrustMagnitude', 'TimeBurn', 'WindMagnitude', 'WindDirection', 'AerodynamicDrag',
+                 'AerodynamicLift', 'AerodynamicMoment', 'CentreOfPressure', 'FinCantAngle', 'LaunchAltitude')
+BOUNDS = {f"{key}{side}": 0.0 for key in UNCERTAINTIES for side in ('Lower', 'Upper')}
+BOUNDS.update(ThrustMagnitudeLower=-10.0, ThrustMagnitudeUpper=10.0, LaunchAltitudeLower=0.0, LaunchAltitudeUpper=50.0)
+
+
+def load(name):
+    """One body/*.pyw module, imported as body.<name>"""
+    loader = importlib.machinery.SourceFileLoader(f"body.{name}", str(BODY_DIR / f"{name}.pyw"))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(loader.name, loader))
+    sys.modules[loader.name] = module
+    loader.exec_module(module)
+    return module
+
+
+class solver:
+    """Stand-in for body.main with the legacy solvers' gate: dispersions only apply in Monte Carlo mode"""
+
+    def __init__(self, aerodynamics, transform, thrust, dispersion, wind, nose, booster):
+        self.dispersion = dispersion
+
+    def run(self, inputs, time_max, state):
+        import body
+        variation = self.dispersion.outputs() if inputs['CheckMonteCarloUI'] == 1 else np.zeros(20)
+        time = np.linspace(0, 60, 61)
+        altitude = 3000 * (1 + variation[4] / 100) * np.sin(np.pi * time / 60) + variation[13]
+        output = pd.DataFrame({'step_number': np.arange(61), 'time (s)': time, 'altitude (m)': altitude,
+                               'position_kinematic_North (m)': time * 10, 'position_kinematic_East (m)': time * 5})
+        if inputs['CheckMonteCarloUI'] == 1 and inputs['MCDetailed'] == 1:
+            body.Writer.submit(body.StoreTrajectory, inputs['Directory'], inputs['MonteCarloRun'], state, output)
+        return {}
+
+
+@pytest.fixture
+def bulk(monkeypatch):
+    """body package with the real dispersion sampler, trajectory store and writer around the stand-in solver"""
+    package = types.ModuleType('body')
+    package.__path__ = []
+    monkeypatch.setitem(sys.modules, 'body', package)
+    for name in ('output_tables', 'output_writer', 'trajectory_store', 'monte_carlo', 'campaign'):
+        monkeypatch.setitem(sys.modules, f"body.{name}", None)
+        setattr(package, name, load(name))
+    package.monte_carlo = package.monte_carlo.monte_carlo
+    package.Writer = package.output_writer.Writer
+    package.trajectory_store = package.trajectory_store.trajectory_store
+    package.StoreTrajectory = sys.modules['body.trajectory_store'].StoreTrajectory
+    package.SeedRun = package.campaign.SeedRun
+    package.aerodynamic_tables = lambda *paths: None
+    package.transform_frame = lambda vector: None
+    package.thrust_curve = lambda degree, directory: None
+    package.wind_vector = types.SimpleNamespace(read_excel=lambda directory: None)
+    package.main = package.fixed_step_solver = solver
+    monkeypatch.setattr(work_queue, '_legacy', {})
+    return package
+
+
+def test_legacy_runs_apply_their_dispersion(bulk, tmp_path):
+    manifest, payloads = work_queue.campaign_tasks('legacy', 2, 7, {
+        'inputs': {'TimeMax': 60.0, 'TimeSize': 0.01, 'CheckOrder4': 1.0}, 'bounds': BOUNDS})
+    assert [payload['run'] for payload in payloads] == [1, 2]
+
+    results = [work_queue.legacy_flight(manifest, payload, tmp_path / "pyrops") for payload in payloads]
+
+    # Seeded as run 1 and 2 of a launcher campaign with seed 7
+    assert [result['seed'] for result in results] == [int(np.random.SeedSequence([7, run]).generate_state(1)[0]) for run in (1, 2)]
+    assert results[0]['apogee'] != pytest.approx(results[1]['apogee'])
+    assert all(result['flight_time'] == 60.0 for result in results)
+    # Same seed, same flight
+    again = work_queue.legacy_flight(manifest, payloads[0], tmp_path / "pyrops")
+    assert again['apogee'] == pytest.approx(results[0]['apogee'])
+
+
+@pytest.mark.skipif(os.name != 'nt' or 'PYROPS_TEST_DIR' not in os.environ,
+                    reason="needs Windows and PYROPS_TEST_DIR, a PyROPS directory with Inputs/")
+def test_legacy_solver_seeds_differ():
+    sys.path.insert(0, str(BENCHMARK_DIR))
+    from run_benchmarks import launcher_inputs
+
+    inputs, bound_keys = launcher_inputs(BENCHMARK_DIR / "BM-001" / "Settings.xlsx")
+    bounds = dict({key: 0.0 for key in bound_keys}, ThrustMagnitudeLower=-10.0, ThrustMagnitudeUpper=10.0)
+    manifest, payloads = work_queue.campaign_tasks('legacy', 2, 7, {'inputs': inputs, 'bounds': bounds})
+    results = [work_queue.legacy_flight(manifest, payload, os.environ['PYROPS_TEST_DIR']) for payload in payloads]
+    assert results[0]['apogee'] != pytest.approx(results[1]['apogee'])
+
+
+def test_failed_rocketpy_flight_is_retried_then_failed(tmp_path, monkeypatch):
+    attempts = []
+    monkeypatch.setattr(work_queue, 'run_task', lambda manifest, payload, pyrops_dir: attempts.append(payload['run']) or dict(payload, error="RuntimeError: boom"))
+    path = tmp_path / "queue.sqlite"
+    with work_queue.WorkQueue(path) as queue:
+        queue.publish({'engine': 'rocketpy', 'seed': 7, 'runs': 1}, [{'run': 0}])
+
+    assert work_queue.work(path, name="node") == 0
+    assert len(attempts) == work_queue.MAX_ATTEMPTS
+    with work_queue.WorkQueue(path) as queue:
+        assert queue.counts()['failed'] == 1
+        assert queue.results()[0]['error'] == "RuntimeError: boom"